@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI chat completions API used by the benchmarks.
+
+Replies are synthetic but shaped like the real thing for each prompt the
+content generator sends (body HTML, title, excerpt, SEO JSON, single-call
+blog JSON). Latency is modelled as a fixed time to first token plus a
+per-token generation time, which is what dominates real GPT-4o calls.
+
+The Files and Batches endpoints are emulated too: a batch completes
+``batch_latency`` seconds after it is created, with one output line per
+request (no per-token latency).
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+def _body_html(words: int) -> str:
+    """Build an HTML blog body of roughly ``words`` words."""
+    sections = []
+    per_section = max(1, words // 5)
+    for n in range(1, 6):
+        text = " ".join(f"ord{i}" for i in range(per_section))
+        sections.append(f"<h2>Afsnit {n}</h2>\n<p>{text}</p>")
+    return "\n".join(sections)
+
+
+class FakeOpenAI:
+    """Fake OpenAI server on a background thread."""
+    
+    def __init__(
+        self,
+        first_token_latency: float = 0.3,
+        token_latency: float = 0.01,
+        body_tokens: int = 1000,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        batch_latency: float = 0.2
+    ):
+        self.first_token_latency = first_token_latency
+        self.token_latency = token_latency
+        self.body_tokens = body_tokens
+        self.batch_latency = batch_latency
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        # custom_ids whose batch line should come back as an error
+        self.fail_custom_ids: set = set()
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as OPENAI_BASE_URL."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+    
+    def start(self) -> "FakeOpenAI":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def __enter__(self) -> "FakeOpenAI":
+        return self.start()
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+    
+    # Replies
+    
+    def reply_for(self, request: Dict[str, Any]) -> str:
+        """Produce a plausible reply for a chat completion request."""
+        messages: List[Dict[str, str]] = request.get("messages", [])
+        system = messages[0]["content"] if messages else ""
+        prompt = messages[-1]["content"] if messages else ""
+        wants_json = (request.get("response_format") or {}).get("type") == "json_object"
+        
+        if wants_json and '"excerpt"' in prompt:
+            return json.dumps({
+                "title": "Sådan bruger du AI i marketing",
+                "content": _body_html(self.body_tokens),
+                "excerpt": "Lær hvordan AI kan løfte din marketing med konkrete eksempler.",
+            })
+        if wants_json:
+            return json.dumps({
+                "title": "Optimeret titel",
+                "meta_description": "En kort meta description til søgemaskiner.",
+                "content_suggestions": ["Tilføj flere underoverskrifter", "Brug primært keyword tidligt"],
+            })
+        if "titler" in system:
+            return "Sådan bruger du AI i marketing"
+        if "korte" in system:
+            return "Lær hvordan AI kan løfte din marketing med konkrete eksempler."
+        if "editor" in system:
+            # Improvement: echo the submitted HTML back
+            start = prompt.find("\n\n") + 2
+            end = prompt.find("\n\nForbedringer der skal laves")
+            return prompt[start:end] if end > start else _body_html(self.body_tokens)
+        return _body_html(self.body_tokens)
+    
+    @staticmethod
+    def count_tokens(text: str) -> int:
+        """Rough token count (words plus markup)."""
+        return max(1, len(text) // 4)
+    
+    def usage(self, request: Dict[str, Any], content: str) -> Dict[str, int]:
+        prompt_tokens = sum(self.count_tokens(m.get("content", "")) for m in request.get("messages", []))
+        tokens = self.count_tokens(content)
+        return {"prompt_tokens": prompt_tokens, "completion_tokens": tokens, "total_tokens": prompt_tokens + tokens}
+    
+    def completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        content = self.reply_for(request)
+        tokens = self.count_tokens(content)
+        time.sleep(self.first_token_latency + tokens * self.token_latency)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "gpt-4o"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": self.usage(request, content),
+        }
+    
+    def stream_chunks(self, request: Dict[str, Any]):
+        """Yield streamed completion chunks, pacing tokens like the real API."""
+        content = self.reply_for(request)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        base = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": request.get("model", "gpt-4o"),
+        }
+        time.sleep(self.first_token_latency)
+        yield {**base, "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}]}
+        for start in range(0, len(content), 4):
+            time.sleep(self.token_latency)
+            piece = content[start:start + 4]
+            yield {**base, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+        yield {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        if (request.get("stream_options") or {}).get("include_usage"):
+            yield {**base, "choices": [], "usage": self.usage(request, content)}
+    
+    # Files and batches
+    
+    def create_file(self, filename: str, purpose: str, content: bytes) -> Dict[str, Any]:
+        file = {
+            "id": f"file-{uuid.uuid4().hex[:24]}",
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+        with self.lock:
+            self.files[file["id"]] = {**file, "content": content}
+        return file
+    
+    def create_batch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        batch = {
+            "id": f"batch_{uuid.uuid4().hex[:24]}",
+            "object": "batch",
+            "endpoint": request["endpoint"],
+            "input_file_id": request["input_file_id"],
+            "completion_window": request["completion_window"],
+            "status": "validating",
+            "created_at": int(time.time()),
+            "output_file_id": None,
+            "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        }
+        with self.lock:
+            self.batches[batch["id"]] = batch
+        timer = threading.Timer(self.batch_latency, self._complete_batch, args=(batch["id"],))
+        timer.daemon = True
+        timer.start()
+        return batch
+    
+    def _complete_batch(self, batch_id: str) -> None:
+        with self.lock:
+            batch = self.batches[batch_id]
+            if batch["status"] != "validating":
+                return
+            lines = self.files[batch["input_file_id"]]["content"].decode().splitlines()
+        outputs, errors = [], []
+        for line in filter(None, lines):
+            request = json.loads(line)
+            if request["custom_id"] in self.fail_custom_ids:
+                errors.append({
+                    "id": f"batch_req_{uuid.uuid4().hex[:24]}",
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 400, "body": {"error": {"message": "Invalid request"}}},
+                    "error": None,
+                })
+                continue
+            content = self.reply_for(request["body"])
+            outputs.append({
+                "id": f"batch_req_{uuid.uuid4().hex[:24]}",
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "id": f"chatcmpl-{uuid.uuid4().hex}",
+                        "object": "chat.completion",
+                        "model": request["body"].get("model", "gpt-4o"),
+                        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                    },
+                },
+                "error": None,
+            })
+        as_jsonl = lambda rows: "".join(json.dumps(row) + "\n" for row in rows).encode()
+        output_file = self.create_file("batch_output.jsonl", "batch_output", as_jsonl(outputs)) if outputs else None
+        error_file = self.create_file("batch_errors.jsonl", "batch_output", as_jsonl(errors)) if errors else None
+        with self.lock:
+            batch.update(
+                status="completed",
+                completed_at=int(time.time()),
+                output_file_id=output_file and output_file["id"],
+                error_file_id=error_file and error_file["id"],
+                request_counts={"total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors)},
+            )
+    
+    def cancel_batch(self, batch_id: str) -> Dict[str, Any]:
+        with self.lock:
+            batch = self.batches[batch_id]
+            if batch["status"] == "validating":
+                batch["status"] = "cancelled"
+            return batch
+    
+    # Request handling
+    
+    def _handler_class(self):
+        api = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+            
+            def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def _send_stream(self, chunks) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for chunk in chunks:
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.close_connection = True
+            
+            def _form(self, body: bytes) -> Dict[str, Any]:
+                """Parse a multipart/form-data body into {name: (filename, bytes)}."""
+                header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+                message = BytesParser(policy=HTTP).parsebytes(header + body)
+                return {
+                    part.get_param("name", header="content-disposition"): (part.get_filename(), part.get_payload(decode=True))
+                    for part in message.iter_parts()
+                }
+            
+            def do_GET(self) -> None:
+                path = self.path.split("?")[0].rstrip("/")
+                match = re.search(r"/files/([\w-]+)/content$", path)
+                if match and match.group(1) in api.files:
+                    data = api.files[match.group(1)]["content"]
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/octet-stream")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                match = re.search(r"/batches/([\w-]+)$", path)
+                if match and match.group(1) in api.batches:
+                    with api.lock:
+                        self._send_json(200, dict(api.batches[match.group(1)]))
+                    return
+                match = re.search(r"/models/([\w.-]+)$", path)
+                if match:
+                    self._send_json(200, {"id": match.group(1), "object": "model", "owned_by": "openai"})
+                    return
+                self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                with api.lock:
+                    api.request_count += 1
+                path = self.path.split("?")[0].rstrip("/")
+                if path.endswith("/files"):
+                    form = self._form(body)
+                    filename, content = form["file"]
+                    self._send_json(200, api.create_file(filename, form["purpose"][1].decode(), content))
+                    return
+                match = re.search(r"/batches/([\w-]+)/cancel$", path)
+                if match:
+                    self._send_json(200, api.cancel_batch(match.group(1)))
+                    return
+                request = json.loads(body or b"{}")
+                if path.endswith("/batches"):
+                    self._send_json(200, api.create_batch(request))
+                elif self.path.rstrip("/").endswith("/chat/completions") and request.get("stream"):
+                    self._send_stream(api.stream_chunks(request))
+                elif self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(200, api.completion(request))
+                else:
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+        
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run a fake OpenAI API")
+    parser.add_argument("--first-token-latency", type=float, default=0.3)
+    parser.add_argument("--token-latency", type=float, default=0.01)
+    parser.add_argument("--port", type=int, default=8082)
+    args = parser.parse_args()
+    
+    api = FakeOpenAI(
+        first_token_latency=args.first_token_latency,
+        token_latency=args.token_latency,
+        port=args.port
+    )
+    print(f"Fake OpenAI listening on {api.base_url}")
+    api.server.serve_forever()
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the WordPress REST API used by the benchmarks.
+
+Serves an in-memory corpus of posts, categories and tags under /wp-json/wp/v2
+with a configurable per-request latency, so the MCP server can be exercised
+without touching a real site. Collections are paginated like WordPress:
+X-WP-Total/X-WP-TotalPages headers and a 400 for per_page above 100.
+"""
+
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/wp-json/wp/v2"
+BATCH_PATH = "/wp-json/batch/v1"
+
+
+def make_post(post_id: int) -> Dict[str, Any]:
+    """Build a synthetic post in the WordPress REST API shape."""
+    date = datetime(2024, 1, 1) + timedelta(hours=post_id)
+    raw = "".join(
+        f"<!-- wp:heading -->\n<h2>Afsnit {n}</h2>\n<!-- /wp:heading -->\n\n"
+        f"<!-- wp:paragraph -->\n<p>Indhold {n} for indlæg {post_id} om marketing og SEO.</p>\n<!-- /wp:paragraph -->\n\n"
+        for n in range(1, 6)
+    )
+    return {
+        "id": post_id,
+        "date": date.isoformat(),
+        "date_gmt": date.isoformat(),
+        "modified": date.isoformat(),
+        "modified_gmt": date.isoformat(),
+        "slug": f"post-{post_id}",
+        "status": "publish",
+        "type": "post",
+        "link": f"https://example.test/post-{post_id}/",
+        "title": {"rendered": f"Indlæg {post_id}"},
+        "content": {"raw": raw, "rendered": render_blocks(raw), "protected": False},
+        "excerpt": {"rendered": f"<p>Uddrag for indlæg {post_id}</p>", "protected": False},
+        "author": 1,
+        "featured_media": 0,
+        "categories": [1 + post_id % 5],
+        "tags": [1 + post_id % 10],
+        "acf": {},
+        "_links": {"self": [{"href": f"https://example.test/wp-json/wp/v2/posts/{post_id}"}]},
+    }
+
+
+def render_blocks(raw: str) -> str:
+    """Drop Gutenberg block comments, as WordPress does when rendering content."""
+    return re.sub(r"<!-- /?wp:.*?-->\n?", "", raw, flags=re.S)
+
+
+def make_term(term_id: int, kind: str) -> Dict[str, Any]:
+    """Build a synthetic category or tag."""
+    return {
+        "id": term_id,
+        "name": f"{kind.title()} {term_id}",
+        "slug": f"{kind}-{term_id}",
+        "count": 10,
+        "taxonomy": "category" if kind == "category" else "post_tag",
+    }
+
+
+def project_fields(payload: Any, fields: List[str]) -> Any:
+    """Apply the REST API's ``_fields`` filter (top-level keys only)."""
+    if isinstance(payload, list):
+        return [project_fields(item, fields) for item in payload]
+    return {key: value for key, value in payload.items() if key in fields}
+
+
+def apply_context(payload: Any, context: str) -> Any:
+    """Show ``raw`` text fields only with ``context=edit``; raw defaults to the rendered value.
+    
+    Posts keep the raw content they were created or updated with, so with
+    block comments it differs from the rendered content, as on a real site.
+    """
+    if isinstance(payload, list):
+        return [apply_context(item, context) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+    shaped = dict(payload)
+    for key in ("title", "content", "excerpt"):
+        if isinstance(shaped.get(key), dict):
+            value = dict(shaped[key])
+            if context == "edit":
+                value.setdefault("raw", value.get("rendered", ""))
+            else:
+                value.pop("raw", None)
+            shaped[key] = value
+    return shaped
+
+
+def embed_links(payload: Any) -> Any:
+    """Attach a minimal ``_embedded`` author, as ``_embed`` would."""
+    if isinstance(payload, list):
+        return [embed_links(item) for item in payload]
+    return {**payload, "_embedded": {"author": [{"id": payload.get("author", 1), "name": "Admin"}]}}
+
+
+class FakeWordPress:
+    """In-memory WordPress site served over HTTP on a background thread."""
+    
+    def __init__(
+        self,
+        posts: int = 100,
+        categories: int = 5,
+        tags: int = 10,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        batch_enabled: bool = True,
+        max_per_page: int = 100
+    ):
+        self.latency = latency
+        self.max_per_page = max_per_page
+        self.batch_enabled = batch_enabled
+        self.lock = threading.Lock()
+        self.posts: Dict[int, Dict[str, Any]] = {i: make_post(i) for i in range(1, posts + 1)}
+        self.terms: Dict[str, Dict[int, Dict[str, Any]]] = {
+            "categories": {i: make_term(i, "category") for i in range(1, categories + 1)},
+            "tags": {i: make_term(i, "tag") for i in range(1, tags + 1)},
+        }
+        self.request_count = 0
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Site URL to use as WORDPRESS_URL."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "FakeWordPress":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def __enter__(self) -> "FakeWordPress":
+        return self.start()
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+    
+    # Request handling
+    
+    def _handler_class(self):
+        site = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+            
+            def _body(self) -> Dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}") if length else {}
+            
+            def _dispatch(self, method: str) -> None:
+                with site.lock:
+                    site.request_count += 1
+                if site.latency:
+                    time.sleep(site.latency)
+                parsed = urlparse(self.path)
+                params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+                body = self._body() if method in ("POST", "PUT") else {}
+                status, payload, headers = site.handle(method, parsed.path, params, body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                if method != "HEAD":
+                    self.wfile.write(data)
+            
+            def do_HEAD(self) -> None:
+                self._dispatch("HEAD")
+            
+            def do_GET(self) -> None:
+                self._dispatch("GET")
+            
+            def do_POST(self) -> None:
+                self._dispatch("POST")
+            
+            def do_PUT(self) -> None:
+                self._dispatch("PUT")
+            
+            def do_DELETE(self) -> None:
+                self._dispatch("DELETE")
+        
+        return Handler
+    
+    def handle(self, method: str, path: str, params: Dict[str, str], body: Dict[str, Any]):
+        """Route a request; returns (status, payload, headers)."""
+        status, payload, headers = self._route(method, path, params, body)
+        if status < 400 and path.startswith(f"{API_PREFIX}/posts"):
+            payload = apply_context(payload, params.get("context", "view"))
+        if "_embed" in params and status < 400 and path.startswith(f"{API_PREFIX}/posts"):
+            payload = embed_links(payload)
+        if params.get("_fields") and status < 400:
+            payload = project_fields(payload, params["_fields"].split(","))
+        return status, payload, headers
+    
+    def _route(self, method: str, path: str, params: Dict[str, str], body: Dict[str, Any]):
+        if path.rstrip("/") == BATCH_PATH and method == "POST" and self.batch_enabled:
+            return self._batch(body)
+        if not path.startswith(API_PREFIX):
+            return 404, {"code": "rest_no_route", "message": "No route"}, {}
+        route = path[len(API_PREFIX):].rstrip("/")
+        
+        match = re.fullmatch(r"/posts/(\d+)", route)
+        if match:
+            return self._single_post(method, int(match.group(1)), params, body)
+        if route == "/posts":
+            if method == "POST":
+                return self._create_post(body)
+            return self._collection(list(self.posts.values()), params, filter_posts=True)
+        match = re.fullmatch(r"/(categories|tags)", route)
+        if match:
+            if method == "POST":
+                return self._create_term(match.group(1), body)
+            return self._collection(list(self.terms[match.group(1)].values()), params)
+        return 404, {"code": "rest_no_route", "message": "No route"}, {}
+    
+    def _collection(self, items: List[Dict[str, Any]], params: Dict[str, str], filter_posts: bool = False):
+        if filter_posts:
+            search = params.get("search", "").lower()
+            if search:
+                items = [
+                    p for p in items
+                    if search in p["title"]["rendered"].lower() or search in p["content"]["rendered"].lower()
+                ]
+            status = params.get("status", "publish")
+            if status == "any":
+                items = [p for p in items if p["status"] != "trash"]
+            else:
+                allowed = set(status.split(","))
+                items = [p for p in items if p["status"] in allowed]
+            if params.get("categories"):
+                wanted = {int(c) for c in params["categories"].split(",")}
+                items = [p for p in items if wanted & set(p["categories"])]
+            if params.get("modified_after"):
+                items = [p for p in items if p["modified"] > params["modified_after"]]
+            if params.get("after"):
+                items = [p for p in items if p["date"] > params["after"]]
+            if params.get("before"):
+                items = [p for p in items if p["date"] < params["before"]]
+            orderby = params.get("orderby", "date")
+            items = sorted(
+                items,
+                key=lambda p: (p[orderby], p["id"]),
+                reverse=params.get("order", "desc") == "desc"
+            )
+        
+        per_page = int(params.get("per_page", 10))
+        page = int(params.get("page", 1))
+        if not 1 <= per_page <= self.max_per_page:
+            return 400, {"code": "rest_invalid_param", "message": "Invalid parameter(s): per_page"}, {}
+        total = len(items)
+        total_pages = max(1, -(-total // per_page))
+        if page > total_pages and total:
+            return 400, {"code": "rest_post_invalid_page_number", "message": "Invalid page"}, {}
+        window = items[(page - 1) * per_page: page * per_page]
+        headers = {"X-WP-Total": str(total), "X-WP-TotalPages": str(total_pages)}
+        return 200, window, headers
+    
+    def _single_post(self, method: str, post_id: int, params: Dict[str, str], body: Dict[str, Any]):
+        with self.lock:
+            post = self.posts.get(post_id)
+            if post is None:
+                return 404, {"code": "rest_post_invalid_id", "message": "Invalid post ID."}, {}
+            if method == "GET":
+                return 200, post, {}
+            if method in ("POST", "PUT"):
+                self._apply(post, body)
+                return 200, post, {}
+            if method == "DELETE":
+                if params.get("force") in ("true", "True", "1"):
+                    del self.posts[post_id]
+                    return 200, {"deleted": True, "previous": post}, {}
+                post["status"] = "trash"
+                return 200, post, {}
+        return 405, {"code": "rest_no_route", "message": "Method not allowed"}, {}
+    
+    def _create_term(self, taxonomy: str, body: Dict[str, Any]):
+        with self.lock:
+            terms = self.terms[taxonomy]
+            name = body.get("name", "")
+            for term in terms.values():
+                if term["name"].lower() == name.lower():
+                    return 400, {
+                        "code": "term_exists",
+                        "message": "A term with the name provided already exists.",
+                        "data": {"status": 400, "term_id": term["id"]},
+                    }, {}
+            term_id = max(terms, default=0) + 1
+            term = make_term(term_id, "category" if taxonomy == "categories" else "tag")
+            term.update(name=name, slug=body.get("slug") or re.sub(r"\W+", "-", name.lower()).strip("-"), count=0)
+            terms[term_id] = term
+        return 201, term, {}
+    
+    def _batch(self, body: Dict[str, Any]):
+        requests = body.get("requests", [])
+        if len(requests) > 25:
+            return 400, {"code": "rest_batch_max_requests_exceeded", "message": "Too many requests"}, {}
+        responses = []
+        for request in requests:
+            parsed = urlparse(request["path"])
+            params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+            status, payload, headers = self.handle(
+                request.get("method", "POST").upper(),
+                f"/wp-json{parsed.path}",
+                params,
+                request.get("body") or {}
+            )
+            responses.append({"status": status, "body": payload, "headers": headers})
+        return 207, {"responses": responses}, {}
+    
+    def _create_post(self, body: Dict[str, Any]):
+        with self.lock:
+            post_id = max(self.posts, default=0) + 1
+            post = make_post(post_id)
+            self._apply(post, body)
+            self.posts[post_id] = post
+        return 201, post, {}
+    
+    def _apply(self, post: Dict[str, Any], body: Dict[str, Any]) -> None:
+        for key, value in body.items():
+            if key == "content":
+                post[key] = {"raw": value, "rendered": render_blocks(value), "protected": False}
+            elif key in ("title", "excerpt"):
+                post[key] = {"raw": value, "rendered": value}
+            elif key == "acf":
+                post["acf"] = {**(post.get("acf") or {}), **value}
+            else:
+                post[key] = value
+        now = datetime.utcnow().replace(microsecond=0).isoformat()
+        post["modified"] = post["modified_gmt"] = now
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run a fake WordPress REST API")
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--max-per-page", type=int, default=100)
+    args = parser.parse_args()
+    
+    site = FakeWordPress(posts=args.posts, latency=args.latency, port=args.port, max_per_page=args.max_per_page)
+    print(f"Fake WordPress listening on {site.url}")
+    site.server.serve_forever()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: payload size and latency with and without _fields projection.
+
+Serves posts shaped like a real site (long rendered content, SEO plugin head
+markup, _links) from the fake WordPress server and measures bytes on the
+wire and request latency for the requests behind list_posts, search_posts
+and /health, once fetching full objects and once with the projection the
+services now request.
+
+Usage:
+    python benchmarks/field_projection.py --runs 20 --latency 0.02
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_wordpress import FakeWordPress
+
+
+def inflate(site: FakeWordPress, content_kb: int) -> None:
+    """Give every post the bulk a typical production post carries."""
+    paragraph = "<p>" + "Indhold om marketing, SEO og konvertering. " * 20 + "</p>"
+    content = paragraph * max(1, content_kb * 1024 // len(paragraph))
+    head = '<meta property="og:description" content="' + "x" * 200 + '" />' * 16
+    for post in site.posts.values():
+        post["content"]["rendered"] = content
+        post["yoast_head"] = head
+        post["yoast_head_json"] = {"title": post["title"]["rendered"], "og_description": "x" * 300, "schema": {"@graph": [{"x": "y" * 1500}]}}
+        post["guid"] = {"rendered": post["link"]}
+        post["meta"] = {"footnotes": ""}
+        post["_links"].update({
+            rel: [{"href": f"https://example.test/wp-json/wp/v2/{rel}/{post['id']}", "embeddable": True}]
+            for rel in ("author", "replies", "version-history", "predecessor-version", "wp:attachment", "wp:term", "curies")
+        })
+
+
+def measure(client, call, runs: int):
+    """Median latency (ms) and response size (bytes) of ``call``."""
+    sizes = []
+    hook = lambda response, *args, **kwargs: sizes.append(len(response.content))
+    client.session.hooks["response"].append(hook)
+    timings = []
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        client.session.hooks["response"].remove(hook)
+    return statistics.median(timings), statistics.median(sizes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake WordPress latency (seconds)")
+    parser.add_argument("--content-kb", type=int, default=12)
+    args = parser.parse_args()
+    
+    from src.api.wordpress_client import WordPressClient
+    from src.services.post_service import LIST_FIELDS, SEARCH_FIELDS
+    
+    with FakeWordPress(posts=200, latency=args.latency) as site:
+        inflate(site, args.content_kb)
+        client = WordPressClient()
+        client.base_url = f"{site.url}/wp-json/wp/v2"
+        
+        cases = [
+            ("list_posts (10)",
+             lambda: client.get_posts(per_page=10),
+             lambda: client.get_posts(per_page=10, fields=LIST_FIELDS)),
+            ("search_posts (20)",
+             lambda: client.search_posts("marketing"),
+             lambda: client.search_posts("marketing", fields=SEARCH_FIELDS)),
+            ("/health",
+             lambda: client.get_posts(per_page=1),
+             lambda: client.get_posts(per_page=1, fields=["id"])),
+        ]
+        
+        print(f"{'request':<18} {'full KB':>8} {'proj KB':>8} {'ratio':>6} {'full ms':>8} {'proj ms':>8}")
+        for name, full, projected in cases:
+            full_ms, full_bytes = measure(client, full, args.runs)
+            proj_ms, proj_bytes = measure(client, projected, args.runs)
+            print(
+                f"{name:<18} {full_bytes / 1024:>8.1f} {proj_bytes / 1024:>8.1f} "
+                f"{full_bytes / proj_bytes:>5.0f}x {full_ms:>8.2f} {proj_ms:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
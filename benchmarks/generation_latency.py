@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end blog post generation latency per generation mode.
+
+Runs AsyncContentGenerator.generate_blog_post against the fake OpenAI server in
+each mode (sequential, parallel, single) and reports wall-clock latency and
+the number of model round trips.
+
+Usage:
+    python benchmarks/generation_latency.py --first-token-latency 0.5 --token-latency 0.005
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_openai import FakeOpenAI
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--first-token-latency", type=float, default=0.5)
+    parser.add_argument("--token-latency", type=float, default=0.005)
+    parser.add_argument("--body-tokens", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    
+    with FakeOpenAI(
+        first_token_latency=args.first_token_latency,
+        token_latency=args.token_latency,
+        body_tokens=args.body_tokens
+    ) as api:
+        os.environ["OPENAI_BASE_URL"] = api.base_url
+        os.environ.setdefault("OPENAI_API_KEY", "bench")
+        
+        from src.services.content_generator import GENERATION_MODES, AsyncContentGenerator
+        
+        async def run(generator, mode: str) -> float:
+            start = time.perf_counter()
+            await generator.generate_blog_post("AI i marketing", mode=mode)
+            return time.perf_counter() - start
+        
+        async def run_all(mode: str):
+            # One event loop per mode keeps the async client's connections valid
+            generator = AsyncContentGenerator()
+            return [await run(generator, mode) for _ in range(args.runs)]
+        
+        print(f"{'mode':<12} {'median s':>9} {'calls':>6} {'vs sequential':>14}")
+        baseline = None
+        for mode in GENERATION_MODES:
+            calls_before = api.request_count
+            timings = asyncio.run(run_all(mode))
+            calls = (api.request_count - calls_before) // args.runs
+            median = statistics.median(timings)
+            baseline = baseline or median
+            print(f"{mode:<12} {median:>9.2f} {calls:>6} {baseline / median:>13.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Load test: MCP tool throughput versus number of concurrent agent sessions.
+
+Starts a fake WordPress site with a fixed per-request latency, opens N MCP
+client sessions against the server in-process and has each session call
+get_post repeatedly. With non-blocking tools, throughput should grow roughly
+linearly with the number of sessions until the worker pool is saturated.
+
+Usage:
+    python benchmarks/load_test.py --latency 0.1 --sessions 1,4,16,32
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_wordpress import FakeWordPress
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger("load-test")
+
+
+async def run_session(client_factory, calls: int, post_ids: int) -> int:
+    """Run one agent session making sequential tool calls."""
+    async with client_factory() as client:
+        for i in range(calls):
+            await client.call_tool("get_post", {"post_id": 1 + i % post_ids})
+    return calls
+
+
+async def measure(client_factory, sessions: int, calls: int, post_ids: int) -> float:
+    """Return tool calls per second for the given number of concurrent sessions."""
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        run_session(client_factory, calls, post_ids) for _ in range(sessions)
+    ))
+    elapsed = time.perf_counter() - start
+    return sum(results) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--latency", type=float, default=0.1, help="Fake WordPress latency (seconds)")
+    parser.add_argument("--sessions", default="1,4,16,32", help="Comma-separated session counts")
+    parser.add_argument("--calls", type=int, default=10, help="Tool calls per session")
+    args = parser.parse_args()
+    
+    with FakeWordPress(posts=50, latency=args.latency) as site:
+        os.environ.update({
+            "WORDPRESS_URL": site.url,
+            "WORDPRESS_USERNAME": "bench",
+            "WORDPRESS_APP_PASSWORD": "bench",
+            "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "bench"),
+        })
+        
+        from fastmcp import Client
+        import mcp_server
+        
+        def client_factory():
+            return Client(mcp_server.mcp)
+        
+        print(f"Fake WordPress latency: {args.latency * 1000:.0f} ms per request")
+        print(f"Serial ceiling: {1 / args.latency:.1f} calls/s\n" if args.latency else "")
+        print(f"{'sessions':>8} {'calls/s':>10} {'speedup':>8}")
+        
+        baseline = None
+        for sessions in [int(s) for s in args.sessions.split(",")]:
+            throughput = asyncio.run(measure(client_factory, sessions, args.calls, 50))
+            baseline = baseline or throughput
+            print(f"{sessions:>8} {throughput:>10.1f} {throughput / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: turning WordPress responses into tool results.
+
+Times, per post, the paths list_posts and search_posts take from an API
+response to the dict a tool returns: the validated pydantic ``Post`` with
+both dates parsed against the slotted ``PostSummary``, which leaves dates
+as WordPress' strings. ``Post.model_construct`` is timed for comparison;
+on pydantic 2 it is slower than validating. Also times the site mirror's listing, which
+used to decode each post's stored JSON (content included) and now reads
+only the listing columns.
+
+Usage:
+    python benchmarks/post_models.py --posts 5000 --runs 7
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_wordpress import make_post
+from src.models.post import Post, PostSummary, parse_date
+from src.services.post_service import LIST_FIELDS, SEARCH_FIELDS
+
+
+def post_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """``Post`` field values of an API response, both dates parsed."""
+    return dict(
+        id=data["id"],
+        title=data["title"]["rendered"],
+        content=data["content"]["rendered"],
+        excerpt=data["excerpt"]["rendered"],
+        status=data["status"],
+        slug=data["slug"],
+        date=parse_date(data["date"]),
+        modified=parse_date(data["modified"]),
+        author=data["author"],
+        categories=data.get("categories", []),
+        tags=data.get("tags", []),
+        featured_media=data.get("featured_media"),
+        link=data["link"],
+        acf=data.get("acf")
+    )
+
+
+def constructed_post(data: Dict[str, Any]) -> Post:
+    """``Post`` built without validation."""
+    return Post.model_construct(**post_fields(data))
+
+
+def model_listing(data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """A listing row through the validated model."""
+    post = Post.from_api_response(data)
+    return {field: post.date.isoformat() if field == "date" else getattr(post, field) for field in fields}
+
+
+def summary_listing(data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    return PostSummary.from_api_response(data).to_dict(fields)
+
+
+def time_per_post(convert: Callable[[Dict[str, Any]], Any], posts: List[Dict[str, Any]], runs: int) -> float:
+    """Median microseconds per post of ``convert`` over ``posts``."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        for post in posts:
+            convert(post)
+        timings.append((time.perf_counter() - started) / len(posts) * 1e6)
+    return statistics.median(timings)
+
+
+def mirror_listing(count: int, runs: int) -> Dict[str, float]:
+    """Median milliseconds per 100-post mirror page: decoding stored JSON versus listing columns."""
+    from src.services.site_mirror import SiteMirror
+    
+    class NoClient:
+        """The mirror only needs a client to sync; posts are stored directly."""
+    
+    mirror = SiteMirror(NoClient(), path=":memory:")
+    mirror._store_posts([make_post(post_id) for post_id in range(1, count + 1)])
+    
+    def decoded() -> None:
+        with mirror._lock:
+            rows = mirror._db.execute("SELECT data FROM posts ORDER BY date DESC, id DESC LIMIT 100").fetchall()
+        [summary_listing(json.loads(row[0]), LIST_FIELDS) for row in rows]
+    
+    def columns() -> None:
+        [summary_listing(row, LIST_FIELDS) for row in mirror.list_posts(per_page=100, status="any")]
+    
+    results = {}
+    for name, call in (("decode stored JSON", decoded), ("listing columns", columns)):
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - started) * 1000)
+        results[name] = statistics.median(timings)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--posts", type=int, default=5000, help="Synthetic posts per run")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per measurement")
+    args = parser.parse_args()
+    
+    posts = [make_post(post_id) for post_id in range(1, args.posts + 1)]
+    cases = [
+        ("list_posts row", "validated Post", lambda data: model_listing(data, LIST_FIELDS)),
+        ("list_posts row", "PostSummary", lambda data: summary_listing(data, LIST_FIELDS)),
+        ("search_posts row", "validated Post", lambda data: model_listing(data, SEARCH_FIELDS)),
+        ("search_posts row", "PostSummary", lambda data: summary_listing(data, SEARCH_FIELDS)),
+        ("get_post result", "validated Post", lambda data: Post.from_api_response(data).to_dict()),
+        ("get_post result", "model_construct", lambda data: constructed_post(data).to_dict()),
+    ]
+    
+    print(f"{args.posts} posts, median of {args.runs} runs\n")
+    print(f"{'path':<18} {'model':<18} {'µs/post':>9}")
+    baseline: Dict[str, float] = {}
+    for path, model, convert in cases:
+        micros = time_per_post(convert, posts, args.runs)
+        speedup = f"  ({baseline[path] / micros:.1f}x)" if path in baseline else ""
+        baseline.setdefault(path, micros)
+        print(f"{path:<18} {model:<18} {micros:>9.2f}{speedup}")
+    
+    print(f"\nMirror listing, 100-post page of {args.posts}")
+    for name, millis in mirror_listing(args.posts, args.runs).items():
+        print(f"{name:<37} {millis:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
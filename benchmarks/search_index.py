@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: local FTS5 search index versus a LIKE scan on a synthetic corpus.
+
+Builds a site mirror of N synthetic posts (random Danish-looking text with a
+Zipf-like word distribution), then times ranked FTS5 queries against the
+unindexed ``LIKE '%word%'`` scan WordPress' own search performs.
+
+Usage:
+    python benchmarks/search_index.py --sizes 10000 100000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_wordpress import make_post
+
+SYLLABLES = ["mar", "ket", "ing", "seo", "lin", "kon", "ver", "te", "ring", "ind", "hold", "strat",
+             "e", "gi", "da", "ta", "an", "a", "lyse", "kun", "de", "rejse", "web", "side", "brand"]
+
+
+def make_vocabulary(size: int, rng: random.Random):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def make_corpus(count: int, vocabulary, rng: random.Random):
+    # Zipf-like weights so some words are common and most are rare
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    for post_id in range(1, count + 1):
+        post = make_post(post_id)
+        words = rng.choices(vocabulary, weights=weights, k=400)
+        post["title"] = {"rendered": " ".join(words[:6]).title()}
+        post["excerpt"] = {"rendered": f"<p>{' '.join(words[6:30])}</p>"}
+        post["content"] = {
+            "rendered": "".join(
+                f"<h2>{' '.join(words[i:i + 4])}</h2><p>{' '.join(words[i + 4:i + 74])}</p>"
+                for i in range(30, 400, 74)
+            )
+        }
+        yield post
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--like-queries", type=int, default=5)
+    args = parser.parse_args()
+    
+    from src.services.site_mirror import SiteMirror
+    
+    rng = random.Random(42)
+    vocabulary = make_vocabulary(5000, rng)
+    # Mix of common, mid-frequency and rare words, plus two-word queries
+    queries = [rng.choice(vocabulary[:50]) for _ in range(args.queries // 3)]
+    queries += [rng.choice(vocabulary[50:1000]) for _ in range(args.queries // 3)]
+    queries += [f"{rng.choice(vocabulary[:200])} {rng.choice(vocabulary[:2000])}" for _ in range(args.queries // 3)]
+    
+    print(f"{'posts':>8} {'build s':>8} {'posts/s':>8} {'fts p50 ms':>11} {'fts p95 ms':>11} {'like p50 ms':>12}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            mirror = SiteMirror(wp_client=None, path=str(Path(tmp) / "mirror.sqlite3"))
+            
+            start = time.perf_counter()
+            batch = []
+            for post in make_corpus(size, vocabulary, rng):
+                batch.append(post)
+                if len(batch) == 500:
+                    mirror._store_posts(batch)
+                    batch = []
+            if batch:
+                mirror._store_posts(batch)
+            build = time.perf_counter() - start
+            
+            fts_timings = []
+            for query in queries:
+                start = time.perf_counter()
+                mirror.search(query, per_page=20)
+                fts_timings.append((time.perf_counter() - start) * 1000)
+            
+            # WordPress counts every match (X-WP-Total) besides fetching the page
+            like_timings = []
+            for query in queries[:args.like_queries]:
+                pattern = f"%{query.split()[0]}%"
+                start = time.perf_counter()
+                mirror._db.execute(
+                    "SELECT COUNT(*) FROM posts WHERE status = 'publish' AND data LIKE ?", (pattern,)
+                ).fetchone()
+                mirror._db.execute(
+                    "SELECT id FROM posts WHERE status = 'publish' AND data LIKE ? "
+                    "ORDER BY date DESC LIMIT 20",
+                    (pattern,)
+                ).fetchall()
+                like_timings.append((time.perf_counter() - start) * 1000)
+            
+            print(
+                f"{size:>8} {build:>8.1f} {size / build:>8.0f} "
+                f"{statistics.median(fts_timings):>11.2f} {percentile(fts_timings, 0.95):>11.2f} "
+                f"{statistics.median(like_timings):>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: import time and time to the first successful tool call.
+
+Measures how long ``import mcp_server`` takes in a fresh interpreter, then
+starts the server over HTTP against the fake WordPress site and records
+when the port answers and when the first get_post call succeeds, counted
+from process start. This is what a cold start or scale-from-zero costs
+before a client gets its first result.
+
+Usage:
+    python benchmarks/startup_time.py --runs 5
+    python benchmarks/startup_time.py --no-warmup
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fake_wordpress import FakeWordPress
+from benchmarks.tool_bench import free_port
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import mcp_server; print(time.perf_counter() - t)"
+
+
+def import_time(env: Dict[str, str]) -> float:
+    """Seconds to import mcp_server in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=ROOT, env={**os.environ, **env}, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+async def first_call(url: str, started: float, timeout: float) -> float:
+    """Seconds from ``started`` until a get_post call succeeds."""
+    from fastmcp import Client
+
+    while time.perf_counter() - started < timeout:
+        try:
+            async with Client(url) as client:
+                await client.call_tool("get_post", {"post_id": 1})
+            return time.perf_counter() - started
+        except Exception:
+            await asyncio.sleep(0.02)
+    raise RuntimeError(f"No successful tool call within {timeout:.0f}s")
+
+
+def cold_start(env: Dict[str, str], timeout: float = 60.0) -> Tuple[float, float]:
+    """Seconds until the port answers and until the first tool call succeeds."""
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "mcp_server.py"],
+        cwd=ROOT, env={**os.environ, **env, "PORT": str(port)},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"MCP server exited with code {process.returncode}")
+            if time.perf_counter() - started > timeout:
+                raise RuntimeError(f"MCP server did not start within {timeout:.0f}s")
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1).read()
+                break
+            except OSError:
+                time.sleep(0.01)
+        listening = time.perf_counter() - started
+        return listening, asyncio.run(first_call(f"http://127.0.0.1:{port}/mcp", started, timeout))
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def describe(values) -> str:
+    return f"median {statistics.median(values) * 1000:7.0f} ms   min {min(values) * 1000:7.0f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5, help="Measurements of each kind")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake WordPress latency (seconds)")
+    parser.add_argument("--no-warmup", action="store_true", help="Start with STARTUP_WARMUP=false")
+    args = parser.parse_args()
+
+    with FakeWordPress(posts=50, latency=args.latency) as site:
+        env = {
+            "WORDPRESS_URL": site.url,
+            "WORDPRESS_USERNAME": "bench",
+            "WORDPRESS_APP_PASSWORD": "bench",
+            "OPENAI_API_KEY": "bench",
+            "STARTUP_WARMUP": "false" if args.no_warmup else "true",
+            "JOBS_PATH": str(ROOT / ".cache" / "bench_jobs.sqlite3"),
+        }
+
+        imports = [import_time(env) for _ in range(args.runs)]
+        starts = [cold_start(env) for _ in range(args.runs)]
+
+    print(f"Warmup {'off' if args.no_warmup else 'on'}, {args.runs} runs, WordPress {args.latency * 1000:.0f} ms/request\n")
+    print(f"{'import mcp_server':<24} {describe(imports)}")
+    print(f"{'port answering':<24} {describe([listening for listening, _ in starts])}")
+    print(f"{'first tool call':<24} {describe([first for _, first in starts])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: time to first streamed content versus total tool latency.
+
+Calls the generate_blog_post and improve_post_content tools through an MCP
+client against fake WordPress and OpenAI servers, recording when the first
+progress notification arrives and when the tool call completes.
+
+Usage:
+    python benchmarks/streaming_latency.py --first-token-latency 0.5 --token-latency 0.002
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_openai import FakeOpenAI
+from benchmarks.fake_wordpress import FakeWordPress
+
+
+async def time_tool(mcp, tool: str, arguments: dict):
+    """Return (time to first progress, total time, notifications) for one tool call."""
+    from fastmcp import Client
+    
+    first = None
+    notifications = 0
+    start = time.perf_counter()
+    
+    async def on_progress(progress, total, message):
+        nonlocal first, notifications
+        notifications += 1
+        if first is None:
+            first = time.perf_counter() - start
+    
+    async def on_log(message):
+        pass
+    
+    async with Client(mcp, progress_handler=on_progress, log_handler=on_log) as client:
+        start = time.perf_counter()
+        await client.call_tool(tool, arguments)
+        total = time.perf_counter() - start
+    return first, total, notifications
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--first-token-latency", type=float, default=0.5)
+    parser.add_argument("--token-latency", type=float, default=0.002)
+    args = parser.parse_args()
+    
+    with FakeWordPress(posts=10) as site, FakeOpenAI(
+        first_token_latency=args.first_token_latency,
+        token_latency=args.token_latency
+    ) as api:
+        os.environ.update({
+            "WORDPRESS_URL": site.url,
+            "WORDPRESS_USERNAME": "bench",
+            "WORDPRESS_APP_PASSWORD": "bench",
+            "OPENAI_API_KEY": "bench",
+            "OPENAI_BASE_URL": api.base_url,
+        })
+        import mcp_server
+        
+        cases = [
+            ("generate_blog_post", {"topic": "AI i marketing", "save_as_draft": False}),
+            ("improve_post_content", {"post_id": 1}),
+        ]
+        
+        async def run_cases():
+            # One event loop for all calls, as in the server process
+            return [await time_tool(mcp_server.mcp, tool, arguments) for tool, arguments in cases]
+        
+        results = asyncio.run(run_cases())
+        print(f"{'tool':<22} {'first content s':>16} {'total s':>8} {'notifications':>14}")
+        for (tool, _), (first, total, notifications) in zip(cases, results):
+            first_text = f"{first:.2f}" if first is not None else "-"
+            print(f"{tool:<22} {first_text:>16} {total:>8.2f} {notifications:>14}")
+
+
+if __name__ == "__main__":
+    main()
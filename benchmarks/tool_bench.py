@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Tool benchmark: per-tool latency percentiles over the HTTP transport.
+
+Starts the fake WordPress site and the fake OpenAI API, runs mcp_server.py
+as a subprocess in HTTP mode against them and drives each MCP tool from
+``--concurrency`` client sessions. Reports p50/p95/p99 latency, errors and
+throughput per tool, saves the run as JSON and compares it with an earlier
+run, so a change can be measured against the baseline it replaces.
+
+Usage:
+    python benchmarks/tool_bench.py --label baseline
+    python benchmarks/tool_bench.py --label pooled --compare latest
+    python benchmarks/tool_bench.py --tools get_post,list_posts --posts 5000 --wp-latency 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.fake_openai import FakeOpenAI
+from benchmarks.fake_wordpress import FakeWordPress
+
+RESULTS_DIR = ROOT / ".cache" / "benchmarks"
+
+# Tool arguments for call number ``i``; read tools spread over the corpus,
+# AI tools leave the site unchanged
+WORKLOADS: Dict[str, Callable[[int, int], Dict[str, Any]]] = {
+    "list_posts": lambda i, posts: {"per_page": 20, "page": 1 + i % max(1, posts // 20)},
+    "get_post": lambda i, posts: {"post_id": 1 + i % posts},
+    "search_posts": lambda i, posts: {"query": f"Post {1 + i % posts}", "per_page": 10},
+    "get_categories": lambda i, posts: {},
+    "update_post": lambda i, posts: {"post_id": 1 + i % posts, "title": f"Benchmark title {i}"},
+    "improve_post_content": lambda i, posts: {"post_id": 1 + i % posts, "save_changes": False, "use_cache": False},
+    "optimize_post_seo": lambda i, posts: {"post_id": 1 + i % posts, "save_changes": False, "use_cache": False},
+    "generate_blog_post": lambda i, posts: {"topic": f"Benchmark emne {i}", "length": "short", "save_as_draft": False},
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """``q``-th percentile (0-100) of ``values`` with linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    """Latency percentiles in milliseconds and throughput for one tool."""
+    return {
+        "calls": len(latencies) + errors,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 2),
+        "throughput": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+def compare(current: Dict[str, Dict[str, Any]], previous: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Optional[float]]]:
+    """Relative change in percent per tool and metric; None where there is no baseline."""
+    deltas = {}
+    for tool, stats in current.items():
+        before = previous.get(tool, {})
+        deltas[tool] = {
+            metric: round((stats[metric] - before[metric]) / before[metric] * 100, 1) if before.get(metric) else None
+            for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput")
+        }
+    return deltas
+
+
+def load_run(path: str, out_dir: Path, exclude: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """A saved run by path, or the newest one in ``out_dir`` for ``latest``."""
+    if path != "latest":
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    runs = sorted(p for p in out_dir.glob("*.json") if p != exclude)
+    return json.loads(runs[-1].read_text(encoding="utf-8")) if runs else None
+
+
+async def run_tool(url: str, tool: str, requests: int, concurrency: int, posts: int) -> Dict[str, Any]:
+    """Call ``tool`` ``requests`` times from ``concurrency`` sessions."""
+    from fastmcp import Client
+    
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+    
+    async def ignore_log(message: Any) -> None:
+        # Streaming tools send partial content as log messages
+        pass
+    
+    async def session() -> None:
+        nonlocal errors
+        async with Client(url, log_handler=ignore_log) as client:
+            for i in counter:
+                started = time.perf_counter()
+                try:
+                    await client.call_tool(tool, WORKLOADS[tool](i, posts))
+                except Exception:
+                    errors += 1
+                else:
+                    latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(min(concurrency, requests))))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(env: Dict[str, str], port: int, log_path: Path, timeout: float = 30.0) -> subprocess.Popen:
+    """Run mcp_server.py over HTTP and wait until it answers."""
+    log = open(log_path, "w")
+    process = subprocess.Popen(
+        [sys.executable, "mcp_server.py"],
+        cwd=ROOT, env={**os.environ, **env, "PORT": str(port)}, stdout=log, stderr=subprocess.STDOUT
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"MCP server exited with code {process.returncode}; see {log_path}")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1).read()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"MCP server did not start within {timeout:.0f}s; see {log_path}")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_table(results: Dict[str, Dict[str, Any]], deltas: Optional[Dict[str, Dict[str, Optional[float]]]] = None) -> None:
+    def delta(tool: str, metric: str) -> str:
+        value = (deltas or {}).get(tool, {}).get(metric)
+        return f" ({value:+.0f}%)" if value is not None else ""
+    
+    print(f"{'tool':<22} {'calls':>6} {'err':>4} {'p50 ms':>16} {'p95 ms':>16} {'p99 ms':>16} {'calls/s':>16}")
+    for tool, stats in results.items():
+        print(
+            f"{tool:<22} {stats['calls']:>6} {stats['errors']:>4}"
+            + "".join(f" {f'{stats[m]:.1f}{delta(tool, m)}':>16}" for m in ("p50_ms", "p95_ms", "p99_ms", "throughput"))
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tools", default=",".join(WORKLOADS), help="Comma-separated tools to run")
+    parser.add_argument("--requests", type=int, default=50, help="Calls per tool")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client sessions")
+    parser.add_argument("--posts", type=int, default=500, help="Posts in the fake WordPress corpus")
+    parser.add_argument("--wp-latency", type=float, default=0.05, help="Fake WordPress latency per request (seconds)")
+    parser.add_argument("--first-token-latency", type=float, default=0.3, help="Fake OpenAI time to first token (seconds)")
+    parser.add_argument("--token-latency", type=float, default=0.002, help="Fake OpenAI time per token (seconds)")
+    parser.add_argument("--body-tokens", type=int, default=300, help="Tokens in a generated body")
+    parser.add_argument("--label", default="run", help="Name for the saved result file")
+    parser.add_argument("--out-dir", default=str(RESULTS_DIR), help="Directory for result files")
+    parser.add_argument("--compare", help="Earlier result file to compare with, or 'latest'")
+    parser.add_argument("--no-save", action="store_true", help="Do not write a result file")
+    args = parser.parse_args()
+    
+    tools = [tool.strip() for tool in args.tools.split(",") if tool.strip()]
+    unknown = [tool for tool in tools if tool not in WORKLOADS]
+    if unknown:
+        parser.error(f"Unknown tools: {', '.join(unknown)}. Choose from: {', '.join(WORKLOADS)}")
+    out_dir = Path(args.out_dir)
+    
+    with FakeWordPress(posts=args.posts, latency=args.wp_latency) as site, \
+            FakeOpenAI(args.first_token_latency, args.token_latency, args.body_tokens) as api, \
+            tempfile.TemporaryDirectory() as tmp:
+        port = free_port()
+        env = {
+            "WORDPRESS_URL": site.url,
+            "WORDPRESS_USERNAME": "bench",
+            "WORDPRESS_APP_PASSWORD": "bench",
+            "OPENAI_API_KEY": "bench",
+            "OPENAI_BASE_URL": api.base_url,
+            # Measure the request path, not cache hits from earlier calls
+            "LLM_CACHE_ENABLED": "false",
+            "JOBS_PATH": str(Path(tmp) / "jobs.sqlite3"),
+            "TRACE_SLOW_THRESHOLD": "0",
+        }
+        log_path = Path(tmp) / "server.log"
+        process = start_server(env, port, log_path)
+        url = f"http://127.0.0.1:{port}/mcp"
+        
+        print(f"Corpus {args.posts} posts, WordPress {args.wp_latency * 1000:.0f} ms/request, "
+              f"OpenAI {args.first_token_latency * 1000:.0f} ms + {args.token_latency * 1000:.1f} ms/token")
+        print(f"{args.requests} calls per tool from {args.concurrency} sessions over {url}\n")
+        
+        results = {}
+        try:
+            for tool in tools:
+                results[tool] = asyncio.run(run_tool(url, tool, args.requests, args.concurrency, args.posts))
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+        wordpress_requests, openai_requests = site.request_count, api.request_count
+    
+    run = {
+        "label": args.label,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("compare", "no_save", "out_dir", "label")},
+        "upstream_requests": {"wordpress": wordpress_requests, "openai": openai_requests},
+        "results": results,
+    }
+    
+    path = None
+    if not args.no_save:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"{datetime.now():%Y%m%d-%H%M%S}-{args.label}.json"
+        path.write_text(json.dumps(run, indent=2), encoding="utf-8")
+    
+    deltas = None
+    if args.compare:
+        previous = load_run(args.compare, out_dir, exclude=path)
+        if previous:
+            print(f"Compared with '{previous['label']}' ({previous['timestamp']}, {previous['commit']})\n")
+            deltas = compare(results, previous["results"])
+        else:
+            print("No earlier run to compare with\n")
+    
+    print_table(results, deltas)
+    print(f"\nUpstream requests: {wordpress_requests} WordPress, {openai_requests} OpenAI")
+    if path:
+        print(f"Saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.api.wordpress_client import WordPressClient
+from src.config.sites import SiteConfig
+
+
+@pytest.fixture
+def wordpress_client():
+    """Build ``WordPressClient``s for fake WordPress sites, closed after the test.
+    
+    Each fake site listens on its own port, so every client gets its own
+    circuit breaker and concurrency limiter instead of sharing the state of
+    the ``WORDPRESS_URL`` host between tests.
+    """
+    clients = []
+    
+    def make(site) -> WordPressClient:
+        client = WordPressClient(SiteConfig("test", site.url, "test", "test"))
+        clients.append(client)
+        return client
+    
+    yield make
+    for client in clients:
+        client.close()
@@ -7,16 +7,30 @@ with AI-powered content generation and optimization capabilities.
 """
 
 import logging
+import socket
 import sys
-from typing import List, Optional, Dict, Any
-from fastmcp import FastMCP
+import threading
+import time
+from typing import List, Optional, Dict, Any, Union
+from fastmcp import FastMCP, Context
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 
 # Add src to path
 sys.path.insert(0, str(__file__).replace('mcp_server.py', ''))
 
 from src.config.settings import settings
-from src.services.post_service import PostService
-from src.api.wordpress_client import WordPressClient
+from src.services.async_post_service import AsyncPostService
+from src.services.content_generator import AsyncContentGenerator, expected_post_chars
+from src.services.job_queue import JobRunner, get_job_runner
+from src.services.llm_cache import get_llm_cache
+from src.services.health import get_health_prober
+from src.services.post_jobs import make_post_job_handlers, split_job_params
+from src.services.site_registry import get_site_registry
+from src.utils.aio import run_blocking
+from src.utils.metrics import CACHE_HIT_RATIO, CACHE_LOOKUPS, CACHE_RESULTS, CONTENT_TYPE, REGISTRY
+from src.utils.progress import ItemProgress, StreamProgress
+from src.utils.tool_metrics import ToolMetricsMiddleware, ToolTracingMiddleware, precreate_tool_metrics
 
 # Set up logging
 logging.basicConfig(
@@ -29,17 +43,47 @@ logger = logging.getLogger("wordpress-mcp")
 # Validate settings
 if not settings.validate():
     logger.error("Missing required configuration. Please check your .env file.")
-    logger.error("Required: WORDPRESS_URL, WORDPRESS_USERNAME, WORDPRESS_APP_PASSWORD")
+    logger.error("Required: WORDPRESS_URL, WORDPRESS_USERNAME, WORDPRESS_APP_PASSWORD, or SITES_FILE")
     sys.exit(1)
 
 # Initialize FastMCP server
 mcp = FastMCP("wordpress-content-management")
+mcp.add_middleware(ToolMetricsMiddleware())
+mcp.add_middleware(ToolTracingMiddleware())
+
+_content_generator: Optional[AsyncContentGenerator] = None
+_content_generator_lock = threading.Lock()
+
+
+def get_post_service(site: Optional[str] = None) -> AsyncPostService:
+    """Post service for ``site`` (default: DEFAULT_SITE) from the site registry.
+    
+    Sites get their pooled WordPress client on first use, so nothing talks
+    to WordPress or OpenAI at import time and the server binds its port
+    quickly on a cold start; ``warm_up`` builds the default site in the
+    background once it is listening. All sites share one AI generator.
+    """
+    global _content_generator
+    if _content_generator is None:
+        with _content_generator_lock:
+            if _content_generator is None:
+                _content_generator = AsyncContentGenerator()
+    return AsyncPostService(get_site_registry().post_service(site), content_generator=_content_generator)
 
-# Initialize services
-post_service = PostService()
-wp_client = WordPressClient()
 
-logger.info(f"WordPress MCP Server initialized for {settings.WORDPRESS_URL}")
+async def resolve_terms(
+    taxonomy: str,
+    value: Optional[Union[str, List[Union[int, str]]]],
+    create_missing: bool = True,
+    site: Optional[str] = None
+) -> Optional[List[int]]:
+    """Resolve term IDs, slugs or names (a list or comma-separated string) to IDs."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    refs = [str(ref).strip() for ref in value if str(ref).strip()]
+    return await get_post_service(site).resolve_terms(taxonomy, refs, create_missing=create_missing)
 
 
 # ============================================================================
@@ -47,12 +91,14 @@ logger.info(f"WordPress MCP Server initialized for {settings.WORDPRESS_URL}")
 # ============================================================================
 
 @mcp.tool()
-def list_posts(
+async def list_posts(
     per_page: int = 10,
     page: int = 1,
     status: str = "publish",
     search: Optional[str] = None,
-    categories: Optional[str] = None
+    categories: Optional[str] = None,
+    embed: Optional[str] = None,
+    site: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     List WordPress posts with filtering options.
@@ -62,63 +108,117 @@ def list_posts(
         page: Page number (default: 1)
         status: Post status - publish, draft, pending, private (default: publish)
         search: Search query to filter posts
-        categories: Comma-separated category IDs to filter by
+        categories: Comma-separated category IDs, slugs or names to filter by
+        embed: Comma-separated linked resources to embed - author, wp:featuredmedia, wp:term - or "all"
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
-        List of posts with id, title, status, date, link, and excerpt
+        List of posts with id, title, status, date, link, and excerpt (plus _embedded when embed is set)
     """
-    category_ids = None
-    if categories:
-        category_ids = [int(c.strip()) for c in categories.split(',')]
+    category_ids = await resolve_terms("categories", categories, create_missing=False, site=site)
+    
+    embed_relations = None
+    if embed:
+        embed_relations = True if embed == "all" else [e.strip() for e in embed.split(',')]
     
-    return post_service.list_posts(
+    return await get_post_service(site).list_posts(
         per_page=per_page,
         page=page,
         status=status,
         search=search,
-        categories=category_ids
+        categories=category_ids,
+        embed=embed_relations
     )
 
 
 @mcp.tool()
-def get_post(post_id: int) -> Dict[str, Any]:
+async def get_post(post_id: int, site: Optional[str] = None) -> Dict[str, Any]:
     """
     Get a specific WordPress post with full details including ACF fields.
     
     Args:
         post_id: The WordPress post ID
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
         Complete post data including title, content, excerpt, categories, tags, ACF fields, etc.
     """
-    post = post_service.get_post(post_id)
-    return {
-        "id": post.id,
-        "title": post.title,
-        "content": post.content,
-        "excerpt": post.excerpt,
-        "status": post.status,
-        "slug": post.slug,
-        "date": post.date.isoformat(),
-        "modified": post.modified.isoformat(),
-        "author": post.author,
-        "categories": post.categories,
-        "tags": post.tags,
-        "featured_media": post.featured_media,
-        "link": post.link,
-        "acf": post.acf
-    }
+    post = await get_post_service(site).get_post(post_id)
+    return post.to_dict()
+
+
+@mcp.tool()
+async def get_post_outline(post_id: int, site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get the outline of a post: its <h2> sections with headings, word counts and IDs.
+    
+    Use this instead of get_post on long posts, then read or replace only
+    the sections needed with get_post_section and replace_post_section.
+    Section IDs are derived from each section's content, so an ID stops
+    working once that section changes.
+    
+    Args:
+        post_id: The WordPress post ID
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Post ID, title, content hash, total words and the sections (id, heading, words, chars);
+        the intro before the first heading has an empty heading
+    """
+    return await get_post_service(site).get_outline(post_id)
+
+
+@mcp.tool()
+async def get_post_section(post_id: int, section_id: str, site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get the HTML of one section of a post.
+    
+    Args:
+        post_id: The WordPress post ID
+        section_id: Section ID from get_post_outline
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Section ID, heading, word count and stored HTML (including its <h2> and any block comments)
+    """
+    return await get_post_service(site).get_section(post_id, section_id)
+
+
+@mcp.tool()
+async def replace_post_section(
+    post_id: int,
+    section_id: str,
+    html: str,
+    site: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Replace one section of a post, keeping the rest of the content unchanged.
+    
+    Fails if the section has changed since the outline was read; get the
+    outline again and retry.
+    
+    Args:
+        post_id: The WordPress post ID
+        section_id: Section ID from get_post_outline
+        html: New HTML for the section, including its <h2> heading
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Summary of changed fields under "changes" and the outline of the saved post
+    """
+    return await get_post_service(site).replace_section(post_id, section_id, html)
 
 
 @mcp.tool()
-def create_post(
+async def create_post(
     title: str,
     content: str,
     status: str = "draft",
     excerpt: Optional[str] = None,
     categories: Optional[str] = None,
     tags: Optional[str] = None,
-    acf_fields: Optional[str] = None
+    acf_fields: Optional[str] = None,
+    site: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Create a new WordPress post.
@@ -128,9 +228,10 @@ def create_post(
         content: Post content (HTML)
         status: Post status - draft, publish, pending, private (default: draft)
         excerpt: Post excerpt/summary
-        categories: Comma-separated category IDs
-        tags: Comma-separated tag IDs
+        categories: Comma-separated category IDs or names (unknown names are created)
+        tags: Comma-separated tag IDs or names (unknown names are created)
         acf_fields: JSON string of ACF custom fields
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
         Created post data with id, title, link, and status
@@ -138,9 +239,9 @@ def create_post(
     from src.models.post import PostCreate
     import json
     
-    # Parse categories and tags
-    category_ids = [int(c.strip()) for c in categories.split(',')] if categories else None
-    tag_ids = [int(t.strip()) for t in tags.split(',')] if tags else None
+    # Resolve categories and tags
+    category_ids = await resolve_terms("categories", categories, site=site)
+    tag_ids = await resolve_terms("tags", tags, site=site)
     
     # Parse ACF fields
     acf_data = json.loads(acf_fields) if acf_fields else None
@@ -155,7 +256,7 @@ def create_post(
         acf_fields=acf_data
     )
     
-    post = post_service.create_post(post_data)
+    post = await get_post_service(site).create_post(post_data)
     
     return {
         "id": post.id,
@@ -167,7 +268,7 @@ def create_post(
 
 
 @mcp.tool()
-def update_post(
+async def update_post(
     post_id: int,
     title: Optional[str] = None,
     content: Optional[str] = None,
@@ -175,30 +276,35 @@ def update_post(
     excerpt: Optional[str] = None,
     categories: Optional[str] = None,
     tags: Optional[str] = None,
-    acf_fields: Optional[str] = None
+    acf_fields: Optional[str] = None,
+    site: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Update an existing WordPress post.
     
+    Only fields that differ from the current post are sent (content is
+    compared as normalised HTML); if nothing differs, no update is made.
+    
     Args:
         post_id: The WordPress post ID to update
         title: New post title (optional)
         content: New post content (optional)
         status: New post status (optional)
         excerpt: New post excerpt (optional)
-        categories: Comma-separated category IDs (optional)
-        tags: Comma-separated tag IDs (optional)
+        categories: Comma-separated category IDs or names; unknown names are created (optional)
+        tags: Comma-separated tag IDs or names; unknown names are created (optional)
         acf_fields: JSON string of ACF custom fields (optional)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
-        Updated post data
+        Updated post data with a summary of changed fields under "changes"
     """
     from src.models.post import PostUpdate
     import json
     
-    # Parse categories and tags
-    category_ids = [int(c.strip()) for c in categories.split(',')] if categories else None
-    tag_ids = [int(t.strip()) for t in tags.split(',')] if tags else None
+    # Resolve categories and tags
+    category_ids = await resolve_terms("categories", categories, site=site)
+    tag_ids = await resolve_terms("tags", tags, site=site)
     
     # Parse ACF fields
     acf_data = json.loads(acf_fields) if acf_fields else None
@@ -213,48 +319,172 @@ def update_post(
         acf_fields=acf_data
     )
     
-    post = post_service.update_post(post_id, post_data)
+    post, changes = await get_post_service(site).save_post_changes(post_id, post_data)
     
     return {
         "id": post.id,
         "title": post.title,
         "link": post.link,
         "status": post.status,
-        "modified": post.modified.isoformat()
+        "modified": post.modified.isoformat(),
+        "changes": changes
     }
 
 
 @mcp.tool()
-def delete_post(post_id: int, force: bool = False) -> Dict[str, str]:
+async def delete_post(post_id: int, force: bool = False, site: Optional[str] = None) -> Dict[str, str]:
     """
     Delete a WordPress post (moves to trash by default).
     
     Args:
         post_id: The WordPress post ID to delete
         force: If true, permanently delete the post. If false, move to trash (default: false)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
         Deletion status
     """
-    result = post_service.delete_post(post_id, force=force)
+    result = await get_post_service(site).delete_post(post_id, force=force)
     return {
         "status": "deleted" if force else "trashed",
         "post_id": str(post_id)
     }
 
 
+def job_runner() -> JobRunner:
+    """Background job runner (own event loop and AI client, shared site registry)."""
+    def handlers():
+        content_generator = AsyncContentGenerator()
+        return make_post_job_handlers(
+            lambda site: AsyncPostService(get_site_registry().post_service(site), content_generator=content_generator)
+        )
+    
+    return get_job_runner(handlers)
+
+
+async def queue_job(kind: str, params: Dict[str, Any], site: Optional[str] = None) -> Dict[str, Any]:
+    """Queue a background job for ``site`` and return its initial status."""
+    params, items = split_job_params(kind, params)
+    params["site"] = get_site_registry().resolve(site or params.get("site")).name
+    runner = await run_blocking(job_runner)
+    job_id = await run_blocking(runner.submit, kind, params, items)
+    return await run_blocking(runner.store.status, job_id)
+
+
+def bulk_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap per-item bulk results with success and failure counts."""
+    # AI results carry no status on success, only errors are marked
+    failed = sum(1 for result in results if result.get("status") == "error")
+    return {
+        "total": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "results": results
+    }
+
+
+@mcp.tool()
+async def bulk_create_posts(posts: str, site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Create many WordPress posts at once (sent 25 per batch request).
+    
+    Args:
+        posts: JSON array of posts, each with title, content and optionally status
+            (default: draft), excerpt, categories, tags (lists or comma-separated
+            IDs or names) and acf_fields (object)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Counts plus one result per post, in order: id, status (created or error),
+        title and link, or the error message
+    """
+    from src.models.post import PostCreate
+    import json
+    
+    items = json.loads(posts)
+    post_data = []
+    for item in items:
+        post_data.append(PostCreate(
+            title=item["title"],
+            content=item["content"],
+            status=item.get("status", "draft"),
+            excerpt=item.get("excerpt"),
+            categories=await resolve_terms("categories", item.get("categories"), site=site),
+            tags=await resolve_terms("tags", item.get("tags"), site=site),
+            acf_fields=item.get("acf_fields")
+        ))
+    
+    return bulk_summary(await get_post_service(site).bulk_create_posts(post_data))
+
+
+@mcp.tool()
+async def bulk_update_posts(updates: str, site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Update many WordPress posts at once (sent 25 per batch request).
+    
+    Args:
+        updates: JSON array of updates, each with the post "id" and any of title,
+            content, status, excerpt, categories, tags (lists or comma-separated IDs
+            or names) and acf_fields (object)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Counts plus one result per update, in order: id, status (updated or error),
+        title and link, or the error message
+    """
+    from src.models.post import PostUpdate
+    import json
+    
+    items = json.loads(updates)
+    post_updates = []
+    for item in items:
+        post_updates.append((int(item["id"]), PostUpdate(
+            title=item.get("title"),
+            content=item.get("content"),
+            status=item.get("status"),
+            excerpt=item.get("excerpt"),
+            categories=await resolve_terms("categories", item.get("categories"), site=site),
+            tags=await resolve_terms("tags", item.get("tags"), site=site),
+            acf_fields=item.get("acf_fields")
+        )))
+    
+    return bulk_summary(await get_post_service(site).bulk_update_posts(post_updates))
+
+
+@mcp.tool()
+async def bulk_delete_posts(post_ids: str, force: bool = False, site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Delete many WordPress posts at once (moves them to trash by default).
+    
+    Args:
+        post_ids: Comma-separated post IDs
+        force: If true, permanently delete the posts (default: false)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Counts plus one result per post, in order: id and status (trashed, deleted or error)
+    """
+    ids = [int(post_id) for post_id in post_ids.split(',') if post_id.strip()]
+    return bulk_summary(await get_post_service(site).bulk_delete_posts(ids, force=force))
+
+
 # ============================================================================
 # AI Content Generation Tools
 # ============================================================================
 
 @mcp.tool()
-def generate_blog_post(
+async def generate_blog_post(
     topic: str,
     keywords: Optional[str] = None,
     tone: str = "professional",
     length: str = "medium",
     language: str = "da",
-    save_as_draft: bool = True
+    save_as_draft: bool = True,
+    mode: Optional[str] = None,
+    use_cache: bool = False,
+    background: bool = False,
+    site: Optional[str] = None,
+    ctx: Context = None
 ) -> Dict[str, Any]:
     """
     Generate a complete blog post using AI.
@@ -266,27 +496,58 @@ def generate_blog_post(
         length: Content length - short (400-600 words), medium (800-1200 words), long (1500-2000 words) (default: medium)
         language: Content language - da (Danish), en (English), sv (Swedish), etc. (default: da)
         save_as_draft: Save generated post as draft in WordPress (default: true)
+        mode: Generation pipeline - sequential (body, title, excerpt one after another), parallel (title alongside body), single (one JSON call) (default: server setting, sequential)
+        use_cache: Reuse a cached result for an identical request (default: false, since generation is creative)
+        background: Run as a background job and return its job ID at once (default: false)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
-        Generated post with title, content, excerpt, and post ID if saved
+        Generated post with title, content, excerpt, and post ID if saved;
+        with background, the job status (see get_job_status)
+    
+    Partial content is streamed to the client as progress and log
+    notifications while the post is generated.
     """
     keyword_list = [k.strip() for k in keywords.split(',')] if keywords else None
+    if background:
+        return await queue_job("generate_post", {
+            "topics": [topic],
+            "keywords": keyword_list,
+            "tone": tone,
+            "length": length,
+            "language": language,
+            "save_as_draft": save_as_draft,
+            "mode": mode,
+            "use_cache": True if use_cache else None
+        }, site=site)
+    progress = StreamProgress(ctx, expected_post_chars(length), "Generating post") if ctx else None
     
-    return post_service.generate_post(
+    result = await get_post_service(site).generate_post(
         topic=topic,
         keywords=keyword_list,
         tone=tone,
         length=length,
         language=language,
-        save_as_draft=save_as_draft
+        save_as_draft=save_as_draft,
+        mode=mode,
+        on_delta=progress.on_delta if progress else None,
+        use_cache=True if use_cache else None
     )
+    
+    if progress:
+        await progress.done()
+    return result
 
 
 @mcp.tool()
-def improve_post_content(
+async def improve_post_content(
     post_id: int,
     improvements: Optional[str] = "seo,readability,structure",
-    save_changes: bool = False
+    save_changes: bool = False,
+    use_cache: bool = True,
+    background: bool = False,
+    site: Optional[str] = None,
+    ctx: Context = None
 ) -> Dict[str, Any]:
     """
     Improve existing post content using AI.
@@ -295,24 +556,47 @@ def improve_post_content(
         post_id: The WordPress post ID to improve
         improvements: Comma-separated list of improvements - seo, readability, structure, grammar (default: seo,readability,structure)
         save_changes: Save improved content directly to WordPress (default: false)
+        use_cache: Reuse the cached AI result for identical content and options; set false to force a fresh run (default: true)
+        background: Run as a background job and return its job ID at once (default: false)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
-        Original and improved content, with post ID and save status
+        Original and improved content, with post ID and save status;
+        with background, the job status (see get_job_status)
+    
+    Partial content is streamed to the client as progress and log
+    notifications while the post is improved.
     """
     improvement_list = [i.strip() for i in improvements.split(',')]
+    if background:
+        return await queue_job("improve_posts", {
+            "post_ids": [post_id],
+            "improvements": improvement_list,
+            "save_changes": save_changes,
+            "use_cache": None if use_cache else False
+        }, site=site)
+    progress = StreamProgress(ctx, None, "Improving post") if ctx else None
     
-    return post_service.improve_post(
+    result = await get_post_service(site).improve_post(
         post_id=post_id,
         improvements=improvement_list,
-        save_changes=save_changes
+        save_changes=save_changes,
+        on_delta=progress.on_delta if progress else None,
+        use_cache=None if use_cache else False
     )
+    
+    if progress:
+        await progress.done()
+    return result
 
 
 @mcp.tool()
-def optimize_post_seo(
+async def optimize_post_seo(
     post_id: int,
     target_keywords: Optional[str] = None,
-    save_changes: bool = False
+    save_changes: bool = False,
+    use_cache: bool = True,
+    site: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Optimize post for SEO (title, meta description, content suggestions).
@@ -321,67 +605,299 @@ def optimize_post_seo(
         post_id: The WordPress post ID to optimize
         target_keywords: Comma-separated target keywords for SEO
         save_changes: Save optimized title directly to WordPress (default: false)
+        use_cache: Reuse the cached AI result for identical content and options; set false to force a fresh run (default: true)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
         Current and optimized title, meta description, and content suggestions
     """
     keyword_list = [k.strip() for k in target_keywords.split(',')] if target_keywords else None
     
-    return post_service.optimize_post_seo(
+    return await get_post_service(site).optimize_post_seo(
         post_id=post_id,
         target_keywords=keyword_list,
-        save_changes=save_changes
+        save_changes=save_changes,
+        use_cache=None if use_cache else False
     )
 
 
+async def select_posts(
+    post_ids: Optional[str],
+    categories: Optional[str],
+    status: str,
+    after: Optional[str],
+    before: Optional[str],
+    limit: Optional[int],
+    site: Optional[str] = None
+) -> List[int]:
+    """Post IDs for a bulk AI run: explicit IDs, or every post matching the filter."""
+    if post_ids:
+        ids = [int(post_id) for post_id in post_ids.split(',') if post_id.strip()]
+    else:
+        ids = await get_post_service(site).find_post_ids(
+            status=status,
+            categories=await resolve_terms("categories", categories, create_missing=False, site=site),
+            after=after,
+            before=before
+        )
+    return ids[:limit] if limit else ids
+
+
+@mcp.tool()
+async def bulk_improve_posts(
+    post_ids: Optional[str] = None,
+    categories: Optional[str] = None,
+    status: str = "publish",
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: Optional[int] = None,
+    improvements: Optional[str] = "seo,readability,structure",
+    save_changes: bool = False,
+    use_cache: bool = True,
+    background: bool = False,
+    site: Optional[str] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Improve many posts with AI, selected by IDs or by a filter.
+    
+    Args:
+        post_ids: Comma-separated post IDs (overrides the filter below)
+        categories: Comma-separated category IDs, slugs or names to filter by
+        status: Post status to filter by (default: publish)
+        after: Only posts published after this ISO 8601 date
+        before: Only posts published before this ISO 8601 date
+        limit: Process at most this many posts
+        improvements: Comma-separated list of improvements - seo, readability, structure, grammar (default: seo,readability,structure)
+        save_changes: Save improved content directly to WordPress (default: false)
+        use_cache: Reuse cached AI results for identical content and options (default: true)
+        background: Run as a background job and return its job ID at once (default: false)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Counts plus one result per post, in order: improved content and save
+        status, or the error message; with background, the job status
+    
+    Posts are fetched, improved and saved concurrently, within separate
+    WordPress and OpenAI concurrency limits; progress is reported per post.
+    """
+    ids = await select_posts(post_ids, categories, status, after, before, limit, site=site)
+    improvement_list = [i.strip() for i in improvements.split(',')]
+    if background:
+        return await queue_job("improve_posts", {
+            "post_ids": ids,
+            "improvements": improvement_list,
+            "save_changes": save_changes,
+            "use_cache": None if use_cache else False
+        }, site=site)
+    progress = ItemProgress(ctx, "Improving posts") if ctx else None
+    
+    results = await get_post_service(site).bulk_improve_posts(
+        ids,
+        improvements=improvement_list,
+        save_changes=save_changes,
+        on_progress=progress.on_item if progress else None,
+        use_cache=None if use_cache else False
+    )
+    return bulk_summary(results)
+
+
+@mcp.tool()
+async def bulk_optimize_seo(
+    post_ids: Optional[str] = None,
+    categories: Optional[str] = None,
+    status: str = "publish",
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: Optional[int] = None,
+    target_keywords: Optional[str] = None,
+    save_changes: bool = False,
+    use_cache: bool = True,
+    background: bool = False,
+    batch: bool = False,
+    site: Optional[str] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Optimize many posts for SEO, selected by IDs or by a filter.
+    
+    Args:
+        post_ids: Comma-separated post IDs (overrides the filter below)
+        categories: Comma-separated category IDs, slugs or names to filter by
+        status: Post status to filter by (default: publish)
+        after: Only posts published after this ISO 8601 date
+        before: Only posts published before this ISO 8601 date
+        limit: Process at most this many posts
+        target_keywords: Comma-separated target keywords for SEO
+        save_changes: Save optimized titles directly to WordPress (default: false)
+        use_cache: Reuse cached AI results for identical content and options (default: true)
+        background: Run as a background job and return its job ID at once (default: false)
+        batch: Send all prompts through the OpenAI Batch API at batch pricing; results
+            can take hours, so this always runs as a background job (default: false)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Counts plus one result per post, in order: optimized title, meta
+        description and suggestions, or the error message; with background,
+        the job status
+    
+    Posts are fetched, optimized and saved concurrently, within separate
+    WordPress and OpenAI concurrency limits; progress is reported per post.
+    """
+    ids = await select_posts(post_ids, categories, status, after, before, limit, site=site)
+    keyword_list = [k.strip() for k in target_keywords.split(',')] if target_keywords else None
+    if background or batch:
+        return await queue_job("optimize_seo_batch" if batch else "optimize_seo", {
+            "post_ids": ids,
+            "target_keywords": keyword_list,
+            "save_changes": save_changes,
+            "use_cache": None if use_cache else False
+        }, site=site)
+    progress = ItemProgress(ctx, "Optimizing posts") if ctx else None
+    
+    results = await get_post_service(site).bulk_optimize_seo(
+        ids,
+        target_keywords=keyword_list,
+        save_changes=save_changes,
+        on_progress=progress.on_item if progress else None,
+        use_cache=None if use_cache else False
+    )
+    return bulk_summary(results)
+
+
+# ============================================================================
+# Background Jobs
+# ============================================================================
+
+@mcp.tool()
+async def submit_job(kind: str, params: str, site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Queue a long-running operation as a background job.
+    
+    Args:
+        kind: generate_post, improve_posts, optimize_seo or optimize_seo_batch (OpenAI Batch API)
+        params: JSON object with the job's items - "topics" (list) for generate_post,
+            "post_ids" (list) for the others - plus the options of the matching tool
+            (e.g. tone, length; improvements, save_changes; target_keywords)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Job status with job_id; poll with get_job_status
+    
+    Jobs survive server restarts and resume from the first unfinished item.
+    """
+    import json
+    
+    return await queue_job(kind, json.loads(params), site=site)
+
+
+@mcp.tool()
+async def get_job_status(job_id: str) -> Dict[str, Any]:
+    """
+    Get the state and progress of a background job.
+    
+    Args:
+        job_id: ID returned when the job was queued
+    
+    Returns:
+        State (queued, running, completed, failed, cancelled), item counts and progress
+    """
+    status = await run_blocking(job_runner().store.status, job_id)
+    if status is None:
+        raise ValueError(f"Unknown job: {job_id}")
+    return status
+
+
+@mcp.tool()
+async def get_job_results(job_id: str, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+    """
+    Get the finished item results of a background job, also while it runs.
+    
+    Args:
+        job_id: ID returned when the job was queued
+        offset: Number of finished items to skip (default: 0)
+        limit: Maximum number of results to return (default: 50)
+    
+    Returns:
+        Job status plus one result per finished item, in item order
+    """
+    status = await get_job_status(job_id)
+    results = await run_blocking(job_runner().store.results, job_id, offset=offset, limit=limit)
+    return {**status, "results": results}
+
+
+@mcp.tool()
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a queued or running background job. Finished items keep their results.
+    
+    Args:
+        job_id: ID returned when the job was queued
+    
+    Returns:
+        Whether the job was cancelled, and its status
+    """
+    cancelled = await run_blocking(job_runner().cancel, job_id)
+    return {"cancelled": cancelled, **(await get_job_status(job_id))}
+
+
 # ============================================================================
 # Utility Tools
 # ============================================================================
 
 @mcp.tool()
-def get_categories() -> List[Dict[str, Any]]:
+async def get_categories(site: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Get all WordPress categories.
     
+    Args:
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
     Returns:
         List of categories with id, name, slug, and count
     """
-    categories = wp_client.get_categories()
+    categories = await get_post_service(site).get_terms("categories")
     return [
         {
             "id": cat["id"],
             "name": cat["name"],
-            "slug": cat["slug"],
-            "count": cat["count"]
+            "slug": cat.get("slug"),
+            "count": cat.get("count", 0)
         }
         for cat in categories
     ]
 
 
 @mcp.tool()
-def get_tags() -> List[Dict[str, Any]]:
+async def get_tags(site: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Get all WordPress tags.
     
+    Args:
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
     Returns:
         List of tags with id, name, slug, and count
     """
-    tags = wp_client.get_tags()
+    tags = await get_post_service(site).get_terms("tags")
     return [
         {
             "id": tag["id"],
             "name": tag["name"],
-            "slug": tag["slug"],
-            "count": tag["count"]
+            "slug": tag.get("slug"),
+            "count": tag.get("count", 0)
         }
         for tag in tags
     ]
 
 
 @mcp.tool()
-def search_posts(
+async def search_posts(
     query: str,
-    search_in: Optional[str] = "title,content"
+    search_in: Optional[str] = "title,content",
+    per_page: int = 20,
+    page: int = 1,
+    site: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Search for posts by keyword.
@@ -389,47 +905,122 @@ def search_posts(
     Args:
         query: Search query
         search_in: Comma-separated list of fields to search in - title, content, excerpt (default: title,content)
+        per_page: Number of results per page (default: 20)
+        page: Page number (default: 1)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
     
     Returns:
-        List of matching posts with id, title, excerpt, and link
+        List of matching posts with id, title, excerpt, and link; best match first
+        with score and snippet when served from the local search index
     """
     search_columns = [s.strip() for s in search_in.split(',')] if search_in else None
     
-    return post_service.search_posts(
+    return await get_post_service(site).search_posts(
         query=query,
-        search_in=search_columns
+        search_in=search_columns,
+        per_page=per_page,
+        page=page
     )
 
 
+@mcp.tool()
+async def sync_site_mirror(full: bool = False, site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Sync the local mirror of posts, categories and tags with WordPress.
+    
+    Args:
+        full: Reload everything instead of fetching only posts modified since the last sync (default: False)
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Sync mode, posts fetched and deleted, mirrored post count and duration
+    """
+    return await get_post_service(site).sync_mirror(full=full)
+
+
+@mcp.tool()
+async def list_sites() -> Dict[str, Any]:
+    """
+    List the WordPress sites this server manages.
+    
+    Returns:
+        Site names with their URLs, the default site (used when a tool gets no site),
+        and the sites that currently hold an open client
+    """
+    registry = get_site_registry()
+    return {
+        **registry.stats(),
+        "urls": {name: config.url for name, config in sorted(registry.sites.items())}
+    }
+
+
+@mcp.tool()
+async def get_cache_stats(site: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get hit/miss statistics for the server's caches.
+    
+    Args:
+        site: Site name (default: DEFAULT_SITE; see list_sites)
+    
+    Returns:
+        Counters and sizes for the AI response cache, the post cache, the outline cache and the site mirror
+    """
+    llm_cache = get_llm_cache()
+    service = get_post_service(site).post_service
+    mirror = service.mirror
+    return {
+        "llm_cache": llm_cache.stats() if llm_cache else {"enabled": False},
+        "post_cache": service.post_cache.stats(),
+        "outline_cache": service.outlines.stats(),
+        "site_mirror": mirror.stats() if mirror else {"enabled": False}
+    }
+
+
 # ============================================================================
-# Health Check Endpoint
+# Health Check and Metrics Endpoints
 # ============================================================================
 
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+def collect_cache_metrics() -> None:
+    """Derive each cache's hit ratio from its lookup counters before a scrape."""
+    for cache, results in CACHE_RESULTS.items():
+        counts = {result: CACHE_LOOKUPS.labels(cache, result).value for result in results}
+        lookups = sum(counts.values())
+        hits = lookups - counts["misses"]
+        CACHE_HIT_RATIO.labels(cache).set(round(hits / lookups, 3) if lookups else 0.0)
+
+
+REGISTRY.on_collect(collect_cache_metrics)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus metrics for tools, WordPress, OpenAI and the caches."""
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request) -> JSONResponse:
-    """Health check endpoint for Railway monitoring."""
-    try:
-        # Test WordPress connection
-        wp_client.get_posts(per_page=1)
-        return JSONResponse({
-            "status": "healthy",
-            "service": "wordpress-content-mcp",
-            "wordpress_url": settings.WORDPRESS_URL,
-            "connected": True
-        })
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return JSONResponse(
-            {
-                "status": "unhealthy",
-                "service": "wordpress-content-mcp",
-                "error": str(e)
-            },
-            status_code=503
-        )
+    """Liveness for Railway: the cached probe results, 503 only if probing has stopped.
+    
+    WordPress and OpenAI are checked by the background prober, so this
+    never waits on either of them.
+    """
+    prober = get_health_prober()
+    return JSONResponse(
+        {"service": "wordpress-content-mcp", **prober.snapshot()},
+        status_code=200 if prober.alive else 503
+    )
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def readiness_check(request: Request) -> JSONResponse:
+    """Readiness: 200 once the last probe round reached WordPress (for at least one site)."""
+    snapshot = get_health_prober().snapshot()
+    return JSONResponse(
+        {"service": "wordpress-content-mcp", **snapshot},
+        status_code=200 if snapshot["ready"] else 503
+    )
+
 
 @mcp.custom_route("/", methods=["GET"])
 async def root(request: Request) -> JSONResponse:
@@ -438,25 +1029,80 @@ async def root(request: Request) -> JSONResponse:
         "name": "WordPress Content Management MCP Server",
         "version": "1.0.0",
         "status": "running",
-        "wordpress_url": settings.WORDPRESS_URL,
+        "sites": get_site_registry().stats()["sites"],
         "mcp_endpoint": "/mcp/",
-        "health_endpoint": "/health"
+        "health_endpoint": "/health",
+        "ready_endpoint": "/ready",
+        "metrics_endpoint": "/metrics"
     })
 
 
+# ============================================================================
+# Startup
+# ============================================================================
+
+def warm_up() -> None:
+    """Build the default site's services and open a pooled WordPress connection.
+    
+    The OpenAI client is left to the first AI call: importing openai holds
+    the GIL for most of a second, which would delay early tool calls.
+    """
+    started = time.perf_counter()
+    try:
+        get_site_registry().post_service().wp_client.get_posts(per_page=1, fields=["id"])
+        logger.info(f"Warmup finished in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        logger.warning(f"Warmup failed (first tool call will retry): {e}")
+
+
+def wait_for_port(port: int, timeout: float = 60.0) -> bool:
+    """Wait until something accepts connections on ``port`` locally."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def start_background_startup(port: Optional[int] = None) -> threading.Thread:
+    """Probe health, resume jobs and warm up on a background thread, after ``port`` is bound."""
+    def run() -> None:
+        if port is not None:
+            if not wait_for_port(port):
+                logger.warning(f"Port {port} did not open; starting background work anyway")
+            # Only the HTTP transport serves /health and /ready
+            get_health_prober().start()
+        # Resume jobs interrupted by a previous shutdown
+        job_runner().start()
+        if settings.STARTUP_WARMUP:
+            warm_up()
+    
+    thread = threading.Thread(target=run, name="startup", daemon=True)
+    thread.start()
+    return thread
+
+
 # ============================================================================
 # Run Server
 # ============================================================================
 
 if __name__ == "__main__":
+    import asyncio
     import os
     
     logger.info("Starting WordPress Content Management MCP Server...")
-    logger.info(f"Connected to: {settings.WORDPRESS_URL}")
-    logger.info("Available tools: 12")
+    logger.info(f"Sites: {', '.join(get_site_registry().stats()['sites'])}")
+    
+    tools = asyncio.run(mcp.list_tools(run_middleware=False))
+    precreate_tool_metrics(tool.name for tool in tools)
+    logger.info(f"Available tools: {len(tools)}")
     
     # Check if running in production (Railway sets PORT env var)
     port = os.getenv("PORT")
+    start_background_startup(int(port) if port else None)
     
     if port:
         # Production mode: HTTP transport for Railway
@@ -0,0 +1,223 @@
+"""Retry, circuit breaking and adaptive concurrency for the WordPress client."""
+
+import email.utils
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Methods that can be safely repeated without side effects beyond the first call.
+# DELETE is left out: a retried trash that already went through answers 410.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT"})
+
+# Status codes that indicate a transient problem on the WordPress host
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter for the given (0-based) attempt."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class SlotTimeoutError(TimeoutError):
+    """No local concurrency slot freed up in time; the host was never contacted."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+    
+    def retry_in(self) -> float:
+        """Seconds until the breaker will let a probe through."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+    
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: let exactly one probe through
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+    
+    def release_probe(self) -> None:
+        """Give back a half-open probe that was never sent."""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit closed after successful probe")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self._failures} consecutive failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+
+class AIMDLimiter:
+    """Additive-increase/multiplicative-decrease limit on in-flight requests.
+    
+    The limit grows by roughly one per window of successful, fast requests and
+    is cut by ``decrease_factor`` when a request fails with a 5xx/429/timeout or
+    exceeds ``latency_target``. Decreases are spaced by ``cooldown`` so a burst
+    of concurrent failures only halves the limit once.
+    """
+    
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+    
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a free slot and take it; returns False on timeout."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                return False
+            self._in_flight += 1
+            return True
+    
+    def release(self, latency: float, failed: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if failed or latency > self.latency_target:
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._last_decrease = now
+                    logger.warning(f"Concurrency limit decreased to {self.limit}")
+            else:
+                self._limit = min(self.max_limit, self._limit + 1.0 / max(self._limit, 1.0))
+            self._cond.notify_all()
+    
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator["_Slot"]:
+        """Hold a slot for one request and feed its outcome back into the limit."""
+        if not self.acquire(timeout):
+            raise SlotTimeoutError("Timed out waiting for a WordPress request slot")
+        slot = _Slot()
+        start = time.monotonic()
+        try:
+            yield slot
+        except BaseException:
+            slot.failed = True
+            raise
+        finally:
+            self.release(time.monotonic() - start, slot.failed)
+
+
+class _Slot:
+    """Outcome of a request made under an ``AIMDLimiter`` slot."""
+    
+    __slots__ = ("failed",)
+    
+    def __init__(self):
+        self.failed = False
+
+
+_registry_lock = threading.Lock()
+_breakers: Dict[str, CircuitBreaker] = {}
+_limiters: Dict[str, AIMDLimiter] = {}
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Return the shared circuit breaker for a WordPress host."""
+    with _registry_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(
+                failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=settings.CIRCUIT_RESET_TIMEOUT
+            )
+        return _breakers[host]
+
+
+def get_concurrency_limiter(host: str) -> AIMDLimiter:
+    """Return the shared adaptive concurrency limiter for a WordPress host."""
+    with _registry_lock:
+        if host not in _limiters:
+            _limiters[host] = AIMDLimiter(
+                min_limit=settings.AIMD_MIN_CONCURRENCY,
+                max_limit=settings.AIMD_MAX_CONCURRENCY,
+                latency_target=settings.AIMD_LATENCY_TARGET
+            )
+        return _limiters[host]
@@ -1,34 +1,115 @@
 """WordPress REST API client."""
 
 import requests
+import requests.adapters
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from urllib.parse import urlencode, urlparse
 from requests.auth import HTTPBasicAuth
 from ..config.settings import settings
+from ..config.sites import SiteConfig
+from ..utils.metrics import WP_IN_FLIGHT, endpoint_label, observe_wp_request
+from ..utils.tracing import KIND_CLIENT, bind, current_span, start_span, trace_headers
+from .resilience import (
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUS_CODES,
+    SlotTimeoutError,
+    backoff_delay,
+    get_circuit_breaker,
+    get_concurrency_limiter,
+    parse_retry_after,
+)
 
 logger = logging.getLogger(__name__)
 
+# _embed control: True embeds every linked resource, a list only those relations
+Embed = Optional[Union[bool, List[str]]]
+
+
+def projection_params(fields: Optional[List[str]] = None, embed: Embed = None) -> Dict[str, str]:
+    """Query parameters limiting a response to ``fields`` and embedding ``embed``.
+    
+    WordPress drops embedded resources unless ``_links`` and ``_embedded``
+    survive the ``_fields`` filter, so they are added when embedding.
+    """
+    params: Dict[str, str] = {}
+    if embed:
+        params["_embed"] = "1" if embed is True else ",".join(embed)
+    if fields:
+        if embed:
+            fields = [*fields, "_links", "_embedded"]
+        params["_fields"] = ",".join(dict.fromkeys(fields))
+    return params
+
+
+def _with_query(path: str, params: Dict[str, str]) -> str:
+    """Batch sub-requests carry their query string in the path."""
+    return f"{path}?{urlencode(params)}" if params else path
+
 
 class WordPressAPIError(Exception):
     """Custom exception for WordPress API errors."""
+    
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        data: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.data = data or {}
+
+
+class CircuitOpenError(WordPressAPIError):
+    """Raised without contacting WordPress while the host's circuit is open."""
     pass
 
 
 class WordPressClient:
     """Client for interacting with WordPress REST API."""
     
-    def __init__(self):
-        """Initialize WordPress API client."""
-        self.base_url = settings.get_wordpress_api_url()
-        self.auth = HTTPBasicAuth(
-            settings.WORDPRESS_USERNAME,
-            settings.WORDPRESS_APP_PASSWORD
-        )
+    def __init__(self, site: Optional[SiteConfig] = None):
+        """Initialize WordPress API client for ``site``, or the WORDPRESS_* site."""
+        if site is None:
+            self.site_url = settings.WORDPRESS_URL
+            self.base_url = settings.get_wordpress_api_url()
+            self.auth = HTTPBasicAuth(
+                settings.WORDPRESS_USERNAME,
+                settings.WORDPRESS_APP_PASSWORD
+            )
+        else:
+            self.site_url = site.url
+            self.base_url = site.api_url
+            self.auth = HTTPBasicAuth(site.username, site.app_password)
         self.timeout = settings.REQUEST_TIMEOUT
         self.session = requests.Session()
         self.session.auth = self.auth
         
-        logger.info(f"WordPress client initialized for {settings.WORDPRESS_URL}")
+        # Size the connection pool for concurrent use from worker threads
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.WP_POOL_SIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Resilience state is shared by every client talking to the same host
+        self.host = urlparse(self.base_url).netloc
+        self.circuit_breaker = get_circuit_breaker(self.host)
+        self.limiter = get_concurrency_limiter(self.host)
+        # Whether the site has the REST batch endpoint; None until first used
+        self.batch_supported: Optional[bool] = None
+        
+        logger.info(f"WordPress client initialized for {self.site_url}")
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
     
     def _make_request(
         self,
@@ -38,33 +119,139 @@ class WordPressClient:
         params: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Make HTTP request to WordPress API."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        return self._send(method, endpoint, data=data, params=params).json()
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """Send a request with retries, circuit breaking and adaptive concurrency.
         
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+        Only idempotent methods are retried, on timeouts, connection errors and
+        429/5xx responses, with jittered exponential backoff or the server's
+        Retry-After delay. The request is traced as one client span (retries
+        included) and carries its ``traceparent``.
+        """
+        if endpoint.startswith(("http://", "https://")):
+            url = endpoint
+        else:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        method = method.upper()
         
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"WordPress API error: {e.response.status_code}"
+        with start_span(f"WordPress {method} {endpoint_label(url)}", KIND_CLIENT, **{"http.method": method}) as span:
+            if span is not None:
+                headers = {**(headers or {}), **trace_headers()}
+            response = self._send_with_retries(method, url, data, params, headers)
+            if span is not None:
+                span.set_attribute("http.status_code", response.status_code)
+            return response
+    
+    def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict],
+        params: Optional[Dict],
+        headers: Optional[Dict[str, str]]
+    ) -> requests.Response:
+        attempts = settings.MAX_RETRIES + 1 if method in IDEMPOTENT_METHODS else 1
+        
+        for attempt in range(attempts):
+            if attempt:
+                span = current_span()
+                if span is not None:
+                    span.set_attribute("http.resend_count", attempt)
+            if not self.circuit_breaker.allow_request():
+                error_msg = (
+                    f"WordPress host {self.host} is degraded; "
+                    f"failing fast for {self.circuit_breaker.retry_in():.0f}s"
+                )
+                logger.error(error_msg)
+                raise CircuitOpenError(error_msg)
+            
+            delay = None
+            started = time.perf_counter()
             try:
-                error_data = e.response.json()
-                error_msg += f" - {error_data.get('message', '')}"
-            except:
-                pass
-            logger.error(error_msg)
-            raise WordPressAPIError(error_msg)
-        
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Request failed: {str(e)}"
-            logger.error(error_msg)
-            raise WordPressAPIError(error_msg)
+                with self.limiter.slot(timeout=self.timeout) as slot:
+                    started = time.perf_counter()
+                    WP_IN_FLIGHT.inc()
+                    try:
+                        response = self.session.request(
+                            method=method,
+                            url=url,
+                            json=data,
+                            params=params,
+                            headers=headers,
+                            timeout=self.timeout
+                        )
+                    finally:
+                        WP_IN_FLIGHT.dec()
+                    slot.failed = response.status_code in RETRYABLE_STATUS_CODES
+            
+            except SlotTimeoutError as e:
+                # Local queueing, not a host failure: no breaker failure and no retry
+                self.circuit_breaker.release_probe()
+                error_msg = f"Request failed: {str(e)}"
+                logger.error(error_msg)
+                raise WordPressAPIError(error_msg)
+            
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                observe_wp_request(method, url, "error", started)
+                self.circuit_breaker.record_failure()
+                if attempt + 1 < attempts:
+                    delay = backoff_delay(attempt, settings.RETRY_BACKOFF_BASE, settings.RETRY_BACKOFF_MAX)
+                    logger.warning(f"{method} {url} failed ({e}); retrying in {delay:.2f}s")
+                    time.sleep(delay)
+                    continue
+                error_msg = f"Request failed: {str(e)}"
+                logger.error(error_msg)
+                raise WordPressAPIError(error_msg)
+            
+            except requests.exceptions.RequestException as e:
+                observe_wp_request(method, url, "error", started)
+                self.circuit_breaker.record_failure()
+                error_msg = f"Request failed: {str(e)}"
+                logger.error(error_msg)
+                raise WordPressAPIError(error_msg)
+            
+            observe_wp_request(method, url, str(response.status_code), started)
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                self.circuit_breaker.record_failure()
+                if attempt + 1 < attempts:
+                    delay = parse_retry_after(response.headers.get("Retry-After"))
+                    if delay is None:
+                        delay = backoff_delay(attempt, settings.RETRY_BACKOFF_BASE, settings.RETRY_BACKOFF_MAX)
+                    if delay <= settings.RETRY_AFTER_MAX:
+                        logger.warning(
+                            f"{method} {url} returned {response.status_code}; retrying in {delay:.2f}s"
+                        )
+                        time.sleep(delay)
+                        continue
+            else:
+                self.circuit_breaker.record_success()
+            
+            try:
+                response.raise_for_status()
+                return response
+            
+            except requests.exceptions.HTTPError as e:
+                error_msg = f"WordPress API error: {e.response.status_code}"
+                error_data = None
+                try:
+                    error_data = e.response.json()
+                    error_msg += f" - {error_data.get('message', '')}"
+                except:
+                    pass
+                logger.error(error_msg)
+                raise WordPressAPIError(
+                    error_msg,
+                    status_code=e.response.status_code,
+                    data=error_data if isinstance(error_data, dict) else None
+                )
     
     # Posts endpoints
     
@@ -74,13 +261,19 @@ class WordPressClient:
         page: int = 1,
         status: str = "publish",
         search: Optional[str] = None,
-        categories: Optional[List[int]] = None
+        categories: Optional[List[int]] = None,
+        modified_after: Optional[str] = None,
+        orderby: Optional[str] = None,
+        order: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        embed: Embed = None
     ) -> List[Dict[str, Any]]:
         """Get list of posts."""
         params = {
             "per_page": per_page,
             "page": page,
-            "status": status
+            "status": status,
+            **projection_params(fields, embed)
         }
         
         if search:
@@ -89,34 +282,313 @@ class WordPressClient:
         if categories:
             params["categories"] = ",".join(map(str, categories))
         
+        if modified_after:
+            params["modified_after"] = modified_after
+        
+        if orderby:
+            params["orderby"] = orderby
+        
+        if order:
+            params["order"] = order
+        
         return self._make_request("GET", "posts", params=params)
     
-    def get_post(self, post_id: int) -> Dict[str, Any]:
-        """Get a specific post by ID."""
-        return self._make_request("GET", f"posts/{post_id}")
+    def get_post_ids(self, status: str = "any") -> List[int]:
+        """Get the IDs of every post, fetching only the id field."""
+        return [post["id"] for post in self.iter_posts(status=status, fields=["id"])]
     
-    def create_post(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def iter_posts(
+        self,
+        status: str = "publish",
+        search: Optional[str] = None,
+        categories: Optional[List[int]] = None,
+        modified_after: Optional[str] = None,
+        orderby: Optional[str] = None,
+        order: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        embed: Embed = None,
+        per_page: int = 100,
+        after: Optional[str] = None,
+        before: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every matching post, fetching pages concurrently.
+        
+        ``after`` and ``before`` bound the publish date (ISO 8601). Pages
+        arrive in completion order, so posts are not yielded in ``orderby``
+        order across page boundaries.
+        """
+        params: Dict[str, Any] = {"status": status, **projection_params(fields, embed)}
+        if search:
+            params["search"] = search
+        if categories:
+            params["categories"] = ",".join(map(str, categories))
+        if modified_after:
+            params["modified_after"] = modified_after
+        if after:
+            params["after"] = after
+        if before:
+            params["before"] = before
+        if orderby:
+            params["orderby"] = orderby
+        if order:
+            params["order"] = order
+        
+        for items in self._iter_pages("posts", params, per_page):
+            yield from items
+    
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        per_page: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each page of a collection endpoint.
+        
+        The first page's X-WP-TotalPages header gives the page count; the
+        remaining pages are fetched on a pool of ``PAGINATION_CONCURRENCY``
+        threads, with at most that many requests in flight, and yielded as
+        they complete.
+        """
+        first = self._send("GET", endpoint, params={**params, "per_page": per_page, "page": 1})
+        yield first.json()
+        
+        total_pages = int(first.headers.get("X-WP-TotalPages") or 1)
+        if total_pages <= 1:
+            return
+        
+        def fetch(page: int) -> List[Dict[str, Any]]:
+            return self._make_request("GET", endpoint, params={**params, "per_page": per_page, "page": page})
+        
+        workers = min(settings.PAGINATION_CONCURRENCY, total_pages - 1)
+        remaining = iter(range(2, total_pages + 1))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wp-pages")
+        in_flight = set()
+        try:
+            for page in itertools.islice(remaining, workers):
+                in_flight.add(pool.submit(bind(fetch), page))
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    items = future.result()
+                    next_page = next(remaining, None)
+                    if next_page is not None:
+                        in_flight.add(pool.submit(bind(fetch), next_page))
+                    yield items
+        finally:
+            # A consumer that stops early must not leave queued fetches behind
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def get_post(
+        self,
+        post_id: int,
+        fields: Optional[List[str]] = None,
+        embed: Embed = None,
+        context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get a specific post by ID; ``context="edit"`` adds the raw title, content and excerpt."""
+        params = projection_params(fields, embed)
+        if context:
+            params["context"] = context
+        return self._make_request("GET", f"posts/{post_id}", params=params or None)
+    
+    def get_post_conditional(
+        self,
+        post_id: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """Get a post unless the server reports it unchanged.
+        
+        Returns the post data (None on 304 Not Modified) and any ETag /
+        Last-Modified validators from the response.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        response = self._send(
+            "GET",
+            f"posts/{post_id}",
+            params=projection_params(fields) or None,
+            headers=headers or None
+        )
+        validators = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if name in response.headers
+        }
+        if response.status_code == 304:
+            return None, validators
+        return response.json(), validators
+    
+    def get_post_modified(self, post_id: int) -> Optional[str]:
+        """Get only a post's modified_gmt timestamp (cheap change probe)."""
+        data = self._make_request("GET", f"posts/{post_id}", params={"_fields": "id,modified_gmt"})
+        return data.get("modified_gmt")
+    
+    def create_post(self, data: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Create a new post."""
-        return self._make_request("POST", "posts", data=data)
+        return self._make_request("POST", "posts", data=data, params=projection_params(fields) or None)
     
-    def update_post(self, post_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_post(
+        self,
+        post_id: int,
+        data: Dict[str, Any],
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """Update an existing post."""
-        return self._make_request("POST", f"posts/{post_id}", data=data)
+        return self._make_request(
+            "POST",
+            f"posts/{post_id}",
+            data=data,
+            params=projection_params(fields) or None
+        )
     
     def delete_post(self, post_id: int, force: bool = False) -> Dict[str, Any]:
         """Delete a post."""
         params = {"force": force}
         return self._make_request("DELETE", f"posts/{post_id}", params=params)
     
+    def bulk_create_posts(
+        self,
+        posts: List[Dict[str, Any]],
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Create several posts; returns one ``{"status", "body"}`` per post, in order."""
+        path = _with_query("/wp/v2/posts", projection_params(fields))
+        return self.bulk([{"method": "POST", "path": path, "body": data} for data in posts])
+    
+    def bulk_update_posts(
+        self,
+        updates: List[Tuple[int, Dict[str, Any]]],
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Apply ``(post_id, data)`` updates; returns one ``{"status", "body"}`` per update, in order."""
+        params = projection_params(fields)
+        return self.bulk([
+            {"method": "POST", "path": _with_query(f"/wp/v2/posts/{post_id}", params), "body": data}
+            for post_id, data in updates
+        ])
+    
+    def bulk_delete_posts(self, post_ids: List[int], force: bool = False) -> List[Dict[str, Any]]:
+        """Trash (or with ``force`` delete) several posts; one ``{"status", "body"}`` per post."""
+        params = {"force": "true"} if force else {}
+        return self.bulk([
+            {"method": "DELETE", "path": _with_query(f"/wp/v2/posts/{post_id}", params)}
+            for post_id in post_ids
+        ])
+    
     # Categories and Tags
     
-    def get_categories(self) -> List[Dict[str, Any]]:
+    def get_categories(self, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get all categories."""
-        return self._make_request("GET", "categories", params={"per_page": 100})
+        return list(self.iter_terms("categories", fields=fields))
     
-    def get_tags(self) -> List[Dict[str, Any]]:
+    def get_tags(self, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get all tags."""
-        return self._make_request("GET", "tags", params={"per_page": 100})
+        return list(self.iter_terms("tags", fields=fields))
+    
+    def create_terms(self, taxonomy: str, names: List[str]) -> List[Dict[str, Any]]:
+        """Create terms in a taxonomy (categories or tags), in batch requests.
+        
+        Goes through ``bulk``, so sites without the batch endpoint get one
+        request per term. A term that already exists
+        is returned as ``{"id", "name"}`` from WordPress' term_exists error.
+        Results are in the order of ``names``.
+        """
+        responses = self.bulk([
+            {"method": "POST", "path": f"/wp/v2/{taxonomy}", "body": {"name": name}}
+            for name in names
+        ])
+        
+        terms = []
+        for name, response in zip(names, responses):
+            body = response.get("body") or {}
+            if response.get("status", 500) < 300:
+                terms.append(body)
+            elif body.get("code") == "term_exists":
+                terms.append({"id": body["data"]["term_id"], "name": name})
+            else:
+                raise WordPressAPIError(
+                    f"Could not create {taxonomy} term '{name}': {body.get('message', '')}",
+                    status_code=response.get("status"),
+                    data=body
+                )
+        return terms
+    
+    def iter_terms(
+        self,
+        taxonomy: str,
+        fields: Optional[List[str]] = None,
+        per_page: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every term of a taxonomy endpoint (categories or tags), fetching pages concurrently."""
+        for items in self._iter_pages(taxonomy, projection_params(fields), per_page):
+            yield from items
+    
+    # Batch
+    
+    @property
+    def batch_url(self) -> str:
+        """URL of the REST batch endpoint (WordPress 5.6+)."""
+        return f"{self.base_url.rsplit('/wp/v2', 1)[0]}/batch/v1"
+    
+    def batch(self, requests_: List[Dict[str, Any]], chunk_size: int = 25) -> List[Dict[str, Any]]:
+        """Send sub-requests through the batch endpoint, ``chunk_size`` per call.
+        
+        Each sub-request is ``{"method", "path", "body"}`` with a path like
+        ``/wp/v2/posts``. Returns one ``{"status", "body", ...}`` response per
+        sub-request, in order.
+        """
+        responses: List[Dict[str, Any]] = []
+        for start in range(0, len(requests_), chunk_size):
+            chunk = requests_[start:start + chunk_size]
+            result = self._make_request(
+                "POST",
+                self.batch_url,
+                data={"validation": "normal", "requests": chunk}
+            )
+            responses.extend(result.get("responses", []))
+        return responses
+    
+    def bulk(self, requests_: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run sub-requests through ``batch``, or one by one if the site lacks it.
+        
+        Without the batch endpoint (a 404, remembered for the client's
+        lifetime) the sub-requests are sent individually on
+        ``BULK_CONCURRENCY`` threads. Either way every sub-request gets its
+        own ``{"status", "body"}`` response, in order; a failed item does not
+        raise.
+        """
+        if not requests_:
+            return []
+        if self.batch_supported is not False:
+            try:
+                responses = self.batch(requests_)
+                self.batch_supported = True
+                return responses
+            except WordPressAPIError as e:
+                if e.status_code != 404:
+                    raise
+                logger.info("Batch endpoint unavailable; sending bulk requests one by one")
+                self.batch_supported = False
+        
+        root = self.base_url.rsplit('/wp/v2', 1)[0]
+        
+        def send(request: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                response = self._send(request["method"], f"{root}{request['path']}", data=request.get("body"))
+                return {"status": response.status_code, "body": response.json()}
+            except WordPressAPIError as e:
+                return {"status": e.status_code or 500, "body": e.data or {"message": str(e)}}
+        
+        workers = min(settings.BULK_CONCURRENCY, len(requests_))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wp-bulk") as pool:
+            futures = [pool.submit(bind(send), request) for request in requests_]
+            return [future.result() for future in futures]
     
     # Media
     
@@ -142,16 +614,46 @@ class WordPressClient:
     def search_posts(
         self,
         query: str,
-        search_columns: Optional[List[str]] = None
+        search_columns: Optional[List[str]] = None,
+        per_page: int = 20,
+        page: int = 1,
+        fields: Optional[List[str]] = None,
+        embed: Embed = None
     ) -> List[Dict[str, Any]]:
-        """Search for posts."""
+        """Search for posts.
+        
+        ``search_columns`` takes title, content and/or excerpt and is sent as
+        the comma-separated post_* column list WordPress expects.
+        """
         params = {
             "search": query,
-            "per_page": 20
+            "per_page": per_page,
+            "page": page,
+            **projection_params(fields, embed)
         }
         
         if search_columns:
-            params["search_columns"] = search_columns
+            params["search_columns"] = ",".join(
+                column if column.startswith("post_") else f"post_{column}"
+                for column in search_columns
+            )
         
         return self._make_request("GET", "posts", params=params)
 
+
+_client: Optional[WordPressClient] = None
+_client_lock = threading.Lock()
+
+
+def get_wordpress_client() -> WordPressClient:
+    """Return the process-wide WordPress client, creating it on first use.
+    
+    Services built without an explicit client share it, so the whole
+    process talks to WordPress over one pooled session.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = WordPressClient()
+    return _client
@@ -17,8 +17,78 @@ class Settings:
     WORDPRESS_USERNAME: str = os.getenv("WORDPRESS_USERNAME", "")
     WORDPRESS_APP_PASSWORD: str = os.getenv("WORDPRESS_APP_PASSWORD", "")
     
+    # Multiple sites: JSON file of named sites (see src/config/sites.py).
+    # The WORDPRESS_* site above is added as DEFAULT_SITE, which tools use
+    # when no site is given; at most MAX_ACTIVE_SITES sites keep a client
+    SITES_FILE: str = os.getenv("SITES_FILE", "")
+    DEFAULT_SITE: str = os.getenv("DEFAULT_SITE", "default")
+    MAX_ACTIVE_SITES: int = int(os.getenv("MAX_ACTIVE_SITES", "10"))
+    
     # OpenAI Configuration
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")
+    
+    # Blog post generation pipeline: sequential, parallel or single
+    GENERATION_MODE: str = os.getenv("GENERATION_MODE", "sequential")
+    
+    # LLM Response Cache
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3")
+    LLM_CACHE_TTL: int = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+    LLM_CACHE_MEMORY_ENTRIES: int = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "256"))
+    LLM_CACHE_DISK_ENTRIES: int = int(os.getenv("LLM_CACHE_DISK_ENTRIES", "5000"))
+    # Calls above this temperature are only cached when explicitly requested
+    LLM_CACHE_MAX_TEMPERATURE: float = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.5"))
+    
+    # Single-post cache: entries are served as-is for POST_CACHE_TTL seconds,
+    # then revalidated against WordPress before reuse
+    POST_CACHE_TTL: float = float(os.getenv("POST_CACHE_TTL", "30"))
+    POST_CACHE_MAX_ENTRIES: int = int(os.getenv("POST_CACHE_MAX_ENTRIES", "500"))
+    # Section outlines of post content, keyed by content hash and shared by all sites
+    OUTLINE_CACHE_MAX_ENTRIES: int = int(os.getenv("OUTLINE_CACHE_MAX_ENTRIES", "500"))
+    
+    # Local SQLite mirror of posts/categories/tags; reads are served from it
+    # when it was synced within MIRROR_MAX_STALENESS seconds
+    MIRROR_ENABLED: bool = os.getenv("MIRROR_ENABLED", "false").lower() == "true"
+    MIRROR_PATH: str = os.getenv("MIRROR_PATH", ".cache/site_mirror.sqlite3")
+    MIRROR_MAX_STALENESS: float = float(os.getenv("MIRROR_MAX_STALENESS", "300"))
+    MIRROR_TOMBSTONE_INTERVAL: float = float(os.getenv("MIRROR_TOMBSTONE_INTERVAL", "3600"))
+    
+    # Background Jobs (queue of long-running tool calls, resumed after restarts)
+    JOBS_PATH: str = os.getenv("JOBS_PATH", ".cache/jobs.sqlite3")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    
+    # OpenAI Batch API (bulk SEO runs with batch=true)
+    BATCH_DIR: str = os.getenv("BATCH_DIR", ".cache/batches")
+    BATCH_POLL_INTERVAL: float = float(os.getenv("BATCH_POLL_INTERVAL", "30"))
+    BATCH_COMPLETION_WINDOW: str = os.getenv("BATCH_COMPLETION_WINDOW", "24h")
+    
+    # Seconds before the category/tag index is reloaded in the background
+    TAXONOMY_REFRESH_INTERVAL: float = float(os.getenv("TAXONOMY_REFRESH_INTERVAL", "300"))
+    
+    # Tracing: export spans as OTLP/HTTP JSON ("otlp"), to a JSONL file
+    # ("json") or not at all ("none"); tool calls slower than
+    # TRACE_SLOW_THRESHOLD seconds are logged with their span tree (0 = off)
+    TRACE_EXPORTER: str = os.getenv("TRACE_EXPORTER", "none")
+    TRACE_FILE: str = os.getenv("TRACE_FILE", ".cache/traces.jsonl")
+    OTLP_ENDPOINT: str = os.getenv("OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+    TRACE_SERVICE_NAME: str = os.getenv("TRACE_SERVICE_NAME", "wordpress-content-mcp")
+    TRACE_SLOW_THRESHOLD: float = float(os.getenv("TRACE_SLOW_THRESHOLD", "10"))
+    
+    # Build the services and open a WordPress connection in the background
+    # once the server is listening, instead of on the first tool call
+    STARTUP_WARMUP: bool = os.getenv("STARTUP_WARMUP", "true").lower() == "true"
+    
+    # Background health probes behind /health and /ready: a dependency is
+    # degraded while failing or slower than HEALTH_SLOW_THRESHOLD seconds,
+    # and down after HEALTH_FAILURE_THRESHOLD failed probes in a row
+    HEALTH_PROBE_INTERVAL: float = float(os.getenv("HEALTH_PROBE_INTERVAL", "30"))
+    HEALTH_PROBE_TIMEOUT: float = float(os.getenv("HEALTH_PROBE_TIMEOUT", "5"))
+    HEALTH_FAILURE_THRESHOLD: int = int(os.getenv("HEALTH_FAILURE_THRESHOLD", "3"))
+    HEALTH_SLOW_THRESHOLD: float = float(os.getenv("HEALTH_SLOW_THRESHOLD", "2"))
+    
+    # Minimum seconds between streamed progress notifications to MCP clients
+    PROGRESS_INTERVAL: float = float(os.getenv("PROGRESS_INTERVAL", "0.5"))
     
     # Default Settings
     DEFAULT_POST_STATUS: str = os.getenv("DEFAULT_POST_STATUS", "draft")
@@ -26,11 +96,41 @@ class Settings:
     
     # API Settings
     REQUEST_TIMEOUT: int = 30
-    MAX_RETRIES: int = 3
+    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    RETRY_BACKOFF_BASE: float = float(os.getenv("RETRY_BACKOFF_BASE", "0.5"))
+    RETRY_BACKOFF_MAX: float = float(os.getenv("RETRY_BACKOFF_MAX", "10"))
+    RETRY_AFTER_MAX: float = float(os.getenv("RETRY_AFTER_MAX", "30"))
+    
+    # Circuit Breaker and Adaptive Concurrency (per WordPress host)
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_TIMEOUT: float = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+    AIMD_MIN_CONCURRENCY: int = int(os.getenv("AIMD_MIN_CONCURRENCY", "1"))
+    AIMD_MAX_CONCURRENCY: int = int(os.getenv("AIMD_MAX_CONCURRENCY", "16"))
+    AIMD_LATENCY_TARGET: float = float(os.getenv("AIMD_LATENCY_TARGET", "5"))
+    
+    # Concurrency Settings
+    WP_POOL_SIZE: int = int(os.getenv("WP_POOL_SIZE", "32"))
+    BLOCKING_POOL_SIZE: int = int(os.getenv("BLOCKING_POOL_SIZE", "32"))
+    # Parallel page fetches per paginated listing (iter_posts / iter_terms)
+    PAGINATION_CONCURRENCY: int = int(os.getenv("PAGINATION_CONCURRENCY", "4"))
+    # Parallel requests per bulk write on sites without the REST batch endpoint
+    BULK_CONCURRENCY: int = int(os.getenv("BULK_CONCURRENCY", "4"))
+    # Posts in each stage of a bulk AI run: WordPress fetch/save and AI calls
+    PIPELINE_WP_CONCURRENCY: int = int(os.getenv("PIPELINE_WP_CONCURRENCY", "4"))
+    PIPELINE_AI_CONCURRENCY: int = int(os.getenv("PIPELINE_AI_CONCURRENCY", "4"))
+    # Posts of at least IMPROVE_SECTION_MIN_CHARS characters are improved
+    # one <h2> section per call, IMPROVE_SECTION_CONCURRENCY calls at a time
+    IMPROVE_SECTION_MIN_CHARS: int = int(os.getenv("IMPROVE_SECTION_MIN_CHARS", "12000"))
+    IMPROVE_SECTION_CONCURRENCY: int = int(os.getenv("IMPROVE_SECTION_CONCURRENCY", "6"))
     
     @classmethod
     def validate(cls) -> bool:
-        """Validate that required settings are present."""
+        """Validate that required settings are present: a sites file or one site."""
+        return bool(cls.SITES_FILE) or cls.validate_wordpress()
+    
+    @classmethod
+    def validate_wordpress(cls) -> bool:
+        """Whether the single-site WORDPRESS_* settings are complete."""
         required = [
             cls.WORDPRESS_URL,
             cls.WORDPRESS_USERNAME,
@@ -0,0 +1,74 @@
+"""WordPress sites served by one process, loaded from SITES_FILE."""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, NamedTuple
+from .settings import settings
+
+# Site names appear in tool arguments and file names
+_SITE_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+class SiteConfig(NamedTuple):
+    """Address and Application Password credentials of one WordPress site."""
+    name: str
+    url: str
+    username: str
+    app_password: str
+    
+    @property
+    def api_url(self) -> str:
+        """WordPress REST API base URL."""
+        return f"{self.url.rstrip('/')}/wp-json/wp/v2"
+
+
+def _credential(name: str, entry: Dict[str, str], key: str) -> str:
+    """``key`` from the entry, or from the environment variable named by ``<key>_env``."""
+    if entry.get(f"{key}_env"):
+        value = os.getenv(entry[f"{key}_env"], "")
+        if not value:
+            raise ValueError(f"Site '{name}': environment variable {entry[f'{key}_env']} is not set")
+        return value
+    value = entry.get(key, "")
+    if not value:
+        raise ValueError(f"Site '{name}' is missing '{key}'")
+    return value
+
+
+def load_sites() -> Dict[str, SiteConfig]:
+    """Sites from ``SITES_FILE`` plus the site configured by ``WORDPRESS_URL``.
+    
+    ``SITES_FILE`` is a JSON object mapping site names to ``url``,
+    ``username`` and ``app_password``; each value can instead be read from
+    an environment variable named by ``url_env``, ``username_env`` or
+    ``app_password_env``, so the file itself holds no secrets. The
+    ``WORDPRESS_*`` settings, when complete, add a site named
+    ``DEFAULT_SITE`` unless the file defines that name.
+    """
+    sites: Dict[str, SiteConfig] = {}
+    
+    if settings.SITES_FILE:
+        entries = json.loads(Path(settings.SITES_FILE).read_text(encoding="utf-8"))
+        if not isinstance(entries, dict):
+            raise ValueError(f"{settings.SITES_FILE} must contain a JSON object of sites")
+        for name, entry in entries.items():
+            if not _SITE_NAME.match(name):
+                raise ValueError(f"Invalid site name '{name}': use letters, digits, '.', '_' and '-'")
+            sites[name] = SiteConfig(
+                name=name,
+                url=_credential(name, entry, "url"),
+                username=_credential(name, entry, "username"),
+                app_password=_credential(name, entry, "app_password")
+            )
+    
+    if settings.DEFAULT_SITE not in sites and settings.validate_wordpress():
+        sites[settings.DEFAULT_SITE] = SiteConfig(
+            name=settings.DEFAULT_SITE,
+            url=settings.WORDPRESS_URL,
+            username=settings.WORDPRESS_USERNAME,
+            app_password=settings.WORDPRESS_APP_PASSWORD
+        )
+    
+    return sites
@@ -29,6 +29,13 @@ class PostUpdate(BaseModel):
     featured_media: Optional[int] = Field(None, description="Featured image media ID")
 
 
+# Response fields Post.from_api_response reads (plus modified_gmt for cache revalidation)
+POST_FIELDS = [
+    "id", "title", "content", "excerpt", "status", "slug", "date", "modified",
+    "modified_gmt", "author", "categories", "tags", "featured_media", "link", "acf",
+]
+
+
 class Post(BaseModel):
     """Model for a WordPress post."""
     id: int
@@ -47,17 +54,22 @@ class Post(BaseModel):
     acf: Optional[Dict[str, Any]] = None
     
     @classmethod
-    def from_api_response(cls, data: Dict[str, Any]) -> "Post":
-        """Create Post instance from WordPress API response."""
+    def from_api_response(cls, data: Dict[str, Any], raw: bool = False) -> "Post":
+        """Create Post instance from WordPress API response.
+        
+        With ``raw``, title, content and excerpt are the stored values of a
+        ``context=edit`` response instead of the rendered ones.
+        """
+        text = _raw if raw else _rendered
         return cls(
             id=data["id"],
-            title=data["title"]["rendered"] if isinstance(data["title"], dict) else data["title"],
-            content=data["content"]["rendered"] if isinstance(data["content"], dict) else data["content"],
-            excerpt=data["excerpt"]["rendered"] if isinstance(data["excerpt"], dict) else data.get("excerpt", ""),
+            title=text(data["title"]),
+            content=text(data["content"]),
+            excerpt=text(data.get("excerpt", "")),
             status=data["status"],
             slug=data["slug"],
-            date=datetime.fromisoformat(data["date"].replace("Z", "+00:00")),
-            modified=datetime.fromisoformat(data["modified"].replace("Z", "+00:00")),
+            date=parse_date(data["date"]),
+            modified=parse_date(data["modified"]),
             author=data["author"],
             categories=data.get("categories", []),
             tags=data.get("tags", []),
@@ -65,6 +77,95 @@ class Post(BaseModel):
             link=data["link"],
             acf=data.get("acf")
         )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Tool result for the post, with ISO dates."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "content": self.content,
+            "excerpt": self.excerpt,
+            "status": self.status,
+            "slug": self.slug,
+            "date": self.date.isoformat(),
+            "modified": self.modified.isoformat(),
+            "author": self.author,
+            "categories": self.categories,
+            "tags": self.tags,
+            "featured_media": self.featured_media,
+            "link": self.link,
+            "acf": self.acf
+        }
+
+
+class PostSummary:
+    """One row of a post listing: id, title, status, date, link and excerpt.
+    
+    Listings, search and bulk results build thousands of these, so it is a
+    plain slotted class without validation, and ``date`` is kept as
+    WordPress' string and only parsed when ``date_parsed`` is read.
+    Accepts both the API shape (``{"rendered": ...}``) and flat strings.
+    """
+    __slots__ = ("id", "title", "status", "date", "link", "excerpt", "_date_parsed")
+    
+    def __init__(
+        self,
+        id: int,
+        title: str = "",
+        status: Optional[str] = None,
+        date: Optional[str] = None,
+        link: Optional[str] = None,
+        excerpt: str = ""
+    ):
+        self.id = id
+        self.title = title
+        self.status = status
+        self.date = date
+        self.link = link
+        self.excerpt = excerpt
+        self._date_parsed: Optional[datetime] = None
+    
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> "PostSummary":
+        """Create summary from a (possibly ``_fields``-projected) API response or mirror row."""
+        return cls(
+            data["id"],
+            _rendered(data.get("title", "")),
+            data.get("status"),
+            data.get("date"),
+            data.get("link"),
+            _rendered(data.get("excerpt", ""))
+        )
+    
+    @property
+    def date_parsed(self) -> Optional[datetime]:
+        """``date`` as a datetime, parsed on first access."""
+        if self._date_parsed is None and self.date:
+            self._date_parsed = parse_date(self.date)
+        return self._date_parsed
+    
+    def to_dict(self, fields: List[str]) -> Dict[str, Any]:
+        """Tool result with ``fields`` (dates stay WordPress' strings)."""
+        return {field: getattr(self, field) for field in fields}
+
+
+def parse_date(value: str) -> datetime:
+    """Parse a WordPress date (ISO 8601, possibly with a ``Z`` suffix)."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _rendered(value: Any) -> str:
+    """Rendered text of an API field, which is a dict unless flattened."""
+    if isinstance(value, dict):
+        return value.get("rendered", "")
+    return value or ""
+
+
+def _raw(value: Any) -> str:
+    """Stored text of an API field (``context=edit``), falling back to the rendered text."""
+    if isinstance(value, dict):
+        return value.get("raw", value.get("rendered", ""))
+    return value or ""
 
 
 class ContentGenerationRequest(BaseModel):
@@ -0,0 +1,446 @@
+"""Async service for managing WordPress posts."""
+
+import asyncio
+import json
+import logging
+from typing import List, Optional, Dict, Any, Awaitable, Callable, Tuple, Union
+from ..api.wordpress_client import Embed
+from ..config.settings import settings
+from ..models.post import Post, PostCreate, PostUpdate
+from ..utils.aio import run_blocking
+from ..utils.tracing import traced
+from .content_generator import AsyncContentGenerator, AsyncDeltaCallback
+from .llm_batch import BatchRunner, OpenAIBatchProvider
+from .llm_cache import get_llm_cache
+from .post_service import PostService
+
+logger = logging.getLogger(__name__)
+
+# Called after each post of a bulk run with (completed, total, result)
+ItemCallback = Callable[[int, int, Dict[str, Any]], Awaitable[None]]
+
+
+class AsyncPostService:
+    """Async service for post management operations.
+    
+    WordPress operations run through the wrapped ``PostService`` on the shared
+    worker pool; AI calls go through ``AsyncContentGenerator`` natively.
+    """
+    
+    def __init__(
+        self,
+        post_service: Optional[PostService] = None,
+        content_generator: Optional[AsyncContentGenerator] = None,
+        batch_runner: Optional[BatchRunner] = None
+    ):
+        """Initialize async post service."""
+        self.post_service = post_service or PostService()
+        self.content_generator = content_generator or AsyncContentGenerator()
+        self._batch_runner = batch_runner
+    
+    @property
+    def batch_runner(self) -> BatchRunner:
+        """Batch API runner on the content generator's OpenAI client, created on first use."""
+        if self._batch_runner is None:
+            self._batch_runner = BatchRunner(
+                OpenAIBatchProvider(self.content_generator.client, settings.BATCH_COMPLETION_WINDOW),
+                directory=settings.BATCH_DIR,
+                poll_interval=settings.BATCH_POLL_INTERVAL
+            )
+        return self._batch_runner
+    
+    async def list_posts(
+        self,
+        per_page: int = 10,
+        page: int = 1,
+        status: str = "publish",
+        search: Optional[str] = None,
+        categories: Optional[List[int]] = None,
+        embed: Embed = None
+    ) -> List[Dict[str, Any]]:
+        """List posts with filtering."""
+        return await run_blocking(
+            self.post_service.list_posts,
+            per_page=per_page,
+            page=page,
+            status=status,
+            search=search,
+            categories=categories,
+            embed=embed
+        )
+    
+    async def get_post(self, post_id: int) -> Post:
+        """Get a specific post with full details."""
+        return await run_blocking(self.post_service.get_post, post_id)
+    
+    async def get_post_for_edit(self, post_id: int) -> Post:
+        """Get a post with its stored (unrendered) title, content and excerpt."""
+        return await run_blocking(self.post_service.get_post_for_edit, post_id)
+    
+    async def create_post(self, post_data: PostCreate) -> Post:
+        """Create a new post."""
+        return await run_blocking(self.post_service.create_post, post_data)
+    
+    async def update_post(self, post_id: int, post_data: PostUpdate) -> Post:
+        """Update an existing post."""
+        return await run_blocking(self.post_service.update_post, post_id, post_data)
+    
+    async def save_post_changes(self, post_id: int, post_data: PostUpdate) -> Tuple[Post, Dict[str, Any]]:
+        """Update a post with only the fields that changed; returns the post and diff summary."""
+        return await run_blocking(self.post_service.save_post_changes, post_id, post_data)
+    
+    async def delete_post(self, post_id: int, force: bool = False) -> Dict[str, Any]:
+        """Delete a post."""
+        return await run_blocking(self.post_service.delete_post, post_id, force=force)
+    
+    async def get_outline(self, post_id: int) -> Dict[str, Any]:
+        """Headings, word counts and section IDs of a post."""
+        return await run_blocking(self.post_service.get_outline, post_id)
+    
+    async def get_section(self, post_id: int, section_id: str) -> Dict[str, Any]:
+        """HTML of one section of a post."""
+        return await run_blocking(self.post_service.get_section, post_id, section_id)
+    
+    async def replace_section(self, post_id: int, section_id: str, html: str) -> Dict[str, Any]:
+        """Replace one section of a post."""
+        return await run_blocking(self.post_service.replace_section, post_id, section_id, html)
+    
+    async def bulk_create_posts(self, posts: List[PostCreate]) -> List[Dict[str, Any]]:
+        """Create several posts in batch requests."""
+        return await run_blocking(self.post_service.bulk_create_posts, posts)
+    
+    async def bulk_update_posts(self, updates: List[Tuple[int, PostUpdate]]) -> List[Dict[str, Any]]:
+        """Update several posts in batch requests."""
+        return await run_blocking(self.post_service.bulk_update_posts, updates)
+    
+    async def bulk_delete_posts(self, post_ids: List[int], force: bool = False) -> List[Dict[str, Any]]:
+        """Delete several posts in batch requests."""
+        return await run_blocking(self.post_service.bulk_delete_posts, post_ids, force=force)
+    
+    async def find_post_ids(
+        self,
+        status: str = "publish",
+        categories: Optional[List[int]] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None
+    ) -> List[int]:
+        """IDs of every post matching the filter."""
+        return await run_blocking(
+            self.post_service.find_post_ids,
+            status=status,
+            categories=categories,
+            after=after,
+            before=before
+        )
+    
+    async def get_terms(self, taxonomy: str) -> List[Dict[str, Any]]:
+        """All categories or tags, from the taxonomy index."""
+        return await run_blocking(self.post_service.get_terms, taxonomy)
+    
+    async def resolve_terms(
+        self,
+        taxonomy: str,
+        refs: List[Union[int, str]],
+        create_missing: bool = True
+    ) -> List[int]:
+        """Turn term IDs, slugs or names into IDs, creating missing names in one batch."""
+        return await run_blocking(
+            self.post_service.resolve_terms,
+            taxonomy,
+            refs,
+            create_missing=create_missing
+        )
+    
+    async def sync_mirror(self, full: bool = False) -> Dict[str, Any]:
+        """Sync the local site mirror now."""
+        return await run_blocking(self.post_service.sync_mirror, full=full)
+    
+    async def search_posts(
+        self,
+        query: str,
+        search_in: Optional[List[str]] = None,
+        per_page: int = 20,
+        page: int = 1
+    ) -> List[Dict[str, Any]]:
+        """Search for posts."""
+        return await run_blocking(
+            self.post_service.search_posts,
+            query,
+            search_in=search_in,
+            per_page=per_page,
+            page=page
+        )
+    
+    @traced()
+    async def generate_post(
+        self,
+        topic: str,
+        keywords: Optional[List[str]] = None,
+        tone: str = "professional",
+        length: str = "medium",
+        language: str = "da",
+        save_as_draft: bool = True,
+        mode: Optional[str] = None,
+        on_delta: Optional[AsyncDeltaCallback] = None,
+        use_cache: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Generate a blog post using AI."""
+        try:
+            generated = await self.content_generator.generate_blog_post(
+                topic=topic,
+                keywords=keywords,
+                tone=tone,
+                length=length,
+                language=language,
+                mode=mode,
+                on_delta=on_delta,
+                use_cache=use_cache
+            )
+            
+            return await run_blocking(
+                self.post_service.save_generated_post,
+                generated,
+                save_as_draft
+            )
+        
+        except Exception as e:
+            logger.error(f"Error generating post: {str(e)}")
+            raise
+    
+    @traced()
+    async def improve_post(
+        self,
+        post_id: int,
+        improvements: List[str],
+        save_changes: bool = False,
+        on_delta: Optional[AsyncDeltaCallback] = None,
+        use_cache: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Improve existing post content."""
+        try:
+            post = await self.get_post_for_edit(post_id)
+            
+            improved_content = await self.content_generator.improve_content(
+                content=post.content,
+                improvements=improvements,
+                language="da",  # Could be detected or passed as parameter
+                on_delta=on_delta,
+                use_cache=use_cache,
+                title=post.title
+            )
+            
+            return await run_blocking(
+                self.post_service.apply_improvement,
+                post,
+                improved_content,
+                save_changes
+            )
+        
+        except Exception as e:
+            logger.error(f"Error improving post {post_id}: {str(e)}")
+            raise
+    
+    @traced()
+    async def optimize_post_seo(
+        self,
+        post_id: int,
+        target_keywords: Optional[List[str]] = None,
+        save_changes: bool = False,
+        use_cache: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Optimize post for SEO."""
+        try:
+            post = await self.get_post_for_edit(post_id)
+            
+            seo_data = await self.content_generator.optimize_for_seo(
+                title=post.title,
+                content=post.content,
+                target_keywords=target_keywords,
+                language="da",
+                use_cache=use_cache
+            )
+            
+            return await run_blocking(
+                self.post_service.apply_seo_optimization,
+                post,
+                seo_data,
+                save_changes
+            )
+        
+        except Exception as e:
+            logger.error(f"Error optimizing post {post_id} for SEO: {str(e)}")
+            raise
+    
+    @traced()
+    async def bulk_improve_posts(
+        self,
+        post_ids: List[int],
+        improvements: List[str],
+        save_changes: bool = False,
+        on_progress: Optional[ItemCallback] = None,
+        use_cache: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Improve many posts; one result per post, in order.
+        
+        Results are those of ``improve_post`` without the original content.
+        """
+        async def improve(post: Post) -> str:
+            return await self.content_generator.improve_content(
+                content=post.content,
+                improvements=improvements,
+                language="da",
+                use_cache=use_cache,
+                title=post.title
+            )
+        
+        def apply(post: Post, improved_content: str) -> Dict[str, Any]:
+            result = self.post_service.apply_improvement(post, improved_content, save_changes)
+            result.pop("original_content", None)
+            return result
+        
+        return await self._run_pipeline(post_ids, improve, apply, on_progress)
+    
+    @traced()
+    async def bulk_optimize_seo(
+        self,
+        post_ids: List[int],
+        target_keywords: Optional[List[str]] = None,
+        save_changes: bool = False,
+        on_progress: Optional[ItemCallback] = None,
+        use_cache: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Optimize many posts for SEO; one result per post, in order."""
+        async def optimize(post: Post) -> Dict[str, Any]:
+            return await self.content_generator.optimize_for_seo(
+                title=post.title,
+                content=post.content,
+                target_keywords=target_keywords,
+                language="da",
+                use_cache=use_cache
+            )
+        
+        def apply(post: Post, seo_data: Dict[str, Any]) -> Dict[str, Any]:
+            return self.post_service.apply_seo_optimization(post, seo_data, save_changes)
+        
+        return await self._run_pipeline(post_ids, optimize, apply, on_progress)
+    
+    @traced()
+    async def batch_optimize_seo(
+        self,
+        post_ids: List[int],
+        target_keywords: Optional[List[str]] = None,
+        save_changes: bool = False,
+        on_progress: Optional[ItemCallback] = None,
+        use_cache: Optional[bool] = None,
+        batch_id: Optional[str] = None,
+        on_submitted: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Optimize many posts for SEO through the OpenAI Batch API.
+        
+        All prompts go out as one batch, at batch pricing and outside the
+        realtime rate limits, so results can take up to the completion
+        window. Posts with a cached result skip the batch, and batch results
+        are cached. With ``batch_id`` an earlier submission is awaited
+        instead of submitting again. One result per post, in order.
+        """
+        wp_slots = asyncio.Semaphore(settings.PIPELINE_WP_CONCURRENCY)
+        results: Dict[int, Dict[str, Any]] = {}
+        
+        async def finish(post_id: int, result: Dict[str, Any]) -> None:
+            results[post_id] = result
+            if on_progress:
+                await on_progress(len(results), len(post_ids), result)
+        
+        async def fetch(post_id: int) -> Optional[Post]:
+            try:
+                async with wp_slots:
+                    return await self.get_post_for_edit(post_id)
+            except Exception as e:
+                logger.error(f"Error fetching post {post_id}: {str(e)}")
+                await finish(post_id, {"post_id": post_id, "status": "error", "error": str(e)})
+                return None
+        
+        posts = [post for post in await asyncio.gather(*map(fetch, post_ids)) if post is not None]
+        
+        outputs: Dict[int, Dict[str, Any]] = {}
+        requests: Dict[str, Dict[str, Any]] = {}
+        cache_keys: Dict[int, str] = {}
+        for post in posts:
+            kwargs = self.content_generator.seo_request(post.title, post.content, target_keywords, "da")
+            key, cached = await run_blocking(self.content_generator.lookup_cache, kwargs, use_cache)
+            if cached is not None:
+                outputs[post.id] = {"content": cached}
+                continue
+            requests[f"post-{post.id}"] = kwargs
+            if key:
+                cache_keys[post.id] = key
+        
+        if requests:
+            batch = await self.batch_runner.run(requests, batch_id=batch_id, on_submitted=on_submitted)
+            for custom_id, output in batch.items():
+                post_id = int(custom_id.split("-", 1)[1])
+                outputs[post_id] = output
+                if post_id in cache_keys and "content" in output:
+                    await run_blocking(get_llm_cache().set, cache_keys[post_id], output["content"])
+        
+        async def apply(post: Post) -> None:
+            output = outputs.get(post.id, {"error": "Missing from batch output"})
+            try:
+                if "error" in output:
+                    raise RuntimeError(output["error"])
+                async with wp_slots:
+                    result = await run_blocking(
+                        self.post_service.apply_seo_optimization,
+                        post,
+                        json.loads(output["content"]),
+                        save_changes
+                    )
+            except Exception as e:
+                logger.error(f"Error optimizing post {post.id} for SEO: {str(e)}")
+                result = {"post_id": post.id, "status": "error", "error": str(e)}
+            await finish(post.id, result)
+        
+        await asyncio.gather(*map(apply, posts))
+        return [results[post_id] for post_id in post_ids]
+    
+    async def _run_pipeline(
+        self,
+        post_ids: List[int],
+        transform: Callable[[Post], Awaitable[Any]],
+        apply: Callable[[Post, Any], Dict[str, Any]],
+        on_progress: Optional[ItemCallback]
+    ) -> List[Dict[str, Any]]:
+        """Run fetch → AI → save for each post on a pool of workers.
+        
+        WordPress stages hold one of ``PIPELINE_WP_CONCURRENCY`` slots and the
+        AI stage one of ``PIPELINE_AI_CONCURRENCY``, so while the AI limit is
+        saturated the spare workers fetch the next posts and save finished
+        ones. A failing post becomes an error result and the run continues.
+        """
+        wp_slots = asyncio.Semaphore(settings.PIPELINE_WP_CONCURRENCY)
+        ai_slots = asyncio.Semaphore(settings.PIPELINE_AI_CONCURRENCY)
+        pending = iter(enumerate(post_ids))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(post_ids)
+        completed = 0
+        
+        async def worker() -> None:
+            nonlocal completed
+            for index, post_id in pending:
+                try:
+                    async with wp_slots:
+                        post = await self.get_post_for_edit(post_id)
+                    async with ai_slots:
+                        output = await transform(post)
+                    async with wp_slots:
+                        result = await run_blocking(apply, post, output)
+                except Exception as e:
+                    logger.error(f"Error processing post {post_id}: {str(e)}")
+                    result = {"post_id": post_id, "status": "error", "error": str(e)}
+                results[index] = result
+                completed += 1
+                if on_progress:
+                    await on_progress(completed, len(post_ids), result)
+        
+        workers = min(len(post_ids), settings.PIPELINE_WP_CONCURRENCY + settings.PIPELINE_AI_CONCURRENCY)
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
@@ -1,38 +1,86 @@
 """AI-powered content generation service."""
 
+import asyncio
+import json
 import logging
-from typing import List, Optional, Dict, Any
-from openai import OpenAI
+import re
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from ..config.settings import settings
+from ..utils.aio import run_blocking
+from ..utils.html_sections import Section, replace_sections, split_sections
+from ..utils.metrics import (
+    OPENAI_DURATION,
+    OPENAI_IN_FLIGHT,
+    OPENAI_REQUESTS,
+    OPENAI_TOKENS,
+    precreate,
+)
+from ..utils.tracing import KIND_CLIENT, current_span, start_span, trace_headers, traced
+from .llm_cache import LLMCache, get_llm_cache
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+Messages = List[Dict[str, str]]
+
+# Target word count per requested post length
+WORD_COUNTS = {
+    "short": "400-600",
+    "medium": "800-1200",
+    "long": "1500-2000"
+}
+
+# Average characters of generated HTML per word, used for progress estimates
+HTML_CHARS_PER_WORD = 7
+
+# Receives each streamed piece of model output
+AsyncDeltaCallback = Callable[[str], Awaitable[None]]
+
+# Blog post generation modes:
+# - sequential: body, then title, then excerpt (three round trips in series)
+# - parallel: title alongside the body, then excerpt (two round trips deep)
+# - single: title, body and excerpt from one JSON-mode call
+GENERATION_MODES = ("sequential", "parallel", "single")
+
 
-class ContentGenerator:
-    """Service for generating and improving content using AI."""
+# Ask streamed completions for a final usage chunk, for token metrics
+STREAM_OPTIONS = {"include_usage": True}
+
+# Values of the ``task`` label on OpenAI metrics
+TASKS = ("blog_post", "title", "excerpt", "improve", "improve_section", "seo")
+
+
+def expected_post_chars(length: str) -> int:
+    """Rough size in characters of a generated post body, for progress reporting."""
+    upper = WORD_COUNTS.get(length, "800-1200").split("-")[-1]
+    return int(upper) * HTML_CHARS_PER_WORD
+
+
+class ContentPrompts:
+    """Prompt construction and response handling for the content generator."""
     
-    def __init__(self):
-        """Initialize content generator with OpenAI client."""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.model = "gpt-4o"  # Using GPT-4o for best quality
+    model = "gpt-4o"  # Using GPT-4o for best quality
     
-    def generate_blog_post(
+    def _blog_post_messages(
         self,
         topic: str,
-        keywords: Optional[List[str]] = None,
-        tone: str = "professional",
-        length: str = "medium",
-        language: str = "da"
-    ) -> Dict[str, str]:
-        """Generate a complete blog post."""
+        keywords: Optional[List[str]],
+        tone: str,
+        length: str,
+        language: str,
+        as_json: bool = False
+    ) -> Messages:
+        """Build the messages for generating a blog post body.
+        
+        With ``as_json`` the model is asked for title, content and excerpt in
+        a single JSON object instead of bare HTML.
+        """
         
         # Determine word count based on length
-        word_counts = {
-            "short": "400-600",
-            "medium": "800-1200",
-            "long": "1500-2000"
-        }
-        word_count = word_counts.get(length, "800-1200")
+        word_count = WORD_COUNTS.get(length, "800-1200")
         
         # Build prompt
         prompt = f"""Skriv et professionelt blog indlæg på {language} om følgende emne:
@@ -60,50 +108,38 @@ Formater indholdet som HTML med:
 - <p> for afsnit
 - <ul> og <li> for punktlister hvor relevant
 - <strong> for fremhævning
-
+"""
+        
+        if as_json:
+            prompt += """
+Returner dit svar som JSON:
+{
+  "title": "engagerende og SEO-venlig titel (max 60 tegn, inkluder primært keyword hvis muligt)",
+  "content": "hele indlægget som HTML",
+  "excerpt": "kort og engagerende uddrag (max 160 tegn)"
+}"""
+        else:
+            prompt += """
 Returner KUN HTML-indholdet uden ```html tags eller forklaringer."""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Du er en ekspert content writer specialiseret i SEO-optimeret blog indhold. Du skriver engagerende, informativt og professionelt indhold."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7
-            )
-            
-            content = response.choices[0].message.content.strip()
-            
-            # Generate title
-            title = self._generate_title(topic, keywords, language)
-            
-            # Generate excerpt
-            excerpt = self._generate_excerpt(content, language)
-            
-            return {
-                "title": title,
-                "content": content,
-                "excerpt": excerpt
+        return [
+            {
+                "role": "system",
+                "content": "Du er en ekspert content writer specialiseret i SEO-optimeret blog indhold. Du skriver engagerende, informativt og professionelt indhold."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
-        
-        except Exception as e:
-            logger.error(f"Error generating blog post: {str(e)}")
-            raise
+        ]
     
-    def _generate_title(
+    def _title_messages(
         self,
         topic: str,
         keywords: Optional[List[str]],
         language: str
-    ) -> str:
-        """Generate an engaging title for the post."""
+    ) -> Messages:
+        """Build the messages for generating a post title."""
         prompt = f"""Generer en engagerende og SEO-venlig titel på {language} for et blog indlæg om:
 
 Emne: {topic}
@@ -118,24 +154,13 @@ Krav:
 - Gør den engagerende og klikbar
 - Returner KUN titlen, ingen forklaringer"""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Du er en SEO-ekspert specialiseret i at skrive engagerende titler."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8
-            )
-            
-            return response.choices[0].message.content.strip().strip('"')
-        
-        except Exception as e:
-            logger.error(f"Error generating title: {str(e)}")
-            return topic  # Fallback to topic
+        return [
+            {"role": "system", "content": "Du er en SEO-ekspert specialiseret i at skrive engagerende titler."},
+            {"role": "user", "content": prompt}
+        ]
     
-    def _generate_excerpt(self, content: str, language: str) -> str:
-        """Generate an excerpt from content."""
+    def _excerpt_messages(self, content: str, language: str) -> Messages:
+        """Build the messages for generating an excerpt from content."""
         prompt = f"""Baseret på følgende blog indhold, skriv et kort og engagerende uddrag (excerpt) på {language}:
 
 {content[:1000]}...
@@ -146,33 +171,119 @@ Krav:
 - Gør det engagerende
 - Returner KUN uddraget, ingen forklaringer"""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Du er en ekspert i at skrive korte, engagerende beskrivelser."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content.strip().strip('"')
+        return [
+            {"role": "system", "content": "Du er en ekspert i at skrive korte, engagerende beskrivelser."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _completion_kwargs(
+        self,
+        messages: Messages,
+        temperature: float,
+        response_format: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request arguments."""
+        kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature
+        }
+        if response_format:
+            kwargs["response_format"] = response_format
+        return kwargs
+    
+    def _observe(self, task: str, model: str, outcome: str, started: float, usage: Any = None) -> None:
+        """Record latency, outcome and token usage of one API call."""
+        OPENAI_DURATION.labels(task, model).observe(time.perf_counter() - started)
+        OPENAI_REQUESTS.labels(task, model, outcome).inc()
+        if usage is not None:
+            OPENAI_TOKENS.labels(task, model, "prompt").inc(usage.prompt_tokens)
+            OPENAI_TOKENS.labels(task, model, "completion").inc(usage.completion_tokens)
+            span = current_span()
+            if span is not None:
+                span.set_attribute("tokens.prompt", usage.prompt_tokens)
+                span.set_attribute("tokens.completion", usage.completion_tokens)
+    
+    def _cache_key(
+        self,
+        cache: Optional[LLMCache],
+        kwargs: Dict[str, Any],
+        use_cache: Optional[bool]
+    ) -> Optional[str]:
+        """Cache key for a request, or None if the call should not be cached.
         
-        except Exception as e:
-            logger.error(f"Error generating excerpt: {str(e)}")
-            # Fallback: extract first sentence from content
-            import re
-            text = re.sub('<[^<]+?>', '', content)  # Strip HTML
-            sentences = text.split('.')
-            return sentences[0][:160] + "..." if sentences else ""
+        ``use_cache=None`` caches only near-deterministic calls (temperature up
+        to ``LLM_CACHE_MAX_TEMPERATURE``); True opts in, False bypasses.
+        """
+        if cache is None or use_cache is False:
+            return None
+        if use_cache is None and kwargs["temperature"] > settings.LLM_CACHE_MAX_TEMPERATURE:
+            return None
+        return cache.make_key(
+            kwargs["model"],
+            kwargs["messages"],
+            kwargs["temperature"],
+            kwargs.get("response_format")
+        )
     
-    def improve_content(
+    def seo_request(
         self,
+        title: str,
         content: str,
-        improvements: List[str],
+        target_keywords: Optional[List[str]] = None,
         language: str = "da"
-    ) -> str:
-        """Improve existing content based on specified improvements."""
+    ) -> Dict[str, Any]:
+        """Chat completion arguments of ``optimize_for_seo``, for batch submission."""
+        messages = self._seo_messages(title, content, target_keywords, language)
+        return self._completion_kwargs(messages, 0.5, {"type": "json_object"})
+    
+    def lookup_cache(
+        self,
+        kwargs: Dict[str, Any],
+        use_cache: Optional[bool]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Cache key and cached content (or None) for a request sent outside ``_chat``."""
+        cache = get_llm_cache()
+        key = self._cache_key(cache, kwargs, use_cache)
+        return key, cache.get(key) if key else None
+    
+    def _parse_blog_post_json(self, raw: str, topic: str) -> Dict[str, str]:
+        """Parse a single-call JSON blog post, filling gaps with cheap fallbacks."""
+        data = json.loads(raw)
+        content = str(data.get("content") or "").strip()
+        if not content:
+            raise ValueError("Model returned no content")
+        return {
+            "title": str(data.get("title") or topic).strip().strip('"'),
+            "content": content,
+            "excerpt": str(data.get("excerpt") or self._fallback_excerpt(content)).strip().strip('"')
+        }
+    
+    def _resolve_mode(self, mode: Optional[str]) -> str:
+        """Validate the requested generation mode, defaulting from settings."""
+        mode = mode or settings.GENERATION_MODE
+        if mode not in GENERATION_MODES:
+            raise ValueError(f"Unknown generation mode '{mode}'. Use one of: {', '.join(GENERATION_MODES)}")
+        return mode
+    
+    def _fallback_excerpt(self, content: str) -> str:
+        """Extract the first sentence of content as an excerpt."""
+        text = re.sub('<[^<]+?>', '', content)  # Strip HTML
+        sentences = text.split('.')
+        return sentences[0][:160] + "..." if sentences else ""
+    
+    def _improve_messages(
+        self,
+        content: str,
+        improvements: List[str],
+        language: str,
+        context: str = ""
+    ) -> Messages:
+        """Build the messages for improving existing content.
+        
+        ``context`` is appended to the prompt, after the content, when only
+        part of a post is being improved.
+        """
         
         improvement_instructions = {
             "seo": "Optimer for SEO ved at forbedre keyword-brug, overskrifter og struktur",
@@ -194,38 +305,70 @@ Krav:
 - Bevar HTML-formateringen
 - Bevar den overordnede struktur
 - Gør kun de nødvendige forbedringer
-- Returner det forbedrede indhold som HTML uden forklaringer"""
+- Returner det forbedrede indhold som HTML uden forklaringer{context}"""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Du er en ekspert content editor specialiseret i at forbedre blog indhold."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.5
-            )
-            
-            return response.choices[0].message.content.strip()
+        return [
+            {
+                "role": "system",
+                "content": "Du er en ekspert content editor specialiseret i at forbedre blog indhold."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    def _plan_sections(self, content: str) -> List[Section]:
+        """Sections to improve separately, or [] if the post is improved in one call.
         
-        except Exception as e:
-            logger.error(f"Error improving content: {str(e)}")
-            raise
+        Posts of at least ``IMPROVE_SECTION_MIN_CHARS`` with two or more
+        sections are split at their ``<h2>`` headings.
+        """
+        if len(content) < settings.IMPROVE_SECTION_MIN_CHARS:
+            return []
+        sections = split_sections(content)
+        return sections if len(sections) > 1 else []
+    
+    def _section_messages(
+        self,
+        section: Section,
+        sections: List[Section],
+        title: Optional[str],
+        improvements: List[str],
+        language: str
+    ) -> Messages:
+        """Build the messages for improving one section, with the post outline as context."""
+        outline = "\n".join(f"- {s.heading}" for s in sections if s.heading)
+        name = f'afsnittet "{section.heading}"' if section.heading else "indledningen"
+        context = f"""
+
+Indholdet er ét afsnit af indlægget "{title or ''}" med denne opbygning:
+{outline}
+
+Forbedr kun {name}. Bevar afsnittets overskrift og returner kun afsnittet."""
+        return self._improve_messages(section.html, improvements, language, context)
+    
+    def _join_sections(self, content: str, sections: List[Section], improved: List[str]) -> str:
+        """Reassemble the post, keeping a section as-is if the model returned nothing for it."""
+        replacements = [text or section.html for section, text in zip(sections, improved)]
+        return replace_sections(content, sections, replacements)
     
-    def optimize_for_seo(
+    def _section_delta(self, content: str, sections: List[Section], index: int, improved: str) -> str:
+        """Streamed text for a finished section: the markup before it plus its new HTML."""
+        start = sections[index - 1].end if index else 0
+        text = content[start:sections[index].start] + (improved or sections[index].html)
+        if index == len(sections) - 1:
+            text += content[sections[index].end:]
+        return text
+    
+    def _seo_messages(
         self,
         title: str,
         content: str,
-        target_keywords: Optional[List[str]] = None,
-        language: str = "da"
-    ) -> Dict[str, str]:
-        """Optimize title and content for SEO."""
+        target_keywords: Optional[List[str]],
+        language: str
+    ) -> Messages:
+        """Build the messages for SEO optimization of a post."""
         
         prompt = f"""Optimer følgende blog indlæg for SEO på {language}:
 
@@ -251,27 +394,294 @@ Format dit svar som JSON:
   "content_suggestions": ["forslag 1", "forslag 2"]
 }"""
         
+        return [
+            {
+                "role": "system",
+                "content": "Du er en SEO-ekspert. Returner altid valid JSON."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+
+class AsyncContentGenerator(ContentPrompts):
+    """Async service for generating and improving content using AI."""
+    
+    def __init__(self):
+        """Initialize content generator; the async OpenAI client is created on first use."""
+        self._client: Optional["AsyncOpenAI"] = None
+    
+    @property
+    def client(self) -> "AsyncOpenAI":
+        """Async OpenAI client, created on first use."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_BASE_URL or None
+            )
+        return self._client
+    
+    @client.setter
+    def client(self, client: "AsyncOpenAI") -> None:
+        self._client = client
+    
+    async def _chat(
+        self,
+        messages: Messages,
+        temperature: float,
+        task: str,
+        response_format: Optional[Dict[str, str]] = None,
+        on_delta: Optional[AsyncDeltaCallback] = None,
+        use_cache: Optional[bool] = None
+    ) -> str:
+        """Run a chat completion and return the message content.
+        
+        When ``on_delta`` is given the completion is streamed and the callback
+        is awaited with each piece of text as it arrives. Responses are served
+        from and stored in the LLM cache according to ``use_cache``; its SQLite
+        tier is read and written on the worker pool. ``task``, one of ``TASKS``,
+        labels the call in the OpenAI metrics.
+        """
+        kwargs = self._completion_kwargs(messages, temperature, response_format)
+        cache = get_llm_cache()
+        key = self._cache_key(cache, kwargs, use_cache)
+        
+        with start_span(f"OpenAI {task}", KIND_CLIENT, task=task, model=kwargs["model"]) as span:
+            if key:
+                cached = await run_blocking(cache.get, key)
+                if span is not None:
+                    span.set_attribute("cache_hit", cached is not None)
+                if cached is not None:
+                    if on_delta:
+                        await on_delta(cached)
+                    return cached
+            
+            content = await self._complete(kwargs, on_delta, task)
+        
+        if key:
+            await run_blocking(cache.set, key, content)
+        return content
+    
+    async def _complete(self, kwargs: Dict[str, Any], on_delta: Optional[AsyncDeltaCallback], task: str) -> str:
+        """Call the chat completions API, streaming if a callback is given."""
+        started = time.perf_counter()
+        OPENAI_IN_FLIGHT.inc()
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Du er en SEO-ekspert. Returner altid valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.5,
-                response_format={"type": "json_object"}
+            if on_delta is None:
+                response = await self.client.chat.completions.create(**kwargs, extra_headers=trace_headers())
+                self._observe(task, kwargs["model"], "ok", started, response.usage)
+                return response.choices[0].message.content
+            
+            parts = []
+            usage = None
+            stream = await self.client.chat.completions.create(
+                stream=True, stream_options=STREAM_OPTIONS, extra_headers=trace_headers(), **kwargs
             )
+            async for chunk in stream:
+                usage = chunk.usage or usage
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    await on_delta(delta)
+            self._observe(task, kwargs["model"], "ok", started, usage)
+            return "".join(parts)
+        
+        except Exception:
+            self._observe(task, kwargs["model"], "error", started)
+            raise
+        
+        finally:
+            OPENAI_IN_FLIGHT.dec()
+    
+    @traced()
+    async def generate_blog_post(
+        self,
+        topic: str,
+        keywords: Optional[List[str]] = None,
+        tone: str = "professional",
+        length: str = "medium",
+        language: str = "da",
+        mode: Optional[str] = None,
+        on_delta: Optional[AsyncDeltaCallback] = None,
+        use_cache: Optional[bool] = None
+    ) -> Dict[str, str]:
+        """Generate a complete blog post.
+        
+        ``mode`` selects the request pipeline; see ``GENERATION_MODES``.
+        ``on_delta`` streams the main completion as it is generated.
+        Generation is non-deterministic, so caching is opt-in via ``use_cache``.
+        """
+        mode = self._resolve_mode(mode)
+        
+        try:
+            if mode == "single":
+                messages = self._blog_post_messages(topic, keywords, tone, length, language, as_json=True)
+                raw = await self._chat(
+                    messages,
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                    on_delta=on_delta,
+                    use_cache=use_cache,
+                    task="blog_post"
+                )
+                return self._parse_blog_post_json(raw, topic)
+            
+            messages = self._blog_post_messages(topic, keywords, tone, length, language)
+            
+            if mode == "parallel":
+                body, title = await asyncio.gather(
+                    self._chat(messages, temperature=0.7, on_delta=on_delta, use_cache=use_cache, task="blog_post"),
+                    self._generate_title(topic, keywords, language, use_cache)
+                )
+                content = body.strip()
+            else:
+                content = (await self._chat(
+                    messages,
+                    temperature=0.7,
+                    on_delta=on_delta,
+                    use_cache=use_cache,
+                    task="blog_post"
+                )).strip()
+                title = await self._generate_title(topic, keywords, language, use_cache)
+            
+            excerpt = await self._generate_excerpt(content, language, use_cache)
+            
+            return {
+                "title": title,
+                "content": content,
+                "excerpt": excerpt
+            }
+        
+        except Exception as e:
+            logger.error(f"Error generating blog post: {str(e)}")
+            raise
+    
+    async def _generate_title(
+        self,
+        topic: str,
+        keywords: Optional[List[str]],
+        language: str,
+        use_cache: Optional[bool] = None
+    ) -> str:
+        """Generate an engaging title for the post."""
+        try:
+            messages = self._title_messages(topic, keywords, language)
+            return (await self._chat(messages, temperature=0.8, use_cache=use_cache, task="title")).strip().strip('"')
+        
+        except Exception as e:
+            logger.error(f"Error generating title: {str(e)}")
+            return topic  # Fallback to topic
+    
+    async def _generate_excerpt(
+        self,
+        content: str,
+        language: str,
+        use_cache: Optional[bool] = None
+    ) -> str:
+        """Generate an excerpt from content."""
+        try:
+            messages = self._excerpt_messages(content, language)
+            return (await self._chat(messages, temperature=0.7, use_cache=use_cache, task="excerpt")).strip().strip('"')
+        
+        except Exception as e:
+            logger.error(f"Error generating excerpt: {str(e)}")
+            return self._fallback_excerpt(content)
+    
+    @traced()
+    async def improve_content(
+        self,
+        content: str,
+        improvements: List[str],
+        language: str = "da",
+        on_delta: Optional[AsyncDeltaCallback] = None,
+        use_cache: Optional[bool] = None,
+        title: Optional[str] = None
+    ) -> str:
+        """Improve existing content based on specified improvements.
+        
+        Long posts are improved section by section concurrently (see
+        ``_plan_sections``); ``on_delta`` then receives whole sections in
+        document order.
+        """
+        try:
+            sections = self._plan_sections(content)
+            if sections:
+                return await self._improve_sections(content, sections, improvements, language, title, on_delta, use_cache)
             
-            import json
-            return json.loads(response.choices[0].message.content)
+            messages = self._improve_messages(content, improvements, language)
+            return (await self._chat(
+                messages,
+                temperature=0.5,
+                on_delta=on_delta,
+                use_cache=use_cache,
+                task="improve"
+            )).strip()
+        
+        except Exception as e:
+            logger.error(f"Error improving content: {str(e)}")
+            raise
+    
+    async def _improve_sections(
+        self,
+        content: str,
+        sections: List[Section],
+        improvements: List[str],
+        language: str,
+        title: Optional[str],
+        on_delta: Optional[AsyncDeltaCallback],
+        use_cache: Optional[bool]
+    ) -> str:
+        """Improve each section in its own call and reassemble the post."""
+        slots = asyncio.Semaphore(settings.IMPROVE_SECTION_CONCURRENCY)
+        
+        async def improve(section: Section) -> str:
+            messages = self._section_messages(section, sections, title, improvements, language)
+            async with slots:
+                return (await self._chat(messages, temperature=0.5, use_cache=use_cache, task="improve_section")).strip()
+        
+        tasks = [asyncio.ensure_future(improve(section)) for section in sections]
+        improved = []
+        try:
+            for index, task in enumerate(tasks):
+                improved.append(await task)
+                if on_delta:
+                    await on_delta(self._section_delta(content, sections, index, improved[-1]))
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self._join_sections(content, sections, improved)
+    
+    @traced()
+    async def optimize_for_seo(
+        self,
+        title: str,
+        content: str,
+        target_keywords: Optional[List[str]] = None,
+        language: str = "da",
+        use_cache: Optional[bool] = None
+    ) -> Dict[str, str]:
+        """Optimize title and content for SEO."""
+        messages = self._seo_messages(title, content, target_keywords, language)
+        
+        try:
+            result = await self._chat(
+                messages,
+                temperature=0.5,
+                response_format={"type": "json_object"},
+                use_cache=use_cache,
+                task="seo"
+            )
+            return json.loads(result)
         
         except Exception as e:
             logger.error(f"Error optimizing for SEO: {str(e)}")
             raise
 
+
+# Export the series of every task from the first scrape
+precreate(OPENAI_DURATION, TASKS, [ContentPrompts.model])
+precreate(OPENAI_REQUESTS, TASKS, [ContentPrompts.model], ["ok", "error"])
+precreate(OPENAI_TOKENS, TASKS, [ContentPrompts.model], ["prompt", "completion"])
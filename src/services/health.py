@@ -0,0 +1,237 @@
+"""Background health probes for WordPress and OpenAI, served from a cached snapshot."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import requests
+from ..config.settings import settings
+from ..config.sites import SiteConfig
+from ..utils.metrics import DEPENDENCY_LATENCY, DEPENDENCY_UP
+from .content_generator import ContentPrompts
+from .site_registry import get_site_registry
+
+logger = logging.getLogger(__name__)
+
+# Raises on failure; one lightweight request per call
+Check = Callable[[], None]
+
+UNKNOWN = "unknown"
+UP = "up"
+DEGRADED = "degraded"
+DOWN = "down"
+
+
+class ProbeResult:
+    """Outcome of the most recent probes of one dependency."""
+    __slots__ = ("name", "latency", "consecutive_failures", "checks", "last_check", "last_success", "last_error")
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.checks = 0
+        self.last_check: Optional[float] = None
+        self.last_success: Optional[float] = None
+        self.last_error: Optional[str] = None
+    
+    def state(self, failure_threshold: int, slow_threshold: float) -> str:
+        """``down`` after ``failure_threshold`` failures in a row, ``degraded`` when failing or slow."""
+        if not self.checks:
+            return UNKNOWN
+        if self.consecutive_failures >= failure_threshold:
+            return DOWN
+        if self.consecutive_failures or (self.latency or 0.0) > slow_threshold:
+            return DEGRADED
+        return UP
+    
+    def to_dict(self, failure_threshold: int, slow_threshold: float) -> Dict[str, Any]:
+        return {
+            "state": self.state(failure_threshold, slow_threshold),
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "consecutive_failures": self.consecutive_failures,
+            "last_check": self.last_check,
+            "last_success": self.last_success,
+            "last_error": self.last_error
+        }
+
+
+class HealthProber:
+    """Runs every check on an interval from a daemon thread and caches the result.
+    
+    Checks are named ``<kind>`` or ``<kind>:<target>`` (``wordpress:kunde-a``,
+    ``openai``). The overall status is ``starting`` until the first round
+    finishes, ``ok`` when everything is up, ``down`` when every WordPress
+    site is down, and ``degraded`` otherwise. The server is ready unless it
+    is starting or down, so one failing site or OpenAI does not take the
+    others out of service. ``snapshot`` returns the dict built after the
+    last round, so health routes do no work per request.
+    """
+    
+    def __init__(
+        self,
+        checks: Dict[str, Check],
+        interval: float = 30.0,
+        failure_threshold: int = 3,
+        slow_threshold: float = 2.0
+    ):
+        """Initialize prober; call ``start`` to begin probing."""
+        self.checks = checks
+        self.interval = interval
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self.results = {name: ProbeResult(name) for name in checks}
+        self._snapshot: Dict[str, Any] = self._build_snapshot(rounds=0)
+        self._rounds = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def start(self) -> None:
+        """Start the probe thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="health-prober", daemon=True)
+            self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the probe thread is running (True before ``start``)."""
+        return self._thread is None or self._thread.is_alive()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Cached status of the last probe round."""
+        return self._snapshot
+    
+    def probe(self) -> Dict[str, Any]:
+        """Run every check once, concurrently, and refresh the snapshot."""
+        if self.checks:
+            with ThreadPoolExecutor(max_workers=min(8, len(self.checks)), thread_name_prefix="health") as pool:
+                for name, check in self.checks.items():
+                    pool.submit(self._probe_one, name, check)
+        self._rounds += 1
+        self._snapshot = self._build_snapshot(self._rounds)
+        return self._snapshot
+    
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.probe()
+            except Exception as e:
+                logger.error(f"Error running health probes: {str(e)}")
+            self._stop.wait(self.interval)
+    
+    def _probe_one(self, name: str, check: Check) -> None:
+        result = self.results[name]
+        before = result.state(self.failure_threshold, self.slow_threshold)
+        started = time.perf_counter()
+        try:
+            check()
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        
+        result.latency = time.perf_counter() - started
+        result.checks += 1
+        result.last_check = time.time()
+        if error is None:
+            result.consecutive_failures = 0
+            result.last_success = result.last_check
+            result.last_error = None
+        else:
+            result.consecutive_failures += 1
+            result.last_error = error
+        
+        after = result.state(self.failure_threshold, self.slow_threshold)
+        DEPENDENCY_UP.labels(name).set(1 if error is None else 0)
+        DEPENDENCY_LATENCY.labels(name).set(result.latency)
+        if after == DOWN and before != DOWN:
+            logger.warning(f"{name} is down after {result.consecutive_failures} failed probes: {error}")
+        elif before == DOWN and after != DOWN:
+            logger.info(f"{name} is reachable again")
+    
+    def _build_snapshot(self, rounds: int) -> Dict[str, Any]:
+        dependencies = {
+            name: result.to_dict(self.failure_threshold, self.slow_threshold)
+            for name, result in self.results.items()
+        }
+        wordpress = [dep["state"] for name, dep in dependencies.items() if name.split(":")[0] == "wordpress"]
+        states = [dep["state"] for dep in dependencies.values()]
+        
+        if not rounds:
+            status = "starting"
+        elif wordpress and all(state == DOWN for state in wordpress):
+            status = "down"
+        elif all(state == UP for state in states):
+            status = "ok"
+        else:
+            status = "degraded"
+        
+        return {
+            "status": status,
+            "ready": status in ("ok", "degraded"),
+            "checked_at": time.time() if rounds else None,
+            "interval": self.interval,
+            "dependencies": dependencies
+        }
+
+
+def wordpress_check(site: SiteConfig, session: requests.Session, timeout: float) -> Check:
+    """HEAD of a one-post, ID-only listing: checks reachability and credentials without a body."""
+    url = f"{site.api_url}/posts"
+    
+    def check() -> None:
+        response = session.head(
+            url,
+            params={"per_page": 1, "_fields": "id"},
+            auth=(site.username, site.app_password),
+            timeout=timeout
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(f"HTTP {response.status_code}")
+    
+    return check
+
+
+def openai_check(session: requests.Session, model: str, timeout: float) -> Check:
+    """Retrieve one model: checks reachability and the API key without spending tokens."""
+    url = f"{(settings.OPENAI_BASE_URL or 'https://api.openai.com/v1').rstrip('/')}/models/{model}"
+    
+    def check() -> None:
+        response = session.get(url, headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"}, timeout=timeout)
+        if response.status_code >= 400:
+            raise RuntimeError(f"HTTP {response.status_code}")
+    
+    return check
+
+
+_prober: Optional[HealthProber] = None
+_prober_lock = threading.Lock()
+
+
+def get_health_prober() -> HealthProber:
+    """Return the process-wide prober for every configured site and OpenAI."""
+    global _prober
+    if _prober is None:
+        with _prober_lock:
+            if _prober is None:
+                session = requests.Session()
+                timeout = settings.HEALTH_PROBE_TIMEOUT
+                checks = {
+                    f"wordpress:{name}": wordpress_check(site, session, timeout)
+                    for name, site in sorted(get_site_registry().sites.items())
+                }
+                if settings.OPENAI_API_KEY:
+                    checks["openai"] = openai_check(session, ContentPrompts.model, timeout)
+                _prober = HealthProber(
+                    checks,
+                    interval=settings.HEALTH_PROBE_INTERVAL,
+                    failure_threshold=settings.HEALTH_FAILURE_THRESHOLD,
+                    slow_threshold=settings.HEALTH_SLOW_THRESHOLD
+                )
+    return _prober
@@ -0,0 +1,328 @@
+"""SQLite-backed queue for long-running tool calls."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from ..config.settings import settings
+from ..utils.aio import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# Job states; items are pending, done or error
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    state TEXT NOT NULL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs(state, created_at);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    state TEXT NOT NULL,
+    result TEXT,
+    PRIMARY KEY (job_id, seq)
+) WITHOUT ROWID;
+"""
+
+
+class Job:
+    """A claimed job as seen by its handler.
+    
+    Store reads and checkpoints run on the worker pool, off the runner's
+    event loop.
+    """
+    
+    def __init__(self, store: "JobStore", job_id: str, kind: str, params: Dict[str, Any]):
+        self.store = store
+        self.id = job_id
+        self.kind = kind
+        self.params = params
+    
+    async def pending(self) -> List[Tuple[int, Any]]:
+        """``(seq, item)`` pairs not yet checkpointed, in order."""
+        return await run_blocking(self.store.pending_items, self.id)
+    
+    async def update_params(self, **values: Any) -> None:
+        """Persist job-level state (e.g. an external batch ID) for a resumed run."""
+        self.params.update(values)
+        await run_blocking(self.store.update_params, self.id, dict(self.params))
+    
+    async def record(self, seq: int, result: Dict[str, Any]) -> None:
+        """Checkpoint one item; a result with ``status: error`` counts as failed."""
+        await run_blocking(self.store.record_item, self.id, seq, result)
+
+
+Handler = Callable[[Job], Awaitable[None]]
+
+
+class JobStore:
+    """Jobs and their items in a SQLite file.
+    
+    Every finished item is committed as it completes, so a restarted
+    server resumes a job from its first unfinished item.
+    """
+    
+    def __init__(self, path: str):
+        """Initialize store backed by the SQLite file at ``path``."""
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+    
+    def create(self, kind: str, params: Dict[str, Any], items: List[Any]) -> str:
+        """Queue a job over ``items``; returns its ID."""
+        job_id = uuid.uuid4().hex[:16]
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO jobs (id, kind, params, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(params), QUEUED, now, now)
+            )
+            self._db.executemany(
+                "INSERT INTO job_items (job_id, seq, item, state) VALUES (?, ?, ?, 'pending')",
+                [(job_id, seq, json.dumps(item)) for seq, item in enumerate(items)]
+            )
+        return job_id
+    
+    def claim_next(self) -> Optional[Job]:
+        """Mark the oldest queued job running and return it."""
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT id, kind, params FROM jobs WHERE state = ? ORDER BY created_at LIMIT 1",
+                (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._set_state(row[0], RUNNING)
+        return Job(self, row[0], row[1], json.loads(row[2]))
+    
+    def requeue_running(self) -> int:
+        """Put jobs left running by a previous process back in the queue."""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "UPDATE jobs SET state = ?, updated_at = ? WHERE state = ?",
+                (QUEUED, time.time(), RUNNING)
+            )
+        return cursor.rowcount
+    
+    def finish(self, job_id: str, state: str, error: Optional[str] = None) -> None:
+        """Move a job to a final state unless it was cancelled meanwhile."""
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, error = ?, updated_at = ? WHERE id = ? AND state != ?",
+                (state, error, time.time(), job_id, CANCELLED)
+            )
+    
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not finished; returns False otherwise."""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "UPDATE jobs SET state = ?, updated_at = ? WHERE id = ? AND state IN (?, ?)",
+                (CANCELLED, time.time(), job_id, QUEUED, RUNNING)
+            )
+        return cursor.rowcount > 0
+    
+    def update_params(self, job_id: str, params: Dict[str, Any]) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE jobs SET params = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(params), time.time(), job_id)
+            )
+    
+    def pending_items(self, job_id: str) -> List[Tuple[int, Any]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT seq, item FROM job_items WHERE job_id = ? AND state = 'pending' ORDER BY seq",
+                (job_id,)
+            ).fetchall()
+        return [(seq, json.loads(item)) for seq, item in rows]
+    
+    def record_item(self, job_id: str, seq: int, result: Dict[str, Any]) -> None:
+        state = "error" if result.get("status") == "error" else "done"
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE job_items SET state = ?, result = ? WHERE job_id = ? AND seq = ?",
+                (state, json.dumps(result), job_id, seq)
+            )
+            self._db.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (time.time(), job_id))
+    
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """State and item counts of a job, or None if unknown."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT kind, state, error, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            counts = dict(self._db.execute(
+                "SELECT state, COUNT(*) FROM job_items WHERE job_id = ? GROUP BY state",
+                (job_id,)
+            ).fetchall())
+        total = sum(counts.values())
+        finished = counts.get("done", 0) + counts.get("error", 0)
+        return {
+            "job_id": job_id,
+            "kind": row[0],
+            "state": row[1],
+            "error": row[2],
+            "total": total,
+            "completed": counts.get("done", 0),
+            "failed": counts.get("error", 0),
+            "pending": counts.get("pending", 0),
+            "progress": round(finished / total, 3) if total else 1.0,
+            "created_at": row[3],
+            "updated_at": row[4]
+        }
+    
+    def results(self, job_id: str, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """Checkpointed item results of a job, in item order."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT seq, item, state, result FROM job_items WHERE job_id = ? AND state != 'pending' "
+                "ORDER BY seq LIMIT ? OFFSET ?",
+                (job_id, limit, offset)
+            ).fetchall()
+        return [
+            {"seq": seq, "item": json.loads(item), "state": state, "result": json.loads(result)}
+            for seq, item, state, result in rows
+        ]
+    
+    def _set_state(self, job_id: str, state: str) -> None:
+        self._db.execute(
+            "UPDATE jobs SET state = ?, updated_at = ? WHERE id = ?",
+            (state, time.time(), job_id)
+        )
+
+
+class JobRunner:
+    """Runs queued jobs on an event loop in a background thread.
+    
+    Jobs are dispatched to the handler registered for their kind, at most
+    ``workers`` at a time. Jobs a previous process left running are queued
+    again on start. Cancelling a running job cancels its task; items
+    checkpointed before that keep their results.
+    """
+    
+    def __init__(self, store: JobStore, handlers: Dict[str, Handler], workers: int = 2):
+        """Initialize runner; ``handlers`` maps job kinds to coroutines."""
+        self.store = store
+        self.handlers = handlers
+        self.workers = workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._lock = threading.Lock()
+    
+    def start(self) -> None:
+        """Start the runner thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            requeued = self.store.requeue_running()
+            if requeued:
+                logger.info(f"Resuming {requeued} interrupted job(s)")
+            self._thread = threading.Thread(target=self._run_loop, name="job-runner", daemon=True)
+            self._thread.start()
+        self._started.wait()
+    
+    def submit(self, kind: str, params: Dict[str, Any], items: List[Any]) -> str:
+        """Queue a job and wake the runner; returns the job ID."""
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}. Use one of: {', '.join(sorted(self.handlers))}")
+        job_id = self.store.create(kind, params, items)
+        self.start()
+        self._loop.call_soon_threadsafe(self._wake.set)
+        logger.info(f"Queued {kind} job {job_id} with {len(items)} item(s)")
+        return job_id
+    
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job."""
+        if not self.store.cancel(job_id):
+            return False
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cancel_task, job_id)
+        logger.info(f"Cancelled job {job_id}")
+        return True
+    
+    def _cancel_task(self, job_id: str) -> None:
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+    
+    def _run_loop(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wake = asyncio.Event()
+        self._started.set()
+        self._loop.run_until_complete(self._dispatch())
+    
+    async def _dispatch(self) -> None:
+        slots = asyncio.Semaphore(self.workers)
+        while True:
+            await slots.acquire()
+            job = await run_blocking(self.store.claim_next)
+            if job is None:
+                slots.release()
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.create_task(self._execute(job))
+            self._tasks[job.id] = task
+            task.add_done_callback(lambda _, job_id=job.id: (self._tasks.pop(job_id, None), slots.release()))
+    
+    async def _execute(self, job: Job) -> None:
+        started = time.time()
+        try:
+            await self.handlers[job.kind](job)
+            await run_blocking(self.store.finish, job.id, COMPLETED)
+            logger.info(f"Job {job.id} ({job.kind}) completed in {time.time() - started:.1f}s")
+        except asyncio.CancelledError:
+            logger.info(f"Job {job.id} ({job.kind}) stopped after cancellation")
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {str(e)}")
+            await run_blocking(self.store.finish, job.id, FAILED, error=str(e))
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner(handlers: Callable[[], Dict[str, Handler]]) -> JobRunner:
+    """Return the process-wide job runner, creating it with ``handlers()`` once."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner(
+                JobStore(settings.JOBS_PATH),
+                handlers(),
+                workers=settings.JOB_WORKERS
+            )
+        return _runner
@@ -0,0 +1,157 @@
+"""Run chat completions through the OpenAI Batch API for bulk, offline work."""
+
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+# Batch statuses after which nothing more happens
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+class BatchProvider(ABC):
+    """Backend that runs a JSONL file of chat completion requests as a batch."""
+    
+    @abstractmethod
+    async def submit(self, path: str) -> str:
+        """Upload the request file and start a batch; returns the batch ID."""
+    
+    @abstractmethod
+    async def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        """Batch ``status``, ``output_file_id``, ``error_file_id`` and ``request_counts``."""
+    
+    @abstractmethod
+    async def download(self, file_id: str) -> str:
+        """Contents of an output or error file."""
+    
+    @abstractmethod
+    async def cancel(self, batch_id: str) -> None:
+        """Stop a batch that has not finished."""
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """The OpenAI Batch API (or any server implementing its Files and Batches endpoints)."""
+    
+    def __init__(self, client: "AsyncOpenAI", completion_window: str = "24h"):
+        """Initialize provider on an OpenAI client."""
+        self.client = client
+        self.completion_window = completion_window
+    
+    async def submit(self, path: str) -> str:
+        with open(path, "rb") as f:
+            uploaded = await self.client.files.create(file=f, purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window
+        )
+        return batch.id
+    
+    async def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        batch = await self.client.batches.retrieve(batch_id)
+        return {
+            "status": batch.status,
+            "output_file_id": batch.output_file_id,
+            "error_file_id": batch.error_file_id,
+            "request_counts": batch.request_counts.model_dump() if batch.request_counts else {}
+        }
+    
+    async def download(self, file_id: str) -> str:
+        response = await self.client.files.content(file_id)
+        return response.text
+    
+    async def cancel(self, batch_id: str) -> None:
+        await self.client.batches.cancel(batch_id)
+
+
+class BatchRunner:
+    """Writes requests to JSONL, submits them as one batch and waits for the results.
+    
+    Request files are kept in ``directory`` for inspection. A run can be
+    resumed by passing the batch ID reported through ``on_submitted``.
+    """
+    
+    def __init__(self, provider: BatchProvider, directory: str, poll_interval: float = 30):
+        """Initialize runner over ``provider``."""
+        self.provider = provider
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+    
+    async def run(
+        self,
+        requests: Dict[str, Dict[str, Any]],
+        batch_id: Optional[str] = None,
+        on_submitted: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run chat completion ``requests`` keyed by custom ID.
+        
+        Returns ``{"content": ...}`` or ``{"error": ...}`` for every custom ID.
+        Cancelling the caller cancels the batch.
+        """
+        if batch_id is None:
+            path = self.write_requests(requests)
+            batch_id = await self.provider.submit(str(path))
+            logger.info(f"Submitted batch {batch_id} with {len(requests)} requests")
+            if on_submitted:
+                await on_submitted(batch_id)
+        
+        try:
+            status = await self.wait(batch_id)
+        except asyncio.CancelledError:
+            try:
+                await self.provider.cancel(batch_id)
+            except Exception as e:
+                logger.error(f"Error cancelling batch {batch_id}: {str(e)}")
+            raise
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        for file_id in (status.get("output_file_id"), status.get("error_file_id")):
+            if file_id:
+                results.update(parse_batch_output(await self.provider.download(file_id)))
+        for custom_id in requests:
+            results.setdefault(custom_id, {"error": f"No result; batch {status['status']}"})
+        return results
+    
+    async def wait(self, batch_id: str) -> Dict[str, Any]:
+        """Poll until the batch reaches a terminal status."""
+        while True:
+            status = await self.provider.retrieve(batch_id)
+            if status["status"] in TERMINAL_STATUSES:
+                logger.info(f"Batch {batch_id} {status['status']}: {status.get('request_counts')}")
+                return status
+            await asyncio.sleep(self.poll_interval)
+    
+    def write_requests(self, requests: Dict[str, Dict[str, Any]]) -> Path:
+        """Write one Batch API request line per custom ID; returns the file path."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"batch-{int(time.time() * 1000)}.jsonl"
+        with open(path, "w", encoding="utf-8") as f:
+            for custom_id, body in requests.items():
+                line = {"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        return path
+
+
+def parse_batch_output(text: str) -> Dict[str, Dict[str, Any]]:
+    """Map each line of a batch output or error file to its message content or error."""
+    results = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        response = row.get("response") or {}
+        body = response.get("body") or {}
+        if row.get("error") or response.get("status_code") != 200:
+            error = row.get("error") or body.get("error") or {}
+            results[row["custom_id"]] = {"error": error.get("message") or f"HTTP {response.get('status_code')}"}
+        else:
+            results[row["custom_id"]] = {"content": body["choices"][0]["message"]["content"]}
+    return results
@@ -0,0 +1,194 @@
+"""Content-addressed cache for OpenAI chat completion responses."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from ..config.settings import settings
+from ..utils.metrics import CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """Two-tier (memory LRU + SQLite) cache keyed by a hash of the request.
+    
+    Entries expire after ``ttl`` seconds in both tiers. The memory tier holds
+    at most ``max_entries`` items; the disk tier at most ``max_disk_entries``,
+    evicting the least recently used rows first. The tiers have separate
+    locks, so memory hits never wait behind SQLite reads and commits.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        path: Optional[str] = None,
+        max_disk_entries: int = 0
+    ):
+        """Initialize cache; an empty ``path`` keeps it memory-only."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._db: Optional[sqlite3.Connection] = None
+        
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+                )
+                self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_access ON llm_cache(last_access)")
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.error(f"LLM cache disk tier disabled: {e}")
+                self._db = None
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Hash everything that determines the model's answer."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "response_format": response_format,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    CACHE_LOOKUPS.labels("llm", "memory_hits").inc()
+                    return entry[1]
+                del self._memory[key]
+        
+        row = None
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    self._db.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+                    self._db.commit()
+                elif row is not None:
+                    self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    row = None
+        
+        with self._lock:
+            if row is not None:
+                self._remember(key, row[1], row[0])
+                self._stats["disk_hits"] += 1
+                CACHE_LOOKUPS.labels("llm", "disk_hits").inc()
+                return row[0]
+            self._stats["misses"] += 1
+            CACHE_LOOKUPS.labels("llm", "misses").inc()
+            return None
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a response in both tiers."""
+        now = time.time()
+        expires_at = now + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._stats["stores"] += 1
+        
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, value, expires_at, now)
+                )
+                evicted = self._evict_disk(now)
+                self._db.commit()
+            with self._lock:
+                self._stats["evictions"] += evicted
+    
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current sizes."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        if self._db is not None:
+            with self._db_lock:
+                stats["disk_entries"] = self._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
+    
+    def _remember(self, key: str, expires_at: float, value: str) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+    
+    def _evict_disk(self, now: float) -> int:
+        """Drop expired rows and rows beyond ``max_disk_entries``; returns the rows evicted for size."""
+        self._db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+        if not self.max_disk_entries:
+            return 0
+        deleted = self._db.execute(
+            "DELETE FROM llm_cache WHERE key IN ("
+            "SELECT key FROM llm_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,)
+        ).rowcount
+        return max(deleted, 0)
+
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Return the process-wide LLM cache, or None when caching is disabled."""
+    global _cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMCache(
+                max_entries=settings.LLM_CACHE_MEMORY_ENTRIES,
+                ttl=settings.LLM_CACHE_TTL,
+                path=settings.LLM_CACHE_PATH,
+                max_disk_entries=settings.LLM_CACHE_DISK_ENTRIES
+            )
+        return _cache
@@ -0,0 +1,115 @@
+"""Cached section outlines of post content, for reading and replacing one section at a time."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from ..config.settings import settings
+from ..utils.html_sections import Section, split_sections, word_count
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class PostOutline:
+    """The ``<h2>`` sections of one version of a post's content.
+    
+    A section's ID is a short hash of its own HTML (suffixed ``-2``, ``-3``
+    for identical sections), so it stays the same while other sections are
+    edited and stops matching once the section itself changes.
+    """
+    __slots__ = ("content_hash", "sections", "ids", "words")
+    
+    def __init__(self, content: str, digest: Optional[str] = None):
+        self.content_hash = digest or content_hash(content)
+        self.sections: List[Section] = split_sections(content)
+        self.words = [word_count(section.html) for section in self.sections]
+        self.ids: List[str] = []
+        seen: Dict[str, int] = {}
+        for section in self.sections:
+            digest = hashlib.sha256(section.html.encode("utf-8")).hexdigest()[:10]
+            seen[digest] = seen.get(digest, 0) + 1
+            self.ids.append(digest if seen[digest] == 1 else f"{digest}-{seen[digest]}")
+    
+    def find(self, section_id: str) -> int:
+        """Index of the section with ``section_id``."""
+        try:
+            return self.ids.index(section_id)
+        except ValueError:
+            raise ValueError(
+                f"Unknown section: {section_id}. The post may have changed; get the outline again"
+            ) from None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "content_hash": self.content_hash,
+            "words": sum(self.words),
+            "sections": [
+                {
+                    "id": section_id,
+                    "heading": section.heading,
+                    "words": words,
+                    "chars": len(section.html)
+                }
+                for section_id, section, words in zip(self.ids, self.sections, self.words)
+            ]
+        }
+
+
+class OutlineIndex:
+    """LRU cache of outlines keyed by content hash.
+    
+    Keying by content rather than post ID means an edited post gets a new
+    outline without any invalidation, and identical content is parsed once.
+    """
+    
+    def __init__(self, max_entries: int = 500):
+        """Initialize index."""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, PostOutline]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+    
+    def outline(self, content: str) -> PostOutline:
+        """Outline of ``content``, parsed on first use."""
+        key = content_hash(content)
+        with self._lock:
+            outline = self._entries.get(key)
+            if outline is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return outline
+        
+        # Parsed outside the lock; a concurrent miss parses the same content twice at worst
+        outline = PostOutline(content, key)
+        with self._lock:
+            self._stats["misses"] += 1
+            self._entries[key] = outline
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return outline
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_index: Optional[OutlineIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_outline_index() -> OutlineIndex:
+    """Return the process-wide outline index, shared by all sites."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = OutlineIndex(max_entries=settings.OUTLINE_CACHE_MAX_ENTRIES)
+    return _index
@@ -0,0 +1,98 @@
+"""Read-through cache for single WordPress posts."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from ..utils.metrics import CACHE_LOOKUPS
+
+
+class CachedPost:
+    """A cached post API response with the validators needed to revalidate it."""
+    
+    __slots__ = ("data", "etag", "last_modified", "validated_at")
+    
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.validated_at = time.monotonic()
+    
+    @property
+    def modified_gmt(self) -> Optional[str]:
+        return self.data.get("modified_gmt")
+
+
+class PostCache:
+    """LRU cache of post responses with a freshness TTL.
+    
+    Entries younger than ``ttl`` are served as-is. Older entries are kept
+    (up to ``max_entries``) so the caller can revalidate them cheaply instead
+    of refetching the full post.
+    """
+    
+    def __init__(self, max_entries: int, ttl: float):
+        """Initialize cache."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, CachedPost]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "invalidations": 0}
+    
+    def get(self, post_id: int) -> Optional[CachedPost]:
+        """Return the cached entry (fresh or stale), or None."""
+        with self._lock:
+            entry = self._entries.get(post_id)
+            if entry is not None:
+                self._entries.move_to_end(post_id)
+            return entry
+    
+    def is_fresh(self, entry: CachedPost) -> bool:
+        return time.monotonic() - entry.validated_at < self.ttl
+    
+    def put(
+        self,
+        post_id: int,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a freshly fetched post."""
+        with self._lock:
+            self._entries[post_id] = CachedPost(data, etag, last_modified)
+            self._entries.move_to_end(post_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def touch(self, post_id: int) -> None:
+        """Mark an entry as confirmed unchanged by the server."""
+        with self._lock:
+            entry = self._entries.get(post_id)
+            if entry is not None:
+                entry.validated_at = time.monotonic()
+    
+    def invalidate(self, post_id: int) -> None:
+        """Drop a post after it was written or deleted."""
+        with self._lock:
+            if self._entries.pop(post_id, None) is not None:
+                self._stats["invalidations"] += 1
+    
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome: hits, revalidated or misses."""
+        with self._lock:
+            self._stats[outcome] += 1
+        CACHE_LOOKUPS.labels("post", outcome).inc()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["hits"] + stats["revalidated"]) / lookups, 3) if lookups else 0.0
+        return stats
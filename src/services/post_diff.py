@@ -0,0 +1,67 @@
+"""Compare a post update with the current post, field by field."""
+
+import html
+from typing import Any, Dict, Tuple
+from ..models.post import Post
+from ..utils.html_text import html_hash, normalize_html, strip_html
+
+
+def _text(value: Any) -> str:
+    """Titles can carry entities (``&#8211;``); compare their text."""
+    return " ".join(html.unescape(str(value or "")).split())
+
+
+def diff_update(post: Post, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split a WordPress update body into the fields that change ``post`` and a summary.
+    
+    Returns ``(changes, summary)``: ``changes`` is the request body with
+    unchanged fields left out (and only changed ACF keys), ``summary`` has
+    ``changed`` (field -> details) and ``unchanged`` (field names).
+    ``post`` should hold the stored (``context=edit``) text fields, so
+    markup WordPress rewrites on output does not count as a change; content
+    is compared as normalised HTML.
+    """
+    changes: Dict[str, Any] = {}
+    changed: Dict[str, Any] = {}
+    unchanged = []
+    
+    for field, value in payload.items():
+        detail = None
+        
+        if field == "content":
+            before, after = html_hash(post.content), html_hash(value)
+            if before != after:
+                detail = {
+                    "before_hash": before,
+                    "after_hash": after,
+                    "before_chars": len(normalize_html(post.content)),
+                    "after_chars": len(normalize_html(value))
+                }
+        elif field == "title":
+            if _text(post.title) != _text(value):
+                detail = {"before": _text(post.title), "after": _text(value)}
+        elif field == "excerpt":
+            if strip_html(post.excerpt) != strip_html(value):
+                detail = {"before": strip_html(post.excerpt), "after": strip_html(value)}
+        elif field in ("categories", "tags"):
+            current = getattr(post, field) or []
+            added = sorted(set(value) - set(current))
+            removed = sorted(set(current) - set(value))
+            if added or removed:
+                detail = {"added": added, "removed": removed}
+        elif field == "acf":
+            current = post.acf or {}
+            keys = sorted(key for key in value if current.get(key) != value[key])
+            if keys:
+                value = {key: value[key] for key in keys}
+                detail = {"keys": keys}
+        elif getattr(post, field, None) != value:
+            detail = {"before": getattr(post, field, None), "after": value}
+        
+        if detail is None:
+            unchanged.append(field)
+        else:
+            changes[field] = value
+            changed[field] = detail
+    
+    return changes, {"changed": changed, "unchanged": unchanged}
@@ -0,0 +1,82 @@
+"""Background job kinds for the long-running post tools."""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .async_post_service import AsyncPostService
+from .job_queue import Handler, Job
+
+logger = logging.getLogger(__name__)
+
+# Job kind -> parameter holding the items the job is checkpointed over
+JOB_ITEMS = {
+    "generate_post": "topics",
+    "improve_posts": "post_ids",
+    "optimize_seo": "post_ids",
+    "optimize_seo_batch": "post_ids",
+}
+
+
+def split_job_params(kind: str, params: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Any]]:
+    """Separate a job's items (topics or post IDs) from its shared parameters."""
+    if kind not in JOB_ITEMS:
+        raise ValueError(f"Unknown job kind: {kind}. Use one of: {', '.join(JOB_ITEMS)}")
+    params = dict(params)
+    items = params.pop(JOB_ITEMS[kind], None)
+    if not items:
+        raise ValueError(f"A {kind} job needs a non-empty '{JOB_ITEMS[kind]}' list")
+    if JOB_ITEMS[kind] == "post_ids":
+        items = list(dict.fromkeys(int(post_id) for post_id in items))
+    return params, items
+
+
+def make_post_job_handlers(service_for: Callable[[Optional[str]], AsyncPostService]) -> Dict[str, Handler]:
+    """Handlers for each job kind, running on ``service_for(site)`` for the job's ``site`` param."""
+    
+    async def generate_post(job: Job) -> None:
+        service, params = _target(job, service_for)
+        for seq, topic in await job.pending():
+            try:
+                result = await service.generate_post(topic=topic, **params)
+            except Exception as e:
+                result = {"topic": topic, "status": "error", "error": str(e)}
+            await job.record(seq, result)
+    
+    async def improve_posts(job: Job) -> None:
+        service, params = _target(job, service_for)
+        await _run_bulk(job, service.bulk_improve_posts, params)
+    
+    async def optimize_seo(job: Job) -> None:
+        service, params = _target(job, service_for)
+        await _run_bulk(job, service.bulk_optimize_seo, params)
+    
+    async def optimize_seo_batch(job: Job) -> None:
+        # Keep the batch ID so a restarted job waits for it instead of resubmitting
+        async def submitted(batch_id: str) -> None:
+            await job.update_params(batch_id=batch_id)
+        
+        service, params = _target(job, service_for)
+        await _run_bulk(job, service.batch_optimize_seo, params, on_submitted=submitted)
+    
+    return {
+        "generate_post": generate_post,
+        "improve_posts": improve_posts,
+        "optimize_seo": optimize_seo,
+        "optimize_seo_batch": optimize_seo_batch,
+    }
+
+
+def _target(job: Job, service_for: Callable[[Optional[str]], AsyncPostService]) -> Tuple[AsyncPostService, Dict[str, Any]]:
+    """The job's post service and its parameters without ``site``."""
+    params = dict(job.params)
+    return service_for(params.pop("site", None)), params
+
+
+async def _run_bulk(job: Job, run, params: Dict[str, Any], **extra: Any) -> None:
+    """Run a bulk pipeline over the job's unfinished posts, checkpointing each one."""
+    seqs = {post_id: seq for seq, post_id in await job.pending()}
+    
+    async def checkpoint(completed: int, total: int, result: Dict[str, Any]) -> None:
+        await job.record(seqs[result["post_id"]], result)
+    
+    if seqs:
+        await run(list(seqs), on_progress=checkpoint, **params, **extra)
@@ -1,94 +1,171 @@
 """Service for managing WordPress posts."""
 
 import logging
-from typing import List, Optional, Dict, Any
-from ..api.wordpress_client import WordPressClient
-from ..models.post import Post, PostCreate, PostUpdate
-from .content_generator import ContentGenerator
+from typing import List, Optional, Dict, Any, Tuple, Union
+from ..api.wordpress_client import Embed, WordPressClient, get_wordpress_client
+from ..config.settings import settings
+from ..models.post import POST_FIELDS, Post, PostCreate, PostSummary, PostUpdate
+from ..utils.html_sections import replace_sections
+from ..utils.tracing import traced
+from .post_cache import PostCache
+from .outline_index import get_outline_index
+from .post_diff import diff_update
+from .site_mirror import SiteMirror, get_site_mirror
+from .taxonomy_index import TaxonomyIndex
 
 logger = logging.getLogger(__name__)
 
+# Fields each listing turns into output; everything else is left on the server
+LIST_FIELDS = ["id", "title", "status", "date", "link", "excerpt"]
+SEARCH_FIELDS = ["id", "title", "excerpt", "link"]
+
 
 class PostService:
     """Service for post management operations."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        wp_client: Optional[WordPressClient] = None,
+        mirror: Optional[SiteMirror] = None
+    ):
         """Initialize post service."""
-        self.wp_client = WordPressClient()
-        self.content_generator = ContentGenerator()
+        self.wp_client = wp_client or get_wordpress_client()
+        self.mirror = mirror or get_site_mirror(self.wp_client)
+        self.taxonomy = TaxonomyIndex(self.wp_client, refresh_interval=settings.TAXONOMY_REFRESH_INTERVAL)
+        self.post_cache = PostCache(
+            max_entries=settings.POST_CACHE_MAX_ENTRIES,
+            ttl=settings.POST_CACHE_TTL
+        )
+        self.outlines = get_outline_index()
     
+    @traced()
     def list_posts(
         self,
         per_page: int = 10,
         page: int = 1,
         status: str = "publish",
         search: Optional[str] = None,
-        categories: Optional[List[int]] = None
+        categories: Optional[List[int]] = None,
+        embed: Embed = None
     ) -> List[Dict[str, Any]]:
-        """List posts with filtering."""
+        """List posts with filtering.
+        
+        With ``embed`` (True or relation names such as ``author``,
+        ``wp:featuredmedia``, ``wp:term``), each post also carries WordPress'
+        ``_embedded`` resources.
+        """
         try:
-            posts = self.wp_client.get_posts(
-                per_page=per_page,
-                page=page,
-                status=status,
-                search=search,
-                categories=categories
-            )
+            if not search and not embed and self._mirror_ready():
+                posts = self.mirror.list_posts(
+                    per_page=per_page,
+                    page=page,
+                    status=status,
+                    categories=categories
+                )
+            else:
+                posts = self.wp_client.get_posts(
+                    per_page=per_page,
+                    page=page,
+                    status=status,
+                    search=search,
+                    categories=categories,
+                    fields=LIST_FIELDS,
+                    embed=embed
+                )
             
             # Return simplified post data
-            return [
-                {
-                    "id": post["id"],
-                    "title": post["title"]["rendered"] if isinstance(post["title"], dict) else post["title"],
-                    "status": post["status"],
-                    "date": post["date"],
-                    "link": post["link"],
-                    "excerpt": post["excerpt"]["rendered"] if isinstance(post["excerpt"], dict) else post.get("excerpt", "")
-                }
-                for post in posts
-            ]
+            summaries = [PostSummary.from_api_response(post).to_dict(LIST_FIELDS) for post in posts]
+            if embed:
+                for summary, post in zip(summaries, posts):
+                    summary["_embedded"] = post.get("_embedded", {})
+            return summaries
         
         except Exception as e:
             logger.error(f"Error listing posts: {str(e)}")
             raise
     
+    @traced()
     def get_post(self, post_id: int) -> Post:
         """Get a specific post with full details."""
         try:
-            post_data = self.wp_client.get_post(post_id)
+            post_data = self._get_post_data(post_id)
             return Post.from_api_response(post_data)
         
         except Exception as e:
             logger.error(f"Error getting post {post_id}: {str(e)}")
             raise
     
-    def create_post(self, post_data: PostCreate) -> Post:
-        """Create a new post."""
+    @traced()
+    def get_post_for_edit(self, post_id: int) -> Post:
+        """Get a post with its stored title, content and excerpt (``context=edit``).
+        
+        This is the text ``save_post_changes`` compares with, so rewrites
+        based on it are not taken for changes to WordPress' rendered markup.
+        """
         try:
-            # Prepare data for WordPress API
-            wp_data = {
-                "title": post_data.title,
-                "content": post_data.content,
-                "status": post_data.status,
-            }
-            
-            if post_data.excerpt:
-                wp_data["excerpt"] = post_data.excerpt
-            
-            if post_data.categories:
-                wp_data["categories"] = post_data.categories
-            
-            if post_data.tags:
-                wp_data["tags"] = post_data.tags
+            post_data = self.wp_client.get_post(post_id, fields=POST_FIELDS, context="edit")
+            return Post.from_api_response(post_data, raw=True)
+        
+        except Exception as e:
+            logger.error(f"Error getting post {post_id} for editing: {str(e)}")
+            raise
+    
+    def _get_post_data(self, post_id: int) -> Dict[str, Any]:
+        """Read a post through the cache, revalidating stale entries cheaply.
+        
+        Stale entries are revalidated with a conditional GET when the server
+        sent ETag/Last-Modified validators, otherwise with a ``_fields=modified_gmt``
+        probe. The full post is only refetched when it actually changed.
+        A site mirror synced within ``MIRROR_MAX_STALENESS`` is consulted first.
+        """
+        if self._mirror_ready():
+            data = self.mirror.get_post(post_id)
+            if data is not None:
+                return data
+        
+        entry = self.post_cache.get(post_id)
+        
+        if entry is not None:
+            if self.post_cache.is_fresh(entry):
+                self.post_cache.record("hits")
+                return entry.data
             
-            if post_data.featured_media:
-                wp_data["featured_media"] = post_data.featured_media
+            if entry.etag or entry.last_modified:
+                data, validators = self.wp_client.get_post_conditional(
+                    post_id,
+                    etag=entry.etag,
+                    last_modified=entry.last_modified,
+                    fields=POST_FIELDS
+                )
+                if data is None:
+                    self.post_cache.touch(post_id)
+                    self.post_cache.record("revalidated")
+                    return entry.data
+                self.post_cache.put(post_id, data, validators.get("ETag"), validators.get("Last-Modified"))
+                self.post_cache.record("misses")
+                return data
             
-            if post_data.acf_fields:
-                wp_data["acf"] = post_data.acf_fields
+            if self.wp_client.get_post_modified(post_id) == entry.modified_gmt:
+                self.post_cache.touch(post_id)
+                self.post_cache.record("revalidated")
+                return entry.data
+        
+        data, validators = self.wp_client.get_post_conditional(post_id, fields=POST_FIELDS)
+        self.post_cache.put(post_id, data, validators.get("ETag"), validators.get("Last-Modified"))
+        self.post_cache.record("misses")
+        return data
+    
+    @traced()
+    def create_post(self, post_data: PostCreate) -> Post:
+        """Create a new post."""
+        try:
+            wp_data = create_payload(post_data)
             
             # Create post
-            created_post = self.wp_client.create_post(wp_data)
+            created_post = self.wp_client.create_post(wp_data, fields=POST_FIELDS)
+            if self.mirror is not None:
+                self.mirror.upsert_post(created_post)
+            self.taxonomy.invalidate()
             
             logger.info(f"Created post: {created_post['id']} - {created_post['title']['rendered']}")
             
@@ -98,51 +175,58 @@ class PostService:
             logger.error(f"Error creating post: {str(e)}")
             raise
     
+    @traced()
     def update_post(self, post_id: int, post_data: PostUpdate) -> Post:
         """Update an existing post."""
+        return self.save_post_changes(post_id, post_data)[0]
+    
+    @traced()
+    def save_post_changes(
+        self,
+        post_id: int,
+        post_data: PostUpdate
+    ) -> Tuple[Post, Dict[str, Any]]:
+        """Update a post with only the fields that differ from the stored post.
+        
+        The post is read with ``context=edit`` so text fields are compared
+        with what is stored rather than with WordPress' rendered output
+        (wpautop, texturize, shortcodes). Nothing is sent when no field
+        changes, so WordPress creates no revision. Returns the post and the
+        diff summary of ``diff_update`` plus ``written``.
+        """
         try:
-            # Prepare data for WordPress API (only include non-None fields)
-            wp_data = {}
-            
-            if post_data.title is not None:
-                wp_data["title"] = post_data.title
-            
-            if post_data.content is not None:
-                wp_data["content"] = post_data.content
-            
-            if post_data.status is not None:
-                wp_data["status"] = post_data.status
-            
-            if post_data.excerpt is not None:
-                wp_data["excerpt"] = post_data.excerpt
-            
-            if post_data.categories is not None:
-                wp_data["categories"] = post_data.categories
-            
-            if post_data.tags is not None:
-                wp_data["tags"] = post_data.tags
+            stored = self.wp_client.get_post(post_id, fields=POST_FIELDS, context="edit")
+            wp_data, diff = diff_update(Post.from_api_response(stored, raw=True), update_payload(post_data))
             
-            if post_data.featured_media is not None:
-                wp_data["featured_media"] = post_data.featured_media
-            
-            if post_data.acf_fields is not None:
-                wp_data["acf"] = post_data.acf_fields
+            if not wp_data:
+                logger.info(f"Post {post_id} unchanged; skipped update")
+                return Post.from_api_response(stored), {"written": False, **diff}
             
             # Update post
-            updated_post = self.wp_client.update_post(post_id, wp_data)
+            self.post_cache.invalidate(post_id)
+            updated_post = self.wp_client.update_post(post_id, wp_data, fields=POST_FIELDS)
+            if self.mirror is not None:
+                self.mirror.upsert_post(updated_post)
+            if wp_data.keys() & {"categories", "tags", "status"}:
+                self.taxonomy.invalidate()
             
-            logger.info(f"Updated post: {post_id}")
+            logger.info(f"Updated post {post_id}: {', '.join(wp_data)}")
             
-            return Post.from_api_response(updated_post)
+            return Post.from_api_response(updated_post), {"written": True, **diff}
         
         except Exception as e:
             logger.error(f"Error updating post {post_id}: {str(e)}")
             raise
     
+    @traced()
     def delete_post(self, post_id: int, force: bool = False) -> Dict[str, Any]:
         """Delete a post."""
         try:
+            self.post_cache.invalidate(post_id)
             result = self.wp_client.delete_post(post_id, force=force)
+            if self.mirror is not None:
+                self.mirror.delete_post(post_id)
+            self.taxonomy.invalidate()
             logger.info(f"Deleted post: {post_id} (force={force})")
             return result
         
@@ -150,161 +234,406 @@ class PostService:
             logger.error(f"Error deleting post {post_id}: {str(e)}")
             raise
     
-    def search_posts(
-        self,
-        query: str,
-        search_in: Optional[List[str]] = None
-    ) -> List[Dict[str, Any]]:
-        """Search for posts."""
+    @traced()
+    def get_outline(self, post_id: int) -> Dict[str, Any]:
+        """Headings, word counts and section IDs of a post's stored content, without the content."""
         try:
-            posts = self.wp_client.search_posts(query, search_columns=search_in)
+            post = self.get_post_for_edit(post_id)
+            return {"post_id": post.id, "title": post.title, **self.outlines.outline(post.content).to_dict()}
+        
+        except Exception as e:
+            logger.error(f"Error getting outline of post {post_id}: {str(e)}")
+            raise
+    
+    @traced()
+    def get_section(self, post_id: int, section_id: str) -> Dict[str, Any]:
+        """Stored HTML of one section of a post, by the ID from ``get_outline``."""
+        try:
+            post = self.get_post_for_edit(post_id)
+            outline = self.outlines.outline(post.content)
+            index = outline.find(section_id)
+            return {
+                "post_id": post.id,
+                "section_id": section_id,
+                "heading": outline.sections[index].heading,
+                "words": outline.words[index],
+                "html": outline.sections[index].html,
+                "content_hash": outline.content_hash
+            }
+        
+        except Exception as e:
+            logger.error(f"Error getting section {section_id} of post {post_id}: {str(e)}")
+            raise
+    
+    @traced()
+    def replace_section(self, post_id: int, section_id: str, html: str) -> Dict[str, Any]:
+        """Replace one section of a post, leaving the rest of its markup as is.
+        
+        The section is spliced into the stored (``context=edit``) content, so
+        block comments and shortcodes elsewhere are kept. The post is read
+        fresh, so a section edited elsewhere since the outline was read no
+        longer matches its ID and is not overwritten. Returns the diff
+        summary and the outline of the saved post.
+        """
+        try:
+            current = self.get_post_for_edit(post_id)
+            outline = self.outlines.outline(current.content)
+            section = outline.sections[outline.find(section_id)]
+            content = replace_sections(current.content, [section], [html.strip()])
             
-            return [
-                {
-                    "id": post["id"],
-                    "title": post["title"]["rendered"] if isinstance(post["title"], dict) else post["title"],
-                    "excerpt": post["excerpt"]["rendered"] if isinstance(post["excerpt"], dict) else post.get("excerpt", ""),
-                    "link": post["link"]
-                }
-                for post in posts
+            post, changes = self.save_post_changes(post_id, PostUpdate(content=content))
+            updated = self.outlines.outline(content)
+            return {
+                "post_id": post.id,
+                "replaced": section_id,
+                "changes": changes,
+                **updated.to_dict()
+            }
+        
+        except Exception as e:
+            logger.error(f"Error replacing section {section_id} of post {post_id}: {str(e)}")
+            raise
+    
+    @traced()
+    def bulk_create_posts(self, posts: List[PostCreate]) -> List[Dict[str, Any]]:
+        """Create several posts in batch requests; one result per post, in order."""
+        try:
+            responses = self.wp_client.bulk_create_posts(
+                [create_payload(post_data) for post_data in posts],
+                fields=POST_FIELDS
+            )
+            results = [self._bulk_result(None, response, "created") for response in responses]
+            self.taxonomy.invalidate()
+            logger.info(f"Bulk created {_count_ok(results)}/{len(results)} posts")
+            return results
+        
+        except Exception as e:
+            logger.error(f"Error bulk creating posts: {str(e)}")
+            raise
+    
+    @traced()
+    def bulk_update_posts(self, updates: List[Tuple[int, PostUpdate]]) -> List[Dict[str, Any]]:
+        """Apply ``(post_id, update)`` pairs in batch requests; one result per update, in order."""
+        try:
+            for post_id, _ in updates:
+                self.post_cache.invalidate(post_id)
+            responses = self.wp_client.bulk_update_posts(
+                [(post_id, update_payload(post_data)) for post_id, post_data in updates],
+                fields=POST_FIELDS
+            )
+            results = [
+                self._bulk_result(post_id, response, "updated")
+                for (post_id, _), response in zip(updates, responses)
             ]
+            self.taxonomy.invalidate()
+            logger.info(f"Bulk updated {_count_ok(results)}/{len(results)} posts")
+            return results
         
         except Exception as e:
-            logger.error(f"Error searching posts: {str(e)}")
+            logger.error(f"Error bulk updating posts: {str(e)}")
             raise
     
-    def generate_post(
+    @traced()
+    def bulk_delete_posts(self, post_ids: List[int], force: bool = False) -> List[Dict[str, Any]]:
+        """Trash (or with ``force`` delete) several posts; one result per post, in order."""
+        try:
+            for post_id in post_ids:
+                self.post_cache.invalidate(post_id)
+            responses = self.wp_client.bulk_delete_posts(post_ids, force=force)
+            outcome = "deleted" if force else "trashed"
+            results = [
+                self._bulk_result(post_id, response, outcome)
+                for post_id, response in zip(post_ids, responses)
+            ]
+            self.taxonomy.invalidate()
+            logger.info(f"Bulk {outcome} {_count_ok(results)}/{len(results)} posts")
+            return results
+        
+        except Exception as e:
+            logger.error(f"Error bulk deleting posts: {str(e)}")
+            raise
+    
+    def _bulk_result(
         self,
-        topic: str,
-        keywords: Optional[List[str]] = None,
-        tone: str = "professional",
-        length: str = "medium",
-        language: str = "da",
-        save_as_draft: bool = True
+        post_id: Optional[int],
+        response: Dict[str, Any],
+        outcome: str
     ) -> Dict[str, Any]:
-        """Generate a blog post using AI."""
+        """Turn one batch sub-response into a tool result, writing successes through to the mirror."""
+        body = response.get("body") or {}
+        status_code = response.get("status", 500)
+        if status_code >= 300:
+            return {
+                "id": post_id,
+                "status": "error",
+                "http_status": status_code,
+                "code": body.get("code"),
+                "error": body.get("message", "")
+            }
+        
+        if outcome == "deleted":
+            if self.mirror is not None:
+                self.mirror.delete_post(post_id)
+            return {"id": post_id, "status": outcome}
+        
+        if self.mirror is not None:
+            self.mirror.upsert_post(body)
+        summary = PostSummary.from_api_response({"id": post_id, **body})
+        return {
+            "id": summary.id,
+            "status": outcome,
+            "title": summary.title,
+            "link": summary.link,
+            "post_status": summary.status
+        }
+    
+    @traced()
+    def find_post_ids(
+        self,
+        status: str = "publish",
+        categories: Optional[List[int]] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None
+    ) -> List[int]:
+        """IDs of every post matching the filter, oldest first."""
         try:
-            # Generate content
-            generated = self.content_generator.generate_blog_post(
-                topic=topic,
-                keywords=keywords,
-                tone=tone,
-                length=length,
-                language=language
+            posts = self.wp_client.iter_posts(
+                status=status,
+                categories=categories,
+                after=after,
+                before=before,
+                fields=["id"]
             )
-            
-            if save_as_draft:
-                # Create post as draft
-                post_data = PostCreate(
-                    title=generated["title"],
-                    content=generated["content"],
-                    excerpt=generated["excerpt"],
-                    status="draft"
-                )
-                
-                post = self.create_post(post_data)
-                
-                return {
-                    "post_id": post.id,
-                    "title": post.title,
-                    "link": post.link,
-                    "status": post.status,
-                    "content": generated["content"],
-                    "excerpt": generated["excerpt"]
-                }
-            else:
-                # Return generated content without saving
-                return generated
+            return sorted(post["id"] for post in posts)
         
         except Exception as e:
-            logger.error(f"Error generating post: {str(e)}")
+            logger.error(f"Error finding posts: {str(e)}")
             raise
     
-    def improve_post(
+    @traced()
+    def get_terms(self, taxonomy: str) -> List[Dict[str, Any]]:
+        """All categories or tags, from the taxonomy index."""
+        try:
+            return self.taxonomy.terms(taxonomy)
+        
+        except Exception as e:
+            logger.error(f"Error getting {taxonomy}: {str(e)}")
+            raise
+    
+    @traced()
+    def resolve_terms(
         self,
-        post_id: int,
-        improvements: List[str],
-        save_changes: bool = False
-    ) -> Dict[str, Any]:
-        """Improve existing post content."""
+        taxonomy: str,
+        refs: List[Union[int, str]],
+        create_missing: bool = True
+    ) -> List[int]:
+        """Turn term IDs, slugs or names into IDs, creating missing names in one batch."""
         try:
-            # Get current post
-            post = self.get_post(post_id)
-            
-            # Improve content
-            improved_content = self.content_generator.improve_content(
-                content=post.content,
-                improvements=improvements,
-                language="da"  # Could be detected or passed as parameter
-            )
-            
-            if save_changes:
-                # Update post with improved content
-                post_data = PostUpdate(content=improved_content)
-                updated_post = self.update_post(post_id, post_data)
-                
-                return {
-                    "post_id": updated_post.id,
-                    "title": updated_post.title,
-                    "improved_content": improved_content,
-                    "saved": True
-                }
-            else:
-                # Return improved content without saving
-                return {
-                    "post_id": post_id,
-                    "title": post.title,
-                    "original_content": post.content,
-                    "improved_content": improved_content,
-                    "saved": False
-                }
+            return self.taxonomy.resolve(taxonomy, refs, create_missing=create_missing)
         
         except Exception as e:
-            logger.error(f"Error improving post {post_id}: {str(e)}")
+            logger.error(f"Error resolving {taxonomy} {refs}: {str(e)}")
             raise
     
-    def optimize_post_seo(
+    @traced()
+    def sync_mirror(self, full: bool = False) -> Dict[str, Any]:
+        """Sync the local site mirror now (bulk load when ``full``)."""
+        if self.mirror is None:
+            raise ValueError("Site mirror is disabled; set MIRROR_ENABLED=true")
+        try:
+            return self.mirror.sync(full=full)
+        
+        except Exception as e:
+            logger.error(f"Error syncing site mirror: {str(e)}")
+            raise
+    
+    def _mirror_ready(self) -> bool:
+        return self.mirror is not None and self.mirror.ensure_fresh(settings.MIRROR_MAX_STALENESS)
+    
+    @traced()
+    def search_posts(
         self,
-        post_id: int,
-        target_keywords: Optional[List[str]] = None,
-        save_changes: bool = False
-    ) -> Dict[str, Any]:
-        """Optimize post for SEO."""
+        query: str,
+        search_in: Optional[List[str]] = None,
+        per_page: int = 20,
+        page: int = 1
+    ) -> List[Dict[str, Any]]:
+        """Search for posts.
+        
+        Uses the site mirror's ranked full-text index (with score and snippet)
+        when the mirror is fresh, otherwise WordPress' own search.
+        """
         try:
-            # Get current post
-            post = self.get_post(post_id)
+            if self._mirror_ready():
+                return self.mirror.search(query, columns=search_in, per_page=per_page, page=page)
             
-            # Get SEO optimization suggestions
-            seo_data = self.content_generator.optimize_for_seo(
-                title=post.title,
-                content=post.content,
-                target_keywords=target_keywords,
-                language="da"
+            posts = self.wp_client.search_posts(
+                query,
+                search_columns=search_in,
+                per_page=per_page,
+                page=page,
+                fields=SEARCH_FIELDS
             )
             
-            if save_changes:
-                # Update post with optimized title
-                post_data = PostUpdate(title=seo_data["title"])
-                updated_post = self.update_post(post_id, post_data)
-                
-                return {
-                    "post_id": updated_post.id,
-                    "optimized_title": seo_data["title"],
-                    "meta_description": seo_data["meta_description"],
-                    "content_suggestions": seo_data.get("content_suggestions", []),
-                    "saved": True
-                }
-            else:
-                return {
-                    "post_id": post_id,
-                    "current_title": post.title,
-                    "optimized_title": seo_data["title"],
-                    "meta_description": seo_data["meta_description"],
-                    "content_suggestions": seo_data.get("content_suggestions", []),
-                    "saved": False
-                }
+            return [PostSummary.from_api_response(post).to_dict(SEARCH_FIELDS) for post in posts]
         
         except Exception as e:
-            logger.error(f"Error optimizing post {post_id} for SEO: {str(e)}")
+            logger.error(f"Error searching posts: {str(e)}")
             raise
+    
+    @traced()
+    def save_generated_post(
+        self,
+        generated: Dict[str, str],
+        save_as_draft: bool = True
+    ) -> Dict[str, Any]:
+        """Save generated content as a draft and build the tool result."""
+        if save_as_draft:
+            # Create post as draft
+            post_data = PostCreate(
+                title=generated["title"],
+                content=generated["content"],
+                excerpt=generated["excerpt"],
+                status="draft"
+            )
+            
+            post = self.create_post(post_data)
+            
+            return {
+                "post_id": post.id,
+                "title": post.title,
+                "link": post.link,
+                "status": post.status,
+                "content": generated["content"],
+                "excerpt": generated["excerpt"]
+            }
+        else:
+            # Return generated content without saving
+            return generated
+    
+    @traced()
+    def apply_improvement(
+        self,
+        post: Post,
+        improved_content: str,
+        save_changes: bool = False
+    ) -> Dict[str, Any]:
+        """Optionally save improved content and build the tool result."""
+        post_id = post.id
+        
+        if save_changes:
+            # Update post with improved content, unless it is unchanged
+            post_data = PostUpdate(content=improved_content)
+            updated_post, changes = self.save_post_changes(post_id, post_data)
+            
+            return {
+                "post_id": updated_post.id,
+                "title": updated_post.title,
+                "improved_content": improved_content,
+                "saved": True,
+                "changes": changes
+            }
+        else:
+            # Return improved content without saving
+            return {
+                "post_id": post_id,
+                "title": post.title,
+                "original_content": post.content,
+                "improved_content": improved_content,
+                "saved": False
+            }
+    
+    @traced()
+    def apply_seo_optimization(
+        self,
+        post: Post,
+        seo_data: Dict[str, Any],
+        save_changes: bool = False
+    ) -> Dict[str, Any]:
+        """Optionally save the optimized title and build the tool result."""
+        post_id = post.id
+        
+        if save_changes:
+            # Update post with optimized title, unless it is unchanged
+            post_data = PostUpdate(title=seo_data["title"])
+            updated_post, changes = self.save_post_changes(post_id, post_data)
+            
+            return {
+                "post_id": updated_post.id,
+                "optimized_title": seo_data["title"],
+                "meta_description": seo_data["meta_description"],
+                "content_suggestions": seo_data.get("content_suggestions", []),
+                "saved": True,
+                "changes": changes
+            }
+        else:
+            return {
+                "post_id": post_id,
+                "current_title": post.title,
+                "optimized_title": seo_data["title"],
+                "meta_description": seo_data["meta_description"],
+                "content_suggestions": seo_data.get("content_suggestions", []),
+                "saved": False
+            }
+
 
+
+def _count_ok(results: List[Dict[str, Any]]) -> int:
+    return sum(1 for result in results if result.get("status") != "error")
+
+
+def create_payload(post_data: PostCreate) -> Dict[str, Any]:
+    """WordPress request body for a new post."""
+    wp_data = {
+        "title": post_data.title,
+        "content": post_data.content,
+        "status": post_data.status,
+    }
+    
+    if post_data.excerpt:
+        wp_data["excerpt"] = post_data.excerpt
+    
+    if post_data.categories:
+        wp_data["categories"] = post_data.categories
+    
+    if post_data.tags:
+        wp_data["tags"] = post_data.tags
+    
+    if post_data.featured_media:
+        wp_data["featured_media"] = post_data.featured_media
+    
+    if post_data.acf_fields:
+        wp_data["acf"] = post_data.acf_fields
+    
+    return wp_data
+
+
+def update_payload(post_data: PostUpdate) -> Dict[str, Any]:
+    """WordPress request body for an update (only fields that are set)."""
+    wp_data = {}
+    
+    if post_data.title is not None:
+        wp_data["title"] = post_data.title
+    
+    if post_data.content is not None:
+        wp_data["content"] = post_data.content
+    
+    if post_data.status is not None:
+        wp_data["status"] = post_data.status
+    
+    if post_data.excerpt is not None:
+        wp_data["excerpt"] = post_data.excerpt
+    
+    if post_data.categories is not None:
+        wp_data["categories"] = post_data.categories
+    
+    if post_data.tags is not None:
+        wp_data["tags"] = post_data.tags
+    
+    if post_data.featured_media is not None:
+        wp_data["featured_media"] = post_data.featured_media
+    
+    if post_data.acf_fields is not None:
+        wp_data["acf"] = post_data.acf_fields
+    
+    return wp_data
@@ -0,0 +1,541 @@
+"""Local SQLite mirror of a WordPress site's posts, categories and tags."""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from ..api.wordpress_client import WordPressClient
+from ..config.settings import settings
+from ..models.post import POST_FIELDS
+from ..utils.html_text import strip_html
+from .taxonomy_index import TERM_FIELDS
+
+logger = logging.getLogger(__name__)
+
+TAXONOMIES = ("categories", "tags")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    status TEXT NOT NULL,
+    date TEXT NOT NULL,
+    modified TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_date ON posts(date, id);
+CREATE TABLE IF NOT EXISTS post_terms (
+    post_id INTEGER NOT NULL,
+    taxonomy TEXT NOT NULL,
+    term_id INTEGER NOT NULL,
+    PRIMARY KEY (post_id, taxonomy, term_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS post_terms_term ON post_terms(taxonomy, term_id);
+CREATE TABLE IF NOT EXISTS terms (
+    taxonomy TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (taxonomy, id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, excerpt, content,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+# BM25 column weights: title, excerpt, content
+SEARCH_RANK = "bm25(10.0, 3.0, 1.0)"
+SEARCH_COLUMNS = ("title", "excerpt", "content")
+
+
+class SiteMirror:
+    """Incrementally synced local copy of the site.
+    
+    The first sync bulk-loads every post (``status=any``) and all terms.
+    Later syncs only fetch posts with ``modified_after`` the newest mirrored
+    ``modified`` timestamp, ordered by ``modified``. Deletions and trashed
+    posts do not show up in that delta, so every ``tombstone_interval``
+    seconds the mirror also fetches the live list of post IDs and drops the
+    rest.
+    
+    An FTS5 index over title, excerpt and HTML-stripped content is kept in
+    step with every stored or removed post and backs ``search``.
+    """
+    
+    def __init__(
+        self,
+        wp_client: WordPressClient,
+        path: str,
+        tombstone_interval: float = 3600
+    ):
+        """Initialize mirror backed by the SQLite file at ``path``."""
+        self.wp_client = wp_client
+        self.tombstone_interval = tombstone_interval
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._loader: Optional[threading.Thread] = None
+        self._closing = False
+        
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.execute("INSERT INTO posts_fts (posts_fts, rank) VALUES ('rank', ?)", (SEARCH_RANK,))
+        self._db.commit()
+        if self._get_state("search_index") is None:
+            self._rebuild_search_index()
+    
+    # Sync
+    
+    def sync(self, full: bool = False, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Bring the mirror up to date; returns sync statistics.
+        
+        With ``max_age``, the sync is skipped (returning None) when another
+        caller already synced within that many seconds.
+        """
+        with self._sync_lock:
+            if max_age is not None and self.is_loaded() and self.age() <= max_age:
+                return None
+            
+            started = time.time()
+            watermark = self._get_state("watermark")
+            if full or watermark is None or not self.is_loaded():
+                mode = "full"
+                fetched = self._bulk_load()
+            else:
+                mode = "delta"
+                fetched = self._delta_sync(watermark)
+            
+            deleted = 0
+            last_check = float(self._get_state("tombstones_checked_at") or 0)
+            if mode == "full" or started - last_check >= self.tombstone_interval:
+                deleted = self._remove_tombstones()
+                self._load_terms()
+                self._set_state("tombstones_checked_at", started)
+            
+            self._set_state("last_sync", started)
+            stats = {
+                "mode": mode,
+                "fetched": fetched,
+                "deleted": deleted,
+                "posts": self.count(),
+                "duration": round(time.time() - started, 3),
+            }
+            logger.info(f"Site mirror {mode} sync: {stats}")
+            return stats
+    
+    def ensure_fresh(self, max_age: float) -> bool:
+        """Return True when the mirror may serve reads within ``max_age`` seconds.
+        
+        A stale mirror is delta-synced first. An empty mirror is bulk-loaded
+        in the background and callers should go to WordPress meanwhile.
+        """
+        if not self.is_loaded():
+            self.start_background_load()
+            return False
+        if self.age() > max_age:
+            try:
+                self.sync(max_age=max_age)
+            except Exception as e:
+                logger.error(f"Site mirror sync failed: {str(e)}")
+                return False
+        return True
+    
+    def start_background_load(self) -> None:
+        """Run the initial bulk load on a background thread (once)."""
+        with self._lock:
+            if self._loader is not None or self._closing:
+                return
+            self._loader = threading.Thread(target=self._background_load, name="site-mirror", daemon=True)
+            self._loader.start()
+    
+    def _background_load(self) -> None:
+        try:
+            self.sync(max_age=float("inf"))
+        except Exception as e:
+            logger.error(f"Site mirror bulk load failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._loader = None
+                if self._closing:
+                    self._db.close()
+    
+    def _bulk_load(self) -> int:
+        return self._store_stream(
+            self.wp_client.iter_posts(status="any", orderby="id", order="asc", fields=POST_FIELDS)
+        )
+    
+    def _delta_sync(self, watermark: str) -> int:
+        # modified_after is exclusive and second-granular; step back one second
+        # so posts saved in the same second as the watermark are not missed
+        since = (datetime.fromisoformat(watermark) - timedelta(seconds=1)).isoformat()
+        return self._store_stream(
+            self.wp_client.iter_posts(
+                status="any",
+                modified_after=since,
+                orderby="modified",
+                order="asc",
+                fields=POST_FIELDS
+            )
+        )
+    
+    def _store_stream(self, posts: Iterable[Dict[str, Any]]) -> int:
+        """Store posts in chunks as pages arrive, then advance the watermark.
+        
+        Pages arrive out of order, so the watermark only moves once every
+        page was stored; an interrupted sync is simply repeated.
+        """
+        fetched = 0
+        newest: Optional[str] = None
+        chunk: List[Dict[str, Any]] = []
+        for post in posts:
+            chunk.append(post)
+            if newest is None or post["modified"] > newest:
+                newest = post["modified"]
+            if len(chunk) >= 100:
+                self._store_posts(chunk)
+                fetched += len(chunk)
+                chunk = []
+        if chunk:
+            self._store_posts(chunk)
+            fetched += len(chunk)
+        
+        watermark = self._get_state("watermark")
+        if newest is not None and (watermark is None or newest > watermark):
+            self._set_state("watermark", newest)
+        return fetched
+    
+    def _remove_tombstones(self) -> int:
+        live_ids = set(self.wp_client.get_post_ids(status="any"))
+        with self._lock:
+            local_ids = {row[0] for row in self._db.execute("SELECT id FROM posts")}
+            gone = list(local_ids - live_ids)
+            self._drop_posts(gone)
+            self._db.commit()
+        return len(gone)
+    
+    def _load_terms(self) -> None:
+        for taxonomy in TAXONOMIES:
+            terms = list(self.wp_client.iter_terms(taxonomy, fields=TERM_FIELDS))
+            with self._lock:
+                self._db.execute("DELETE FROM terms WHERE taxonomy = ?", (taxonomy,))
+                self._db.executemany(
+                    "INSERT INTO terms (taxonomy, id, name, data) VALUES (?, ?, ?, ?)",
+                    [(taxonomy, term["id"], term.get("name", ""), json.dumps(term)) for term in terms]
+                )
+                self._db.commit()
+    
+    # Writes from PostService
+    
+    def upsert_post(self, data: Dict[str, Any]) -> None:
+        """Store a post returned by WordPress (sync or write-through)."""
+        if data.get("status") == "trash":
+            self.delete_post(data["id"])
+            return
+        self._store_posts([data])
+    
+    def delete_post(self, post_id: int) -> None:
+        """Remove a post that was deleted or trashed."""
+        with self._lock:
+            self._drop_posts([post_id])
+            self._db.commit()
+    
+    def _drop_posts(self, post_ids: List[int]) -> None:
+        rows = [(post_id,) for post_id in post_ids]
+        self._db.executemany("DELETE FROM posts WHERE id = ?", rows)
+        self._db.executemany("DELETE FROM post_terms WHERE post_id = ?", rows)
+        self._db.executemany("DELETE FROM posts_fts WHERE rowid = ?", rows)
+    
+    def _store_posts(self, posts: List[Dict[str, Any]]) -> None:
+        # Never moves the watermark: a write-through of our own edit must not
+        # skip over changes made elsewhere since the last sync
+        with self._lock:
+            for post in posts:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO posts (id, status, date, modified, data) VALUES (?, ?, ?, ?, ?)",
+                    (post["id"], post["status"], post["date"], post["modified"], json.dumps(post))
+                )
+                self._db.execute("DELETE FROM post_terms WHERE post_id = ?", (post["id"],))
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO post_terms (post_id, taxonomy, term_id) VALUES (?, ?, ?)",
+                    [
+                        (post["id"], taxonomy, term_id)
+                        for taxonomy in TAXONOMIES
+                        for term_id in post.get(taxonomy) or []
+                    ]
+                )
+                self._index_post(post)
+            self._db.commit()
+    
+    def _index_post(self, post: Dict[str, Any]) -> None:
+        self._db.execute("DELETE FROM posts_fts WHERE rowid = ?", (post["id"],))
+        self._db.execute(
+            "INSERT INTO posts_fts (rowid, title, excerpt, content) VALUES (?, ?, ?, ?)",
+            (
+                post["id"],
+                strip_html(_rendered(post.get("title"))),
+                strip_html(_rendered(post.get("excerpt"))),
+                strip_html(_rendered(post.get("content"))),
+            )
+        )
+    
+    def _rebuild_search_index(self) -> None:
+        """Index posts mirrored before the search index existed."""
+        with self._lock:
+            self._db.execute("DELETE FROM posts_fts")
+            for (data,) in self._db.execute("SELECT data FROM posts").fetchall():
+                self._index_post(json.loads(data))
+            self._set_state("search_index", 1, locked=True)
+            self._db.commit()
+    
+    # Reads
+    
+    def search(
+        self,
+        query: str,
+        columns: Optional[List[str]] = None,
+        per_page: int = 10,
+        page: int = 1,
+        status: str = "publish"
+    ) -> List[Dict[str, Any]]:
+        """Ranked full-text search with a highlighted snippet per hit.
+        
+        Every word in ``query`` must match (the last one as a prefix), in any
+        of ``columns`` (title, excerpt, content; default all).
+        """
+        match = build_match_query(query, columns)
+        if match is None:
+            return []
+        
+        clauses = ["posts_fts MATCH ?"]
+        args: List[Any] = [match]
+        if status != "any":
+            statuses = status.split(",")
+            clauses.append(f"p.status IN ({','.join('?' * len(statuses))})")
+            args.extend(statuses)
+        args.extend([per_page, (page - 1) * per_page])
+        
+        # Rank first and build snippets/fields only for the page of hits;
+        # FTS5's snippet() costs a second MATCH pass, which dominates on
+        # common words and short prefixes
+        with self._lock:
+            ranked = self._db.execute(
+                "SELECT posts_fts.rowid, rank FROM posts_fts JOIN posts p ON p.id = posts_fts.rowid "
+                f"WHERE {' AND '.join(clauses)} ORDER BY rank LIMIT ? OFFSET ?",
+                args
+            ).fetchall()
+            if not ranked:
+                return []
+            ids = [post_id for post_id, _ in ranked]
+            placeholders = ",".join("?" * len(ids))
+            texts = {
+                row[0]: row[1:]
+                for row in self._db.execute(
+                    f"SELECT rowid, title, excerpt, content FROM posts_fts WHERE rowid IN ({placeholders})",
+                    ids
+                )
+            }
+            fields = {
+                row[0]: row[1:]
+                for row in self._db.execute(
+                    "SELECT id, json_extract(data, '$.title.rendered'), "
+                    "json_extract(data, '$.excerpt.rendered'), json_extract(data, '$.link') "
+                    f"FROM posts WHERE id IN ({placeholders})",
+                    ids
+                )
+            }
+        return [
+            {
+                "id": post_id,
+                "title": fields[post_id][0],
+                "excerpt": fields[post_id][1] or "",
+                "link": fields[post_id][2],
+                "score": round(-rank, 4),
+                "snippet": make_snippet(texts.get(post_id, ()), query),
+            }
+            for post_id, rank in ranked
+        ]
+    
+    def list_posts(
+        self,
+        per_page: int = 10,
+        page: int = 1,
+        status: str = "publish",
+        categories: Optional[List[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Posts newest first, filtered like the REST API's posts endpoint.
+        
+        Only the listing fields (``id``, ``title``, ``status``, ``date``,
+        ``link``, ``excerpt``, flattened) are read, so content is never decoded.
+        """
+        clauses: List[str] = []
+        args: List[Any] = []
+        if status != "any":
+            statuses = status.split(",")
+            clauses.append(f"status IN ({','.join('?' * len(statuses))})")
+            args.extend(statuses)
+        if categories:
+            clauses.append(
+                "id IN (SELECT post_id FROM post_terms WHERE taxonomy = 'categories' "
+                f"AND term_id IN ({','.join('?' * len(categories))}))"
+            )
+            args.extend(categories)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        args.extend([per_page, (page - 1) * per_page])
+        
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, json_extract(data, '$.title.rendered'), status, date, "
+                "json_extract(data, '$.link'), json_extract(data, '$.excerpt.rendered') "
+                f"FROM posts {where} ORDER BY date DESC, id DESC LIMIT ? OFFSET ?",
+                args
+            ).fetchall()
+        return [
+            {"id": row[0], "title": row[1] or "", "status": row[2], "date": row[3], "link": row[4], "excerpt": row[5] or ""}
+            for row in rows
+        ]
+    
+    def get_post(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """A mirrored post, or None."""
+        with self._lock:
+            row = self._db.execute("SELECT data FROM posts WHERE id = ?", (post_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def get_terms(self, taxonomy: str) -> List[Dict[str, Any]]:
+        """Mirrored categories or tags, by name."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM terms WHERE taxonomy = ? ORDER BY name", (taxonomy,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+    
+    def is_loaded(self) -> bool:
+        return self._get_state("last_sync") is not None
+    
+    def age(self) -> float:
+        """Seconds since the last completed sync."""
+        last_sync = self._get_state("last_sync")
+        return time.time() - float(last_sync) if last_sync else float("inf")
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.is_loaded(),
+            "posts": self.count(),
+            "age": round(self.age(), 1) if self.is_loaded() else None,
+            "watermark": self._get_state("watermark"),
+        }
+    
+    def close(self) -> None:
+        """Close the database connection, after a running background load finishes.
+        
+        The mirror is unusable afterwards.
+        """
+        with self._lock:
+            self._closing = True
+            if self._loader is None:
+                self._db.close()
+    
+    # Sync state
+    
+    def _get_state(self, key: str, locked: bool = False) -> Optional[str]:
+        if locked:
+            row = self._db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+        with self._lock:
+            return self._get_state(key, locked=True)
+    
+    def _set_state(self, key: str, value: Any, locked: bool = False) -> None:
+        if not locked:
+            with self._lock:
+                self._set_state(key, value, locked=True)
+                self._db.commit()
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, str(value))
+        )
+
+
+def _rendered(value: Any) -> str:
+    return value.get("rendered", "") if isinstance(value, dict) else (value or "")
+
+
+def build_match_query(query: str, columns: Optional[List[str]] = None) -> Optional[str]:
+    """Turn free text into an FTS5 MATCH expression, or None if it has no words.
+    
+    Words are quoted so FTS5 operators in user input are taken literally.
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        return None
+    terms = " ".join(f'"{word}"' for word in words) + "*"
+    columns = [c for c in (columns or []) if c in SEARCH_COLUMNS]
+    if columns:
+        return f"{{{' '.join(columns)}}} : ({terms})"
+    return terms
+
+
+def make_snippet(texts: Tuple[str, ...], query: str, words: int = 24) -> str:
+    """A window of about ``words`` words around the first query match, matches in <mark>.
+    
+    Looks in content, then excerpt, then title; falls back to the opening words.
+    """
+    terms = [word.lower() for word in re.findall(r"\w+", query)]
+    pattern = re.compile(
+        r"\b(" + "|".join(re.escape(term) for term in terms) + r")\w*",
+        re.IGNORECASE
+    ) if terms else None
+    candidates = [text for text in reversed(texts) if text]
+    if not candidates:
+        return ""
+    for text in candidates:
+        found = pattern.search(text) if pattern else None
+        if found:
+            break
+    else:
+        text, found = candidates[0], None
+    
+    tokens = text.split(" ")
+    start = 0
+    if found:
+        start = max(0, text.count(" ", 0, found.start()) - words // 3)
+    window = " ".join(tokens[start:start + words])
+    if pattern:
+        window = pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", window)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + words < len(tokens) else ""
+    return f"{prefix}{window}{suffix}"
+
+
+_mirror: Optional[SiteMirror] = None
+_mirror_lock = threading.Lock()
+
+
+def get_site_mirror(wp_client: WordPressClient) -> Optional[SiteMirror]:
+    """Return the process-wide site mirror, or None when mirroring is disabled."""
+    global _mirror
+    if not settings.MIRROR_ENABLED:
+        return None
+    with _mirror_lock:
+        if _mirror is None:
+            _mirror = SiteMirror(
+                wp_client,
+                path=settings.MIRROR_PATH,
+                tombstone_interval=settings.MIRROR_TOMBSTONE_INTERVAL
+            )
+        return _mirror
@@ -0,0 +1,150 @@
+"""Per-site post services for serving many WordPress sites from one process."""
+
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+from ..api.wordpress_client import WordPressClient
+from ..config.settings import settings
+from ..config.sites import SiteConfig, load_sites
+from .post_service import PostService
+from .site_mirror import SiteMirror
+
+logger = logging.getLogger(__name__)
+
+
+class SiteRegistry:
+    """Named sites, each with a post service created on first use.
+    
+    A site's post service owns its pooled ``WordPressClient``, category/tag
+    index and post cache. At most ``max_active`` are kept; the least
+    recently used one is dropped when another site is needed, and rebuilt
+    if that site is used again. A dropped service's WordPress session and
+    mirror database are closed once nothing uses it any more, so tool calls
+    and jobs still holding it can finish.
+    """
+    
+    def __init__(
+        self,
+        sites: Dict[str, SiteConfig],
+        default_site: Optional[str] = None,
+        max_active: int = 10
+    ):
+        """Initialize registry; no clients are created until a site is used."""
+        self.sites = sites
+        self.default_site = default_site
+        self.max_active = max(1, max_active)
+        self._services: "OrderedDict[str, PostService]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._evicted = 0
+    
+    @property
+    def default(self) -> Optional[str]:
+        """Site used when none is given: ``default_site``, or the only site."""
+        if self.default_site in self.sites:
+            return self.default_site
+        return next(iter(self.sites)) if len(self.sites) == 1 else None
+    
+    def resolve(self, site: Optional[str] = None) -> SiteConfig:
+        """Config of ``site``, or of the default site when None."""
+        if site is None:
+            site = self.default
+            if site is None:
+                raise ValueError(f"No default site configured. Specify site: one of {', '.join(sorted(self.sites))}")
+        config = self.sites.get(site)
+        if config is None:
+            raise ValueError(f"Unknown site: {site}. Use one of: {', '.join(sorted(self.sites))}")
+        return config
+    
+    def post_service(self, site: Optional[str] = None) -> PostService:
+        """Post service for ``site``, created on first use and marked most recently used."""
+        name = self.resolve(site).name
+        with self._lock:
+            service = self._services.get(name)
+            if service is not None:
+                self._services.move_to_end(name)
+                return service
+        
+        # Built outside the lock so one slow site does not hold up the others
+        service = self._build(self.sites[name])
+        with self._lock:
+            existing = self._services.get(name)
+            if existing is not None:
+                self._services.move_to_end(name)
+                return existing
+            self._services[name] = service
+            self._created += 1
+            while len(self._services) > self.max_active:
+                dropped, _ = self._services.popitem(last=False)
+                self._evicted += 1
+                logger.info(f"Dropped idle site {dropped} ({self.max_active} sites active)")
+        return service
+    
+    def _build(self, config: SiteConfig) -> PostService:
+        wp_client = WordPressClient(config)
+        mirror = None
+        if settings.MIRROR_ENABLED:
+            mirror = SiteMirror(
+                wp_client,
+                path=mirror_path(config.name),
+                tombstone_interval=settings.MIRROR_TOMBSTONE_INTERVAL
+            )
+        service = PostService(wp_client=wp_client, mirror=mirror)
+        weakref.finalize(service, _release, wp_client, mirror)
+        return service
+    
+    def active(self) -> Dict[str, PostService]:
+        """Post services currently kept, least recently used first."""
+        with self._lock:
+            return dict(self._services)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Configured and active sites, with creation and eviction counts."""
+        with self._lock:
+            return {
+                "sites": sorted(self.sites),
+                "default_site": self.default,
+                "active": list(self._services),
+                "max_active": self.max_active,
+                "created": self._created,
+                "evicted": self._evicted
+            }
+
+
+def _release(wp_client: WordPressClient, mirror: Optional[SiteMirror]) -> None:
+    """Close the session and mirror of a post service nothing uses any more."""
+    try:
+        wp_client.close()
+        if mirror is not None:
+            mirror.close()
+    except Exception as e:
+        logger.error(f"Error closing site resources: {str(e)}")
+
+
+def mirror_path(site: str) -> str:
+    """Mirror database of ``site``: ``MIRROR_PATH`` for the default site, else a sibling file."""
+    if site == settings.DEFAULT_SITE:
+        return settings.MIRROR_PATH
+    path = Path(settings.MIRROR_PATH)
+    return str(path.with_name(f"{path.stem}.{site}{path.suffix}"))
+
+
+_registry: Optional[SiteRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_site_registry() -> SiteRegistry:
+    """Return the process-wide site registry, loading the sites on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SiteRegistry(
+                    load_sites(),
+                    default_site=settings.DEFAULT_SITE,
+                    max_active=settings.MAX_ACTIVE_SITES
+                )
+    return _registry
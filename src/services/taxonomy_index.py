@@ -0,0 +1,148 @@
+"""In-process index of categories and tags."""
+
+import html
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+from ..api.wordpress_client import WordPressClient
+
+logger = logging.getLogger(__name__)
+
+TermRef = Union[int, str]
+TERM_FIELDS = ["id", "name", "slug", "count"]
+
+
+class _Terms:
+    """Lookup tables for one taxonomy."""
+    
+    def __init__(self, terms: List[Dict[str, Any]]):
+        self.items: List[Dict[str, Any]] = []
+        self.by_id: Dict[int, Dict[str, Any]] = {}
+        self.by_slug: Dict[str, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        for term in terms:
+            self.add(term)
+    
+    def add(self, term: Dict[str, Any]) -> None:
+        if term["id"] not in self.by_id:
+            self.items.append(term)
+        self.by_id[term["id"]] = term
+        if term.get("slug"):
+            self.by_slug[term["slug"]] = term
+        if term.get("name"):
+            self.by_name[normalize_name(term["name"])] = term
+
+
+class TaxonomyIndex:
+    """Categories and tags by id, slug and lowercased name.
+    
+    Each taxonomy is loaded on first use. After ``refresh_interval`` seconds,
+    or once invalidated by a write, the next lookup starts a background
+    reload and is answered from the current index meanwhile.
+    """
+    
+    def __init__(self, wp_client: WordPressClient, refresh_interval: float = 300):
+        """Initialize index over ``wp_client``'s site."""
+        self.wp_client = wp_client
+        self.refresh_interval = refresh_interval
+        self._terms: Dict[str, _Terms] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._refreshing: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+    
+    def terms(self, taxonomy: str) -> List[Dict[str, Any]]:
+        """Every term of ``taxonomy`` (categories or tags)."""
+        return self._get(taxonomy).items
+    
+    def get(self, taxonomy: str, ref: TermRef) -> Optional[Dict[str, Any]]:
+        """Find a term by id, slug or (case-insensitive) name."""
+        terms = self._get(taxonomy)
+        if isinstance(ref, int) or str(ref).strip().isdigit():
+            return terms.by_id.get(int(ref))
+        ref = str(ref).strip()
+        return terms.by_slug.get(ref) or terms.by_name.get(normalize_name(ref))
+    
+    def resolve(self, taxonomy: str, refs: List[TermRef], create_missing: bool = True) -> List[int]:
+        """Map ids, slugs and names to term IDs, creating unknown names in one batch.
+        
+        Numeric references are taken as IDs as-is. Raises ValueError for
+        unknown names when ``create_missing`` is False.
+        """
+        ids: List[Optional[int]] = []
+        missing: List[str] = []
+        for ref in refs:
+            if isinstance(ref, int) or str(ref).strip().isdigit():
+                ids.append(int(ref))
+                continue
+            term = self.get(taxonomy, ref)
+            if term is None:
+                name = str(ref).strip()
+                if normalize_name(name) not in map(normalize_name, missing):
+                    missing.append(name)
+            ids.append(term["id"] if term else None)
+        
+        if missing:
+            if not create_missing:
+                raise ValueError(f"Unknown {taxonomy}: {', '.join(missing)}")
+            created = self.wp_client.create_terms(taxonomy, missing)
+            logger.info(f"Created {len(created)} {taxonomy}: {', '.join(missing)}")
+            created_ids = {}
+            with self._lock:
+                terms = self._terms[taxonomy]
+                for name, term in zip(missing, created):
+                    terms.add({"name": name, **term})
+                    created_ids[normalize_name(name)] = term["id"]
+            self.invalidate(taxonomy)
+            ids = [
+                term_id if term_id is not None else created_ids[normalize_name(str(ref))]
+                for term_id, ref in zip(ids, refs)
+            ]
+        
+        return list(dict.fromkeys(ids))
+    
+    def invalidate(self, taxonomy: Optional[str] = None) -> None:
+        """Mark one or all taxonomies for reload on next use (term counts changed)."""
+        with self._lock:
+            for name in [taxonomy] if taxonomy else list(self._loaded_at):
+                if name in self._loaded_at:
+                    self._loaded_at[name] = 0.0
+    
+    def _get(self, taxonomy: str) -> _Terms:
+        with self._lock:
+            terms = self._terms.get(taxonomy)
+            stale = terms is not None and time.time() - self._loaded_at[taxonomy] >= self.refresh_interval
+        if terms is None:
+            return self._load(taxonomy)
+        if stale:
+            self._refresh_in_background(taxonomy)
+        return terms
+    
+    def _load(self, taxonomy: str) -> _Terms:
+        with self._load_lock:
+            loaded = _Terms(list(self.wp_client.iter_terms(taxonomy, fields=TERM_FIELDS)))
+        with self._lock:
+            self._terms[taxonomy] = loaded
+            self._loaded_at[taxonomy] = time.time()
+        return loaded
+    
+    def _refresh_in_background(self, taxonomy: str) -> None:
+        with self._lock:
+            thread = self._refreshing.get(taxonomy)
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(target=self._refresh, args=(taxonomy,), name=f"taxonomy-{taxonomy}", daemon=True)
+            self._refreshing[taxonomy] = thread
+            thread.start()
+    
+    def _refresh(self, taxonomy: str) -> None:
+        try:
+            self._load(taxonomy)
+        except Exception as e:
+            logger.error(f"Error refreshing {taxonomy}: {str(e)}")
+
+
+def normalize_name(name: str) -> str:
+    """Compare names the way editors see them: unescaped, trimmed, lowercased."""
+    return html.unescape(name).strip().lower()
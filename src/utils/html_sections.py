@@ -0,0 +1,73 @@
+"""Split post HTML at <h2> headings without touching the markup around the sections."""
+
+import html as html_lib
+import re
+from typing import List, NamedTuple
+from bs4 import BeautifulSoup
+
+_TAG = re.compile(r"<!--.*?-->|<[^>]+>", re.S)
+# Gutenberg's opening heading delimiter right before an <h2>
+_HEADING_OPENER = re.compile(r"<!--\s*wp:heading\b(?:(?!-->).)*-->\s*$", re.S)
+
+
+class Section(NamedTuple):
+    """A slice ``markup[start:end]`` of a post; ``heading`` is empty for the intro."""
+    start: int
+    end: int
+    heading: str
+    html: str
+
+
+def split_sections(markup: str) -> List[Section]:
+    """Split ``markup`` at each top-level ``<h2>``.
+    
+    The first section is the intro before the first heading, if it has any
+    content. Gutenberg's opening ``<!-- wp:heading -->`` comment directly
+    before a heading opens its section (closing delimiters such as
+    ``<!-- /wp:paragraph -->`` stay with their block), and whitespace between
+    sections belongs to neither, so ``replace_sections`` can put new section
+    HTML back with everything else unchanged. Headings are located with
+    bs4's source positions, so the sections are exact slices of ``markup``.
+    """
+    soup = BeautifulSoup(markup, "html.parser")
+    # html.parser counts lines by "\n" only, unlike str.splitlines
+    line_starts = [0] + [match.end() for match in re.finditer("\n", markup)]
+    
+    boundaries = [0]
+    headings = [""]
+    for h2 in soup.find_all("h2", recursive=False):
+        start = line_starts[h2.sourceline - 1] + h2.sourcepos
+        # Take the heading block's opening delimiter along with the heading
+        opener = _HEADING_OPENER.search(markup, boundaries[-1], start)
+        if opener is not None:
+            start = opener.start()
+        boundaries.append(start)
+        headings.append(h2.get_text(" ", strip=True))
+    boundaries.append(len(markup))
+    
+    sections = []
+    for heading, start, end in zip(headings, boundaries, boundaries[1:]):
+        html = markup[start:end]
+        stripped = html.strip()
+        if not stripped:
+            continue
+        start += len(html) - len(html.lstrip())
+        sections.append(Section(start, start + len(stripped), heading, stripped))
+    return sections
+
+
+def replace_sections(markup: str, sections: List[Section], replacements: List[str]) -> str:
+    """Put ``replacements`` in place of ``sections``, keeping all other markup as is."""
+    parts = []
+    position = 0
+    for section, replacement in zip(sections, replacements):
+        parts.append(markup[position:section.start])
+        parts.append(replacement)
+        position = section.end
+    parts.append(markup[position:])
+    return "".join(parts)
+
+
+def word_count(markup: str) -> int:
+    """Words of visible text in ``markup`` (tags and comments count as spaces)."""
+    return len(html_lib.unescape(_TAG.sub(" ", markup)).split())
@@ -0,0 +1,43 @@
+"""Plain-text extraction and normalisation of post HTML."""
+
+import hashlib
+import html
+import re
+from bs4 import BeautifulSoup
+
+_SKIP_BLOCKS = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+def strip_html(markup: str) -> str:
+    """Return the visible text of an HTML fragment with collapsed whitespace.
+    
+    Regex based rather than a full parser: it only feeds the search index,
+    where speed on large corpora matters more than exact rendering.
+    """
+    if not markup:
+        return ""
+    lowered = markup.lower()
+    text = _SKIP_BLOCKS.sub(" ", markup) if "<script" in lowered or "<style" in lowered else markup
+    text = _TAGS.sub(" ", text)
+    return _WHITESPACE.sub(" ", html.unescape(text)).strip()
+
+
+def normalize_html(markup: str) -> str:
+    """Canonical form of an HTML fragment for change detection.
+    
+    Entities, attribute quoting and whitespace (including whitespace between
+    tags) are normalised, so markup that renders the same compares equal.
+    """
+    if not markup:
+        return ""
+    text = BeautifulSoup(markup, "html.parser").decode(formatter="minimal")
+    text = _WHITESPACE.sub(" ", text)
+    return _BETWEEN_TAGS.sub("><", text).strip()
+
+
+def html_hash(markup: str) -> str:
+    """Short SHA-256 digest of the normalised HTML."""
+    return hashlib.sha256(normalize_html(markup).encode("utf-8")).hexdigest()[:16]
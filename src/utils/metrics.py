@@ -0,0 +1,284 @@
+"""In-process Prometheus metrics, rendered in the text exposition format.
+
+A small subset of the Prometheus client model (counters, gauges and
+histograms with labels) without the dependency. Each label combination is
+a child object created once and reused, so recording is a dict lookup, a
+lock and an addition. Hot paths hold on to their children or pre-create
+them at startup so every series is exported from the first scrape.
+"""
+
+import itertools
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Request latency buckets in seconds, from cached reads to long AI generations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class CounterChild:
+    """One labelled series of a counter."""
+    __slots__ = ("value", "_lock")
+    
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class GaugeChild:
+    """One labelled series of a gauge."""
+    __slots__ = ("value", "_lock")
+    
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+    
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value -= amount
+    
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class HistogramChild:
+    """One labelled series of a histogram; bucket counts are stored non-cumulative."""
+    __slots__ = ("bounds", "counts", "sum", "_lock")
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Metric:
+    """A named metric family with a fixed set of label names."""
+    
+    kind = "untyped"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional["Registry"] = None
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self.labels()
+        (registry if registry is not None else REGISTRY).register(self)
+    
+    def labels(self, *values: str):
+        """The child for a label combination, created on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = self._new_child()
+        return child
+    
+    def _new_child(self):
+        raise NotImplementedError
+    
+    def _label_text(self, values: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+    
+    def samples(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            yield f"{self.name}{self._label_text(values)} {_format(child.value)}"
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+    
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+    
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+    
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+    
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+    
+    def dec(self, amount: float = 1) -> None:
+        self.labels().dec(amount)
+    
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Optional["Registry"] = None
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+    
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+    
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+    
+    def samples(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + _format(bound) + '"'
+                yield f"{self.name}_bucket{self._label_text(values, le)} {cumulative}"
+            yield f"{self.name}_sum{self._label_text(values)} {_format(total)}"
+            yield f"{self.name}_count{self._label_text(values)} {cumulative}"
+
+
+class Registry:
+    """Metric families plus callbacks that refresh pull-style gauges at scrape time."""
+    
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+    
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+    
+    def on_collect(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` before each render, e.g. to copy cache stats into gauges."""
+        self._collectors.append(callback)
+    
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        for callback in self._collectors:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error collecting metrics: {str(e)}")
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def precreate(metric: Metric, *label_values: Sequence[str]) -> None:
+    """Create the children for every combination of ``label_values`` up front."""
+    for values in itertools.product(*label_values):
+        metric.labels(*values)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# MCP tools
+TOOL_CALLS = Counter("mcp_tool_calls_total", "MCP tool calls by outcome", ["tool", "outcome"])
+TOOL_DURATION = Histogram("mcp_tool_duration_seconds", "MCP tool call latency", ["tool"])
+TOOLS_IN_FLIGHT = Gauge("mcp_tool_calls_in_flight", "MCP tool calls being handled")
+
+# WordPress REST API (one observation per HTTP attempt, retries included)
+WP_REQUESTS = Counter(
+    "wordpress_requests_total",
+    "WordPress REST requests by endpoint and status (status 'error' for connection failures)",
+    ["method", "endpoint", "status"]
+)
+WP_DURATION = Histogram("wordpress_request_duration_seconds", "WordPress REST request latency", ["method", "endpoint"])
+WP_IN_FLIGHT = Gauge("wordpress_requests_in_flight", "WordPress REST requests in progress")
+
+# OpenAI chat completions (cache hits are not counted here)
+OPENAI_REQUESTS = Counter("openai_requests_total", "OpenAI requests by task, model and outcome", ["task", "model", "outcome"])
+OPENAI_DURATION = Histogram("openai_request_duration_seconds", "OpenAI request latency", ["task", "model"])
+OPENAI_TOKENS = Counter("openai_tokens_total", "OpenAI token usage", ["task", "model", "kind"])
+OPENAI_IN_FLIGHT = Gauge("openai_requests_in_flight", "OpenAI requests in progress")
+
+# Caches: lookups are counted as they happen, the hit ratio is derived at scrape time
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Cache lookups by cache and result", ["cache", "result"])
+CACHE_HIT_RATIO = Gauge("cache_hit_ratio", "Share of cache lookups since start served from the cache", ["cache"])
+CACHE_RESULTS = {"llm": ("memory_hits", "disk_hits", "misses"), "post": ("hits", "revalidated", "misses")}
+precreate(CACHE_LOOKUPS, ["llm"], CACHE_RESULTS["llm"])
+precreate(CACHE_LOOKUPS, ["post"], CACHE_RESULTS["post"])
+
+# Background health probes (see src/services/health.py)
+DEPENDENCY_UP = Gauge("dependency_up", "Whether the last health probe of a dependency succeeded", ["dependency"])
+DEPENDENCY_LATENCY = Gauge("dependency_probe_latency_seconds", "Latency of the last health probe", ["dependency"])
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@lru_cache(maxsize=1024)
+def endpoint_label(url: str) -> str:
+    """Low-cardinality route of a REST URL: ``/wp/v2/posts/{id}`` for ``.../wp-json/wp/v2/posts/12``."""
+    path = urlparse(url).path
+    if "/wp-json" in path:
+        path = path.split("/wp-json", 1)[1]
+    return _NUMERIC_SEGMENT.sub("/{id}", path.rstrip("/")) or "/"
+
+
+def observe_wp_request(method: str, url: str, status: str, started: float) -> None:
+    """Record one WordPress HTTP attempt that started at ``started`` (``time.perf_counter()``)."""
+    endpoint = endpoint_label(url)
+    WP_DURATION.labels(method, endpoint).observe(time.perf_counter() - started)
+    WP_REQUESTS.labels(method, endpoint, status).inc()
@@ -0,0 +1,107 @@
+"""Progress notifications for MCP clients: streamed model output and bulk runs."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StreamProgress:
+    """Relays streamed text to an MCP client while a tool call runs.
+    
+    Each flush sends a progress notification (characters received against the
+    expected size) and a log notification carrying the text generated since
+    the previous flush. When the expected size is unknown, progress is sent
+    without a total. Flushes are throttled to ``PROGRESS_INTERVAL`` seconds
+    so long completions do not flood the client.
+    """
+    
+    def __init__(self, ctx: Any, expected_chars: Optional[int], label: str):
+        """Initialize reporter for a FastMCP ``Context``."""
+        self.ctx = ctx
+        self.expected_chars = expected_chars
+        self.label = label
+        self.received = 0
+        self._pending: List[str] = []
+        self._last_flush = 0.0  # first text is sent immediately
+    
+    async def on_delta(self, delta: str) -> None:
+        """Accept one streamed piece of text."""
+        self.received += len(delta)
+        self._pending.append(delta)
+        if time.monotonic() - self._last_flush >= settings.PROGRESS_INTERVAL:
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """Send any buffered text and the current progress."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        chunk = "".join(self._pending)
+        self._pending.clear()
+        await self._notify(
+            self.ctx.report_progress(
+                progress=self.received,
+                total=self._total(self.received + 1),
+                message=f"{self.label}: {self.received} characters received"
+            )
+        )
+        await self._notify(self.ctx.info(chunk, logger_name="partial_content"))
+    
+    async def done(self) -> None:
+        """Flush remaining text and report completion."""
+        await self.flush()
+        total = self._total(self.received)
+        await self._notify(
+            self.ctx.report_progress(
+                progress=total or self.received,
+                total=total,
+                message=f"{self.label}: done"
+            )
+        )
+    
+    def _total(self, minimum: int) -> Optional[int]:
+        """Expected size, grown if the output runs longer than estimated."""
+        if self.expected_chars is None:
+            return None
+        return max(self.expected_chars, minimum)
+    
+    async def _notify(self, notification) -> None:
+        # A client that went away must not fail the generation itself
+        try:
+            await notification
+        except Exception as e:
+            logger.debug(f"Progress notification failed: {e}")
+
+
+class ItemProgress:
+    """Reports per-item progress of a bulk tool call to an MCP client.
+    
+    Sends ``completed/total`` progress with a running failure count, throttled
+    to ``PROGRESS_INTERVAL`` seconds except for the final item.
+    """
+    
+    def __init__(self, ctx: Any, label: str):
+        """Initialize reporter for a FastMCP ``Context``."""
+        self.ctx = ctx
+        self.label = label
+        self.failed = 0
+        self._last_report = 0.0
+    
+    async def on_item(self, completed: int, total: int, result: Dict[str, Any]) -> None:
+        """Record one finished item and report if due."""
+        if result.get("status") == "error":
+            self.failed += 1
+        if completed < total and time.monotonic() - self._last_report < settings.PROGRESS_INTERVAL:
+            return
+        self._last_report = time.monotonic()
+        try:
+            await self.ctx.report_progress(
+                progress=completed,
+                total=total,
+                message=f"{self.label}: {completed}/{total} posts ({self.failed} failed)"
+            )
+        except Exception as e:
+            logger.debug(f"Progress notification failed: {e}")
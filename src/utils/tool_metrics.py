@@ -0,0 +1,47 @@
+"""FastMCP middleware recording per-tool call metrics and traces."""
+
+import time
+from typing import Any, Iterable
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from .metrics import TOOL_CALLS, TOOL_DURATION, TOOLS_IN_FLIGHT, precreate
+from .tracing import KIND_SERVER, start_span
+
+
+class ToolMetricsMiddleware(Middleware):
+    """Times every ``tools/call`` and counts it as ok or error."""
+    
+    async def on_call_tool(self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]) -> Any:
+        tool = context.message.name
+        started = time.perf_counter()
+        TOOLS_IN_FLIGHT.inc()
+        outcome = "error"
+        try:
+            result = await call_next(context)
+            outcome = "ok"
+            return result
+        finally:
+            TOOLS_IN_FLIGHT.dec()
+            TOOL_DURATION.labels(tool).observe(time.perf_counter() - started)
+            TOOL_CALLS.labels(tool, outcome).inc()
+
+
+class ToolTracingMiddleware(Middleware):
+    """Runs every ``tools/call`` in a server span, the root of the call's trace.
+    
+    Over HTTP, a ``traceparent`` header from the client makes the tool span
+    part of the caller's trace.
+    """
+    
+    async def on_call_tool(self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]) -> Any:
+        tool = context.message.name
+        traceparent = get_http_headers().get("traceparent")
+        with start_span(f"tool {tool}", KIND_SERVER, traceparent=traceparent, tool=tool):
+            return await call_next(context)
+
+
+def precreate_tool_metrics(tools: Iterable[str]) -> None:
+    """Export a zero series for each tool before its first call."""
+    tools = list(tools)
+    precreate(TOOL_DURATION, tools)
+    precreate(TOOL_CALLS, tools, ["ok", "error"])
@@ -0,0 +1,306 @@
+"""Request tracing in the OpenTelemetry span model, without the SDK.
+
+Spans carry W3C trace and span IDs, a parent, attributes and a status, and
+nest through a context variable, so a tool call, the service methods it
+runs, its WordPress requests and its OpenAI calls form one tree. The
+context follows ``run_blocking`` into worker threads; other thread pools
+hand it over with ``bind``.
+
+When a local root span ends, its trace is passed to the exporter
+(``TRACE_EXPORTER``): ``otlp`` posts OTLP/HTTP JSON to ``OTLP_ENDPOINT``,
+``json`` appends the same payload as one line to ``TRACE_FILE``. Export
+runs on a background thread. Independently, a root slower than
+``TRACE_SLOW_THRESHOLD`` seconds is logged as an indented span tree.
+Outgoing requests carry a ``traceparent`` header, and a ``traceparent``
+received by the HTTP transport becomes the parent of the tool span.
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXPORTERS = ("none", "json", "otlp")
+
+# W3C trace context: version-traceid-parentid-flags
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# OTLP span kinds
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+
+class Span:
+    """One timed operation in a trace."""
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "kind", "attributes",
+        "start_ns", "end_ns", "status", "error", "children"
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        kind: int,
+        attributes: Dict[str, Any]
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.status = "unset"
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+    
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (or to now while running)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+    
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header naming this span as the parent."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+    
+    def walk(self, depth: int = 0) -> Iterator[Tuple[int, "Span"]]:
+        """This span and its descendants, depth first, with their depth."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+
+
+def enabled() -> bool:
+    """Whether spans are recorded: an exporter or the slow-call log is on."""
+    return settings.TRACE_EXPORTER != "none" or settings.TRACE_SLOW_THRESHOLD > 0
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str]]:
+    """``(trace_id, parent_span_id)`` of a valid ``traceparent`` header."""
+    match = _TRACEPARENT.match((header or "").strip().lower())
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    kind: int = KIND_INTERNAL,
+    traceparent: Optional[str] = None,
+    **attributes: Any
+) -> Iterator[Optional[Span]]:
+    """Record ``name`` as a child of the current span for the ``with`` body.
+    
+    Without a current span a new trace is started, continuing the remote
+    trace in ``traceparent`` if one is given. Exceptions mark the span as
+    failed and propagate. Yields None when tracing is off.
+    """
+    if not enabled():
+        yield None
+        return
+    
+    parent = _current.get()
+    if parent is not None:
+        span = Span(name, parent.trace_id, parent.span_id, kind, attributes)
+        parent.children.append(span)
+    else:
+        remote = parse_traceparent(traceparent)
+        if remote:
+            span = Span(name, remote[0], remote[1], kind, attributes)
+        else:
+            span = Span(name, f"{random.getrandbits(128):032x}", None, kind, attributes)
+    
+    token = _current.set(span)
+    try:
+        yield span
+        if span.status == "unset":
+            span.status = "ok"
+    except BaseException as e:
+        span.status = "error"
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.end_ns = time.time_ns()
+        _current.reset(token)
+        if parent is None:
+            _finish_trace(span)
+
+
+def traced(name: Optional[str] = None, kind: int = KIND_INTERNAL) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator running a function or coroutine function inside a span named after it."""
+    def decorate(func: Callable[..., T]) -> Callable[..., T]:
+        span_name = name or func.__qualname__
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with start_span(span_name, kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with start_span(span_name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    
+    return decorate
+
+
+def bind(func: Callable[..., T]) -> Callable[..., T]:
+    """``func`` bound to a copy of the current context, for thread pool submission."""
+    ctx = contextvars.copy_context()
+    return functools.partial(ctx.run, func)
+
+
+def trace_headers() -> Dict[str, str]:
+    """``traceparent`` header for an outgoing request, or {} outside a span."""
+    span = _current.get()
+    return {"traceparent": span.traceparent()} if span is not None else {}
+
+
+def format_tree(root: Span) -> str:
+    """Indented span tree with durations, for the slow-call log."""
+    lines = []
+    for depth, span in root.walk():
+        attributes = " ".join(f"{key}={value}" for key, value in span.attributes.items())
+        error = f" ERROR {span.error}" if span.error else ""
+        lines.append(f"{'  ' * depth}{span.name} {span.duration * 1000:.1f}ms {attributes}".rstrip() + error)
+    return "\n".join(lines)
+
+
+def _finish_trace(root: Span) -> None:
+    if 0 < settings.TRACE_SLOW_THRESHOLD <= root.duration:
+        logger.warning(f"Slow call {root.name} took {root.duration:.2f}s (trace {root.trace_id}):\n{format_tree(root)}")
+    if settings.TRACE_EXPORTER != "none":
+        _get_exporter().export(root)
+
+
+# Export
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def to_otlp(root: Span) -> Dict[str, Any]:
+    """OTLP/JSON ``ExportTraceServiceRequest`` for a finished trace."""
+    spans = []
+    for _, span in root.walk():
+        item = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+            "status": {"code": 2, "message": span.error} if span.status == "error" else {"code": 1}
+        }
+        if span.parent_id:
+            item["parentSpanId"] = span.parent_id
+        spans.append(item)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_attribute("service.name", settings.TRACE_SERVICE_NAME)]},
+            "scopeSpans": [{"scope": {"name": "wordpress-content-mcp"}, "spans": spans}]
+        }]
+    }
+
+
+class TraceExporter:
+    """Sends finished traces from a queue on a daemon thread."""
+    
+    def __init__(self, mode: str, path: str, endpoint: str, max_queue: int = 1000):
+        """Initialize exporter for ``mode`` (``json`` or ``otlp``)."""
+        if mode not in EXPORTERS:
+            raise ValueError(f"Unknown trace exporter '{mode}'. Use one of: {', '.join(EXPORTERS)}")
+        self.mode = mode
+        self.path = Path(path)
+        self.endpoint = endpoint
+        self._queue: "queue.Queue[Span]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="trace-export", daemon=True)
+        self._thread.start()
+    
+    def export(self, root: Span) -> None:
+        """Queue a trace; dropped (with a log line) if the queue is full."""
+        try:
+            self._queue.put_nowait(root)
+        except queue.Full:
+            logger.warning(f"Trace export queue full; dropped trace {root.trace_id}")
+    
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until queued traces are written."""
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+    
+    def _run(self) -> None:
+        while True:
+            root = self._queue.get()
+            try:
+                self._write(to_otlp(root))
+            except Exception as e:
+                logger.error(f"Error exporting trace {root.trace_id}: {str(e)}")
+            finally:
+                self._queue.task_done()
+    
+    def _write(self, payload: Dict[str, Any]) -> None:
+        if self.mode == "json":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        elif self.mode == "otlp":
+            # Imported here so tracing has no import cost when export is off
+            import requests
+            response = requests.post(self.endpoint, json=payload, timeout=10)
+            response.raise_for_status()
+
+
+_exporter: Optional[TraceExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def _get_exporter() -> TraceExporter:
+    """Return the process-wide exporter for the configured mode."""
+    global _exporter
+    with _exporter_lock:
+        if _exporter is None or _exporter.mode != settings.TRACE_EXPORTER:
+            _exporter = TraceExporter(settings.TRACE_EXPORTER, settings.TRACE_FILE, settings.OTLP_ENDPOINT)
+        return _exporter
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the benchmark helpers and the fake WordPress pagination limits.
+"""
+
+import json
+
+import pytest
+import requests
+
+from benchmarks.fake_wordpress import FakeWordPress
+from benchmarks.tool_bench import compare, load_run, percentile, summarize
+
+
+def test_percentiles_and_summary():
+    values = [0.1 * n for n in range(1, 11)]
+    assert percentile(values, 50) == pytest.approx(0.55)
+    assert percentile(values, 100) == pytest.approx(1.0)
+    assert percentile([], 99) == 0.0
+    
+    stats = summarize(values, errors=2, elapsed=2.0)
+    assert (stats["calls"], stats["errors"], stats["throughput"]) == (12, 2, 5.0)
+    assert stats["p50_ms"] == pytest.approx(550.0)
+
+
+def test_compare_with_previous_run(tmp_path):
+    before = {"get_post": {"p50_ms": 100.0, "p95_ms": 200.0, "p99_ms": 0.0, "throughput": 10.0}}
+    after = {
+        "get_post": {"p50_ms": 50.0, "p95_ms": 250.0, "p99_ms": 300.0, "throughput": 20.0},
+        "list_posts": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 30.0, "throughput": 5.0},
+    }
+    deltas = compare(after, before)
+    assert deltas["get_post"] == {"p50_ms": -50.0, "p95_ms": 25.0, "p99_ms": None, "throughput": 100.0}
+    assert set(deltas["list_posts"].values()) == {None}
+    
+    (tmp_path / "20260101-000000-a.json").write_text(json.dumps({"label": "a"}))
+    (tmp_path / "20260102-000000-b.json").write_text(json.dumps({"label": "b"}))
+    assert load_run("latest", tmp_path)["label"] == "b"
+    assert load_run("latest", tmp_path, exclude=tmp_path / "20260102-000000-b.json")["label"] == "a"
+    assert load_run("latest", tmp_path / "missing") is None
+
+
+def test_fake_wordpress_paginates_like_wordpress():
+    with FakeWordPress(posts=25) as site:
+        url = f"{site.url}/wp-json/wp/v2/posts"
+        response = requests.get(url, params={"per_page": 10, "page": 3}, timeout=5)
+        assert len(response.json()) == 5
+        assert (response.headers["X-WP-Total"], response.headers["X-WP-TotalPages"]) == ("25", "3")
+        
+        response = requests.get(url, params={"per_page": 101}, timeout=5)
+        assert response.status_code == 400
+        assert response.json()["code"] == "rest_invalid_param"
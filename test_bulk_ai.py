@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk AI runs over a set of posts.
+"""
+
+import asyncio
+
+from benchmarks.fake_wordpress import FakeWordPress
+from src.config.settings import settings
+from src.config.sites import SiteConfig
+from src.services import site_registry
+from src.services.async_post_service import AsyncPostService
+from src.services.post_service import PostService
+from src.services.site_registry import SiteRegistry
+
+
+class FakeGenerator:
+    """Stands in for AsyncContentGenerator and records peak concurrency."""
+    
+    def __init__(self, fail_on: str = ""):
+        self.fail_on = fail_on
+        self.active = 0
+        self.peak = 0
+    
+    async def improve_content(self, content, improvements, language="da", use_cache=None, title=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.02)
+            if self.fail_on and self.fail_on in content:
+                raise RuntimeError("model refused")
+            return f"<p>Forbedret</p>{content}"
+        finally:
+            self.active -= 1
+    
+    async def optimize_for_seo(self, title, content, target_keywords=None, language="da", use_cache=None):
+        return {"title": f"{title} | SEO", "meta_description": "Beskrivelse", "content_suggestions": []}
+
+
+def test_bulk_improve_limits_and_results(monkeypatch, wordpress_client):
+    monkeypatch.setattr(settings, "PIPELINE_AI_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "PIPELINE_WP_CONCURRENCY", 3)
+    with FakeWordPress(posts=12) as site:
+        site.posts[5]["content"]["raw"] = "<p>afvis mig</p>"
+        generator = FakeGenerator(fail_on="afvis")
+        service = AsyncPostService(
+            PostService(wp_client=wordpress_client(site)),
+            content_generator=generator
+        )
+        progress = []
+        
+        async def on_progress(completed, total, result):
+            progress.append((completed, total))
+        
+        ids = list(range(1, 13))
+        results = asyncio.run(service.bulk_improve_posts(ids, ["seo"], save_changes=True, on_progress=on_progress))
+        
+        assert generator.peak == 2
+        assert [result["post_id"] for result in results] == ids
+        assert results[4]["status"] == "error" and "model refused" in results[4]["error"]
+        assert all(result["saved"] for i, result in enumerate(results) if i != 4)
+        assert "original_content" not in results[0]
+        assert site.posts[1]["content"]["rendered"].startswith("<p>Forbedret</p>")
+        assert progress[-1] == (12, 12) and len(progress) == 12
+
+
+def test_bulk_seo_over_filter(wordpress_client):
+    with FakeWordPress(posts=30) as site:
+        service = AsyncPostService(
+            PostService(wp_client=wordpress_client(site)),
+            content_generator=FakeGenerator()
+        )
+        dates = sorted(post["date"] for post in site.posts.values() if post["status"] == "publish")
+        
+        async def run():
+            ids = await service.find_post_ids(after=dates[9])
+            return ids, await service.bulk_optimize_seo(ids)
+        
+        ids, results = asyncio.run(run())
+        assert len(ids) == len(dates) - 10
+        assert all(result["optimized_title"].endswith("| SEO") and not result["saved"] for result in results)
+
+
+def test_bulk_ai_tools_end_to_end(monkeypatch):
+    from fastmcp import Client
+    
+    import mcp_server
+    
+    with FakeWordPress(posts=6) as site:
+        site.posts[3]["content"]["raw"] = "<p>afvis mig</p>"
+        registry = SiteRegistry({"default": SiteConfig("default", site.url, "user", "password")}, default_site="default")
+        monkeypatch.setattr(site_registry, "_registry", registry)
+        monkeypatch.setattr(mcp_server, "_content_generator", FakeGenerator(fail_on="afvis"))
+        
+        async def calls():
+            async with Client(mcp_server.mcp) as client:
+                improved = await client.call_tool("bulk_improve_posts", {"post_ids": "1,2,3", "save_changes": True})
+                optimized = await client.call_tool("bulk_optimize_seo", {"post_ids": "1,2"})
+                return improved.data, optimized.data
+        
+        improved, optimized = asyncio.run(calls())
+        assert (improved["total"], improved["succeeded"], improved["failed"]) == (3, 2, 1)
+        assert improved["results"][2]["status"] == "error"
+        assert site.posts[1]["content"]["rendered"].startswith("<p>Forbedret</p>")
+        assert (optimized["total"], optimized["failed"]) == (2, 0)
+        assert optimized["results"][0]["optimized_title"].endswith("| SEO")
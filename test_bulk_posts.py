@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk post writes through the REST batch endpoint.
+"""
+
+import pytest
+
+from benchmarks.fake_wordpress import FakeWordPress
+from src.models.post import PostCreate, PostUpdate
+from src.services.post_service import PostService
+
+
+@pytest.mark.parametrize("batch_enabled", [True, False])
+def test_bulk_create_update_delete(wordpress_client, batch_enabled):
+    with FakeWordPress(posts=10, batch_enabled=batch_enabled) as site:
+        service = PostService(wp_client=wordpress_client(site))
+        
+        requests_before = site.request_count
+        created = service.bulk_create_posts([
+            PostCreate(title=f"Bulk {i}", content=f"<p>{i}</p>") for i in range(60)
+        ])
+        assert [result["status"] for result in created] == ["created"] * 60
+        assert [result["title"] for result in created] == [f"Bulk {i}" for i in range(60)]
+        # Three batch calls of at most 25, or a 404 from the batch endpoint plus one call per post
+        assert site.request_count - requests_before == (3 if batch_enabled else 61)
+        
+        new_ids = [result["id"] for result in created]
+        updated = service.bulk_update_posts(
+            [(post_id, PostUpdate(status="publish")) for post_id in new_ids[:5]] + [(9999, PostUpdate(title="x"))]
+        )
+        assert [result["status"] for result in updated] == ["updated"] * 5 + ["error"]
+        assert updated[-1]["id"] == 9999 and updated[-1]["code"] == "rest_post_invalid_id"
+        assert all(site.posts[post_id]["status"] == "publish" for post_id in new_ids[:5])
+        
+        trashed = service.bulk_delete_posts(new_ids[:3])
+        assert [result["status"] for result in trashed] == ["trashed"] * 3
+        deleted = service.bulk_delete_posts(new_ids[3:6], force=True)
+        assert [result["status"] for result in deleted] == ["deleted"] * 3
+        assert not set(new_ids[3:6]) & set(site.posts)
+
+
+def test_fallback_is_remembered(wordpress_client):
+    with FakeWordPress(posts=5, batch_enabled=False) as site:
+        client = wordpress_client(site)
+        client.bulk_delete_posts([1, 2])
+        requests_before = site.request_count
+        client.bulk_delete_posts([3, 4])
+        assert client.batch_supported is False
+        assert site.request_count - requests_before == 2
+
+
+def test_empty_bulk_sends_nothing(wordpress_client):
+    with FakeWordPress(posts=5, batch_enabled=False) as site:
+        client = wordpress_client(site)
+        client.bulk_delete_posts([1])
+        requests_before = site.request_count
+        assert client.bulk([]) == []
+        assert client.bulk_delete_posts([]) == []
+        assert site.request_count == requests_before
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the async content generator against a local OpenAI stand-in.
+"""
+
+import asyncio
+import threading
+import time
+
+from openai import AsyncOpenAI
+
+from benchmarks.fake_openai import FakeOpenAI
+from src.services import llm_cache
+from src.services.content_generator import AsyncContentGenerator
+
+
+class ThreadRecordingCache(llm_cache.LLMCache):
+    """LLMCache that records which thread each lookup and store ran on."""
+    
+    def __init__(self, tmp_path):
+        super().__init__(max_entries=10, ttl=60, path=str(tmp_path / "llm.sqlite3"))
+        self.threads = []
+    
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return super().get(key)
+    
+    def set(self, key, value):
+        self.threads.append(threading.current_thread())
+        super().set(key, value)
+
+
+def test_generations_share_the_event_loop():
+    with FakeOpenAI(first_token_latency=0.3, token_latency=0.0005) as api:
+        generator = AsyncContentGenerator()
+        generator.client = AsyncOpenAI(api_key="test", base_url=api.base_url)
+        ticks = []
+        
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.05)
+        
+        async def run():
+            started = time.perf_counter()
+            await generator.generate_blog_post("Emne", mode="sequential", use_cache=False)
+            single = time.perf_counter() - started
+            
+            heartbeat = asyncio.ensure_future(ticker())
+            started = time.perf_counter()
+            posts = await asyncio.gather(*(
+                generator.generate_blog_post(f"Emne {n}", mode="sequential", use_cache=False)
+                for n in range(3)
+            ))
+            concurrent = time.perf_counter() - started
+            heartbeat.cancel()
+            return posts, single, concurrent
+        
+        posts, single, concurrent = asyncio.run(run())
+    
+    assert all(post["content"] and post["title"] and post["excerpt"] for post in posts)
+    assert api.request_count == 12
+    # Three posts overlap instead of queuing behind each other
+    assert concurrent < 2 * single
+    # The loop kept running while the completions were in flight
+    assert max(later - earlier for earlier, later in zip(ticks, ticks[1:])) < 0.25
+
+
+def test_streamed_deltas_are_awaited_in_order():
+    with FakeOpenAI(first_token_latency=0.05, token_latency=0.0005) as api:
+        generator = AsyncContentGenerator()
+        generator.client = AsyncOpenAI(api_key="test", base_url=api.base_url)
+        streamed = []
+        
+        async def on_delta(text):
+            streamed.append(text)
+        
+        improved = asyncio.run(
+            generator.improve_content("<p>Kort tekst</p>", ["grammar"], on_delta=on_delta, use_cache=False)
+        )
+    
+    assert len(streamed) > 1
+    assert "".join(streamed).strip() == improved
+
+
+def test_cache_io_runs_off_the_event_loop(tmp_path, monkeypatch):
+    cache = ThreadRecordingCache(tmp_path)
+    monkeypatch.setattr(llm_cache, "_cache", cache)
+    with FakeOpenAI(first_token_latency=0.01, token_latency=0.0001) as api:
+        generator = AsyncContentGenerator()
+        generator.client = AsyncOpenAI(api_key="test", base_url=api.base_url)
+        
+        async def run():
+            first = await generator.optimize_for_seo("Titel", "<p>Indhold</p>")
+            second = await generator.optimize_for_seo("Titel", "<p>Indhold</p>")
+            return first, second
+        
+        first, second = asyncio.run(run())
+    
+    assert first == second and api.request_count == 1
+    # Miss, store, hit
+    assert len(cache.threads) == 3
+    assert threading.main_thread() not in cache.threads
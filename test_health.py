@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the background health prober and the /health and /ready routes.
+"""
+
+import pytest
+import requests
+
+from benchmarks.fake_openai import FakeOpenAI
+from benchmarks.fake_wordpress import FakeWordPress
+from src.config.settings import settings
+from src.config.sites import SiteConfig
+from src.services import health
+from src.services.health import HealthProber, openai_check, wordpress_check
+
+
+class Switch:
+    def __init__(self):
+        self.ok = True
+    
+    def __call__(self):
+        if not self.ok:
+            raise ConnectionError("refused")
+
+
+def test_states_and_overall_status():
+    site_a, site_b, openai = Switch(), Switch(), Switch()
+    prober = HealthProber(
+        {"wordpress:a": site_a, "wordpress:b": site_b, "openai": openai},
+        failure_threshold=2
+    )
+    assert prober.snapshot()["status"] == "starting" and not prober.snapshot()["ready"]
+    
+    assert prober.probe()["status"] == "ok"
+    
+    openai.ok = False
+    snapshot = prober.probe()
+    assert snapshot["dependencies"]["openai"]["state"] == "degraded"
+    assert snapshot["dependencies"]["openai"]["last_error"] == "ConnectionError: refused"
+    snapshot = prober.probe()
+    assert snapshot["dependencies"]["openai"]["state"] == "down"
+    assert snapshot["dependencies"]["openai"]["consecutive_failures"] == 2
+    assert (snapshot["status"], snapshot["ready"]) == ("degraded", True)
+    
+    site_a.ok = site_b.ok = False
+    prober.probe()
+    snapshot = prober.probe()
+    assert (snapshot["status"], snapshot["ready"]) == ("down", False)
+    
+    site_a.ok = site_b.ok = openai.ok = True
+    snapshot = prober.probe()
+    assert snapshot["status"] == "ok"
+    assert snapshot["dependencies"]["wordpress:a"]["consecutive_failures"] == 0
+    assert snapshot["dependencies"]["wordpress:a"]["latency_ms"] is not None
+
+
+def test_slow_dependency_is_degraded():
+    prober = HealthProber({"wordpress:a": lambda: None}, slow_threshold=-1)
+    assert prober.probe()["dependencies"]["wordpress:a"]["state"] == "degraded"
+
+
+def test_lightweight_checks(monkeypatch):
+    session = requests.Session()
+    with FakeWordPress(posts=5) as site, FakeOpenAI() as api:
+        wordpress_check(SiteConfig("a", site.url, "u", "p"), session, timeout=5)()
+        monkeypatch.setattr(settings, "OPENAI_BASE_URL", api.base_url)
+        openai_check(session, "gpt-4o", timeout=5)()
+        
+        missing = wordpress_check(SiteConfig("b", f"{site.url}/missing", "u", "p"), session, timeout=5)
+        with pytest.raises(RuntimeError, match="404"):
+            missing()
+
+
+def test_routes_serve_cached_snapshot(monkeypatch):
+    from starlette.testclient import TestClient
+    
+    import mcp_server
+    
+    wordpress = Switch()
+    prober = HealthProber({"wordpress:a": wordpress}, failure_threshold=1)
+    monkeypatch.setattr(health, "_prober", prober)
+    client = TestClient(mcp_server.mcp.http_app())
+    
+    assert client.get("/ready").status_code == 503
+    assert client.get("/health").status_code == 200
+    
+    prober.probe()
+    response = client.get("/ready")
+    assert response.status_code == 200 and response.json()["status"] == "ok"
+    
+    wordpress.ok = False
+    prober.probe()
+    assert client.get("/ready").status_code == 503
+    response = client.get("/health")
+    assert response.status_code == 200 and response.json()["status"] == "down"
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for splitting posts at <h2> headings and improving long posts section by section.
+"""
+
+import asyncio
+import time
+
+from openai import AsyncOpenAI
+
+from benchmarks.fake_openai import FakeOpenAI
+from src.config.settings import settings
+from src.services import llm_cache
+from src.services.content_generator import AsyncContentGenerator
+from src.utils.html_sections import replace_sections, split_sections
+
+POST = """<p>Intro med <strong>fed</strong> tekst</p>
+
+<!-- wp:heading -->
+<h2 class="wp-block-heading">Første &amp; bedste</h2>
+<!-- /wp:heading -->
+
+<!-- wp:paragraph -->
+<p>Brødtekst med æøå.</p>
+<!-- /wp:paragraph -->
+<div class="box"><h2>Ikke et afsnit</h2></div>
+
+<h2>Andet afsnit</h2><p>Slut</p>
+"""
+
+
+def test_split_and_replace_round_trip():
+    sections = split_sections(POST)
+    assert [s.heading for s in sections] == ["", "Første & bedste", "Andet afsnit"]
+    assert sections[1].html.startswith("<!-- wp:heading -->")
+    assert sections[1].html.endswith('<div class="box"><h2>Ikke et afsnit</h2></div>')
+    assert all(POST[s.start:s.end] == s.html for s in sections)
+    
+    assert replace_sections(POST, sections, [s.html for s in sections]) == POST
+    replaced = replace_sections(POST, sections, ["A", "B", "C"])
+    assert replaced == "A\n\nB\n\nC\n"
+
+
+def test_split_without_headings():
+    assert [s.html for s in split_sections("  <p>Kun intro</p>\n")] == ["<p>Kun intro</p>"]
+    assert split_sections("") == []
+
+
+def test_split_with_line_breaks_other_than_newline():
+    markup = '<p>a\rb\x0cc\u2028d</p>\n<h2>X</h2><p>x\x85</p>\n<h2>Y</h2>'
+    sections = split_sections(markup)
+    assert [(s.heading, s.html) for s in sections] == [
+        ("", "<p>a\rb\x0cc\u2028d</p>"),
+        ("X", "<h2>X</h2><p>x\x85</p>"),
+        ("Y", "<h2>Y</h2>"),
+    ]
+    assert all(markup[s.start:s.end] == s.html for s in sections)
+
+
+def test_closing_block_comments_stay_with_their_block():
+    markup = (
+        "<!-- wp:paragraph -->\n<p>Intro</p>\n<!-- /wp:paragraph -->\n\n"
+        '<!-- wp:heading {"level":2} -->\n<h2>Første</h2>\n<!-- /wp:heading -->\n\n'
+        "<!-- wp:paragraph -->\n<p>Tekst</p>\n<!-- /wp:paragraph -->\n\n"
+        "<h2>Anden</h2>\n<p>Slut</p>"
+    )
+    sections = split_sections(markup)
+    assert sections[0].html.endswith("<!-- /wp:paragraph -->")
+    assert sections[1].html.startswith('<!-- wp:heading {"level":2} -->')
+    assert sections[1].html.endswith("<!-- /wp:paragraph -->")
+    assert sections[2].html.startswith("<h2>Anden</h2>")
+    assert replace_sections(markup, sections, [s.html for s in sections]) == markup
+
+
+def test_long_post_is_improved_per_section(monkeypatch):
+    monkeypatch.setattr(llm_cache, "_cache", llm_cache.LLMCache(max_entries=100, ttl=60))
+    monkeypatch.setattr(settings, "IMPROVE_SECTION_MIN_CHARS", 1000)
+    body = "".join(
+        f"\n<!-- wp:heading -->\n<h2>Afsnit {n}</h2>\n<!-- /wp:heading -->\n<p>{'ord ' * 150}</p>\n"
+        for n in range(6)
+    )
+    content = "<p>Indledning</p>\n" + body
+    
+    with FakeOpenAI(first_token_latency=0.2, token_latency=0.0005) as api:
+        generator = AsyncContentGenerator()
+        generator.client = AsyncOpenAI(api_key="test", base_url=api.base_url)
+        streamed = []
+        
+        async def on_delta(text):
+            streamed.append(text)
+        
+        async def run():
+            started = time.perf_counter()
+            improved = await generator.improve_content(content, ["grammar"], title="Guide", on_delta=on_delta)
+            return improved, time.perf_counter() - started
+        
+        improved, elapsed = asyncio.run(run())
+    
+    # The fake editor echoes each section, so the post comes back byte for byte
+    assert improved == content
+    assert "".join(streamed) == content and len(streamed) == 7
+    assert api.request_count == 7
+    # Sections run concurrently: far less than seven sequential round trips
+    assert elapsed < 7 * 0.2
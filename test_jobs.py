@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the background job queue.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.job_queue import JobRunner, JobStore
+from src.services.post_jobs import split_job_params
+
+
+def wait_for(store, job_id, states, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = store.status(job_id)
+        if status["state"] in states:
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} stuck in {store.status(job_id)['state']}")
+
+
+def make_handler(seen, delay=0.0):
+    async def square(job):
+        for seq, item in await job.pending():
+            seen.append(item)
+            await asyncio.sleep(delay)
+            if item < 0:
+                await job.record(seq, {"status": "error", "error": "negative"})
+            else:
+                await job.record(seq, {"value": item * item * job.params["factor"]})
+    return square
+
+
+def test_run_checkpoint_and_results(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    seen = []
+    runner = JobRunner(store, {"square": make_handler(seen)})
+    job_id = runner.submit("square", {"factor": 2}, [1, 2, -3, 4])
+    
+    status = wait_for(store, job_id, ("completed",))
+    assert (status["total"], status["completed"], status["failed"], status["progress"]) == (4, 3, 1, 1.0)
+    results = store.results(job_id)
+    assert [r["result"].get("value") for r in results] == [2, 8, None, 32]
+    assert results[2]["state"] == "error"
+    assert store.results(job_id, offset=1, limit=2)[0]["item"] == 2
+    
+    with pytest.raises(ValueError):
+        runner.submit("unknown", {}, [1])
+
+
+def test_resume_after_crash(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = JobStore(path)
+    job_id = store.create("square", {"factor": 1}, [1, 2, 3, 4])
+    # A previous process claimed the job and finished two items before dying
+    job = store.claim_next()
+    
+    async def crash():
+        await job.record(0, {"value": 1})
+        await job.record(1, {"value": 4})
+        await job.update_params(factor=10)
+    
+    asyncio.run(crash())
+    
+    seen = []
+    restarted = JobStore(path)
+    JobRunner(restarted, {"square": make_handler(seen)}).start()
+    
+    status = wait_for(restarted, job_id, ("completed",))
+    assert seen == [3, 4]
+    assert status["completed"] == 4
+    assert [r["result"]["value"] for r in restarted.results(job_id)] == [1, 4, 90, 160]
+
+
+def test_cancel_running_job(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    seen = []
+    runner = JobRunner(store, {"square": make_handler(seen, delay=0.05)})
+    job_id = runner.submit("square", {"factor": 1}, list(range(100)))
+    
+    deadline = time.time() + 5
+    while store.status(job_id)["completed"] < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert runner.cancel(job_id)
+    time.sleep(0.2)
+    
+    status = store.status(job_id)
+    assert status["state"] == "cancelled"
+    assert 2 <= status["completed"] < 10
+    assert len(seen) < 10
+    assert not runner.cancel(job_id)
+
+
+def test_split_job_params():
+    params, items = split_job_params("improve_posts", {"post_ids": ["3", 1, 3], "save_changes": True})
+    assert items == [3, 1] and params == {"save_changes": True}
+    with pytest.raises(ValueError):
+        split_job_params("generate_post", {"tone": "casual"})
+
+
+def test_store_io_runs_off_the_runner_loop(tmp_path):
+    class RecordingStore(JobStore):
+        threads = set()
+        
+        def record_item(self, job_id, seq, result):
+            self.threads.add(threading.current_thread().name)
+            super().record_item(job_id, seq, result)
+        
+        def finish(self, job_id, state, error=None):
+            self.threads.add(threading.current_thread().name)
+            super().finish(job_id, state, error)
+    
+    store = RecordingStore(str(tmp_path / "jobs.sqlite3"))
+    runner = JobRunner(store, {"square": make_handler([])})
+    job_id = runner.submit("square", {"factor": 1}, [1, 2, 3])
+    wait_for(store, job_id, ("completed",))
+    
+    assert store.threads and "job-runner" not in store.threads
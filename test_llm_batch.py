@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for SEO runs through the OpenAI Batch API, against local stand-ins.
+"""
+
+import asyncio
+
+import pytest
+from openai import AsyncOpenAI
+
+from benchmarks.fake_openai import FakeOpenAI
+from benchmarks.fake_wordpress import FakeWordPress
+from src.services import llm_cache
+from src.services.async_post_service import AsyncPostService
+from src.services.content_generator import AsyncContentGenerator
+from src.services.llm_batch import BatchRunner, OpenAIBatchProvider, parse_batch_output
+from src.services.post_service import PostService
+
+
+@pytest.fixture
+def batch_service(tmp_path, monkeypatch, wordpress_client):
+    monkeypatch.setattr(llm_cache, "_cache", llm_cache.LLMCache(max_entries=100, ttl=60))
+    with FakeWordPress(posts=6) as site, FakeOpenAI(batch_latency=0.1) as api:
+        generator = AsyncContentGenerator()
+        generator.client = AsyncOpenAI(api_key="test", base_url=api.base_url)
+        runner = BatchRunner(OpenAIBatchProvider(generator.client), directory=str(tmp_path), poll_interval=0.05)
+        service = AsyncPostService(
+            PostService(wp_client=wordpress_client(site)),
+            content_generator=generator,
+            batch_runner=runner
+        )
+        yield service, site, api
+
+
+def test_batch_seo_maps_results_to_posts(tmp_path, batch_service):
+    service, site, api = batch_service
+    api.fail_custom_ids.add("post-4")
+    progress = []
+    
+    async def on_progress(completed, total, result):
+        progress.append(completed)
+    
+    async def run():
+        results = await service.batch_optimize_seo(ids, on_progress=on_progress)
+        batches_after_first = len(api.batches)
+        saved = await service.batch_optimize_seo([6, 4, 2], save_changes=True)
+        return results, batches_after_first, saved
+    
+    ids = [6, 4, 2, 9999]
+    results, batches_after_first, saved = asyncio.run(run())
+    
+    assert [result["post_id"] for result in results] == ids
+    assert results[0]["optimized_title"] == "Optimeret titel" and not results[0]["saved"]
+    assert results[1]["status"] == "error" and "Invalid request" in results[1]["error"]
+    assert results[3]["status"] == "error"
+    assert sorted(progress) == [1, 2, 3, 4]
+    assert batches_after_first == 1
+    
+    # Successful results were cached, so the second run only resends the failed post
+    assert len(api.batches) == 2 and len(list(tmp_path.glob("*.jsonl"))) == 2
+    assert api.files[list(api.batches.values())[-1]["input_file_id"]]["content"].count(b"custom_id") == 1
+    assert saved[0]["saved"] and site.posts[6]["title"]["rendered"] == "Optimeret titel"
+
+
+def test_resume_waits_for_submitted_batch(batch_service):
+    service, _, api = batch_service
+    submitted = []
+    
+    async def on_submitted(batch_id):
+        submitted.append(batch_id)
+    
+    async def run():
+        first = await service.batch_optimize_seo([1, 2], use_cache=False, on_submitted=on_submitted)
+        resumed = await service.batch_optimize_seo([1, 2], use_cache=False, batch_id=submitted[0])
+        return first, resumed
+    
+    first, resumed = asyncio.run(run())
+    assert len(submitted) == 1 and len(api.batches) == 1
+    assert first == resumed
+
+
+def test_parse_batch_output_errors():
+    text = (
+        '{"custom_id": "post-1", "response": {"status_code": 200, "body": '
+        '{"choices": [{"message": {"content": "{}"}}]}}, "error": null}\n'
+        '{"custom_id": "post-2", "response": null, "error": {"code": "expired", "message": "Batch expired"}}\n'
+    )
+    assert parse_batch_output(text) == {"post-1": {"content": "{}"}, "post-2": {"error": "Batch expired"}}
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the two-tier LLM response cache.
+"""
+
+import threading
+import time
+
+from src.services.llm_cache import LLMCache
+
+MESSAGES = [{"role": "user", "content": "Forbedre dette indhold"}]
+
+
+def test_key_covers_request_parameters():
+    key = LLMCache.make_key("gpt-4o", MESSAGES, 0.5)
+    assert key == LLMCache.make_key("gpt-4o", list(MESSAGES), 0.5)
+    assert key != LLMCache.make_key("gpt-4o", MESSAGES, 0.7)
+    assert key != LLMCache.make_key("gpt-4o-mini", MESSAGES, 0.5)
+    assert key != LLMCache.make_key("gpt-4o", MESSAGES, 0.5, {"type": "json_object"})
+
+
+def test_memory_lru_eviction_and_stats():
+    cache = LLMCache(max_entries=2, ttl=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"   # a is now most recently used
+    cache.set("c", "3")            # evicts b
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = LLMCache(max_entries=10, ttl=0.01)
+    cache.set("a", "1")
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_disk_tier_survives_restart_and_is_bounded(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = LLMCache(max_entries=10, ttl=60, path=path, max_disk_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.set("c", "3")
+    
+    reopened = LLMCache(max_entries=10, ttl=60, path=path, max_disk_entries=2)
+    assert reopened.get("c") == "3"
+    assert reopened.stats()["disk_hits"] == 1
+    assert reopened.stats()["disk_entries"] == 2
+
+
+def test_memory_hits_do_not_wait_for_disk(tmp_path):
+    cache = LLMCache(max_entries=10, ttl=60, path=str(tmp_path / "cache.sqlite3"))
+    cache.set("a", "1")
+    results = []
+    with cache._db_lock:
+        # A disk write holds the database; a memory hit still answers
+        reader = threading.Thread(target=lambda: results.append(cache.get("a")))
+        reader.start()
+        reader.join(2)
+        assert results == ["1"]
@@ -30,15 +30,30 @@ def test_mcp_tools():
         expected_tools = [
             'list_posts',
             'get_post',
+            'get_post_outline',
+            'get_post_section',
+            'replace_post_section',
             'create_post',
             'update_post',
             'delete_post',
+            'bulk_create_posts',
+            'bulk_update_posts',
+            'bulk_delete_posts',
             'generate_blog_post',
             'improve_post_content',
             'optimize_post_seo',
+            'bulk_improve_posts',
+            'bulk_optimize_seo',
+            'submit_job',
+            'get_job_status',
+            'get_job_results',
+            'cancel_job',
             'get_categories',
             'get_tags',
-            'search_posts'
+            'search_posts',
+            'sync_site_mirror',
+            'list_sites',
+            'get_cache_stats'
         ]
         
         logger.info(f"\nExpected tools: {len(expected_tools)}")
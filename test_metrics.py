@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prometheus metrics registry and its instrumentation.
+"""
+
+import asyncio
+
+import pytest
+from openai import AsyncOpenAI
+
+from benchmarks.fake_openai import FakeOpenAI
+from benchmarks.fake_wordpress import FakeWordPress
+from src.api.wordpress_client import WordPressAPIError
+from src.services import llm_cache
+from src.services.content_generator import AsyncContentGenerator
+from src.utils.metrics import (
+    OPENAI_REQUESTS,
+    OPENAI_TOKENS,
+    WP_REQUESTS,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    endpoint_label,
+    precreate,
+)
+
+
+def test_render_exposition_format():
+    registry = Registry()
+    calls = Counter("calls_total", "Calls", ["tool"], registry=registry)
+    depth = Gauge("depth", "Queue depth", registry=registry)
+    latency = Histogram("latency_seconds", "Latency", ["tool"], buckets=(0.1, 1), registry=registry)
+    precreate(calls, ["a", 'b"c'])
+    calls.labels("a").inc()
+    depth.set(3)
+    latency.labels("a").observe(0.05)
+    latency.labels("a").observe(0.5)
+    latency.labels("a").observe(5)
+    
+    lines = registry.render().splitlines()
+    assert "# TYPE calls_total counter" in lines
+    assert 'calls_total{tool="a"} 1' in lines
+    assert 'calls_total{tool="b\\"c"} 0' in lines
+    assert "depth 3" in lines
+    assert 'latency_seconds_bucket{tool="a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{tool="a",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{tool="a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{tool="a"} 5.55' in lines
+    assert 'latency_seconds_count{tool="a"} 3' in lines
+    
+    with pytest.raises(ValueError):
+        calls.labels("a", "extra")
+
+
+def test_endpoint_label():
+    assert endpoint_label("https://example.com/wp-json/wp/v2/posts/123") == "/wp/v2/posts/{id}"
+    assert endpoint_label("https://example.com/wp-json/wp/v2/posts/") == "/wp/v2/posts"
+    assert endpoint_label("https://example.com/wp-json/batch/v1") == "/batch/v1"
+
+
+def test_wordpress_requests_are_counted(wordpress_client):
+    with FakeWordPress(posts=3) as site:
+        client = wordpress_client(site)
+        ok = WP_REQUESTS.labels("GET", "/wp/v2/posts/{id}", "200")
+        missing = WP_REQUESTS.labels("GET", "/wp/v2/posts/{id}", "404")
+        before = ok.value, missing.value
+        
+        client.get_post(1)
+        client.get_post(2)
+        with pytest.raises(WordPressAPIError):
+            client.get_post(99)
+        
+        assert (ok.value - before[0], missing.value - before[1]) == (2, 1)
+
+
+def test_openai_calls_and_tokens_are_counted(monkeypatch):
+    monkeypatch.setattr(llm_cache, "_cache", llm_cache.LLMCache(max_entries=100, ttl=60))
+    with FakeOpenAI(first_token_latency=0.01, token_latency=0.0) as api:
+        generator = AsyncContentGenerator()
+        generator.client = AsyncOpenAI(api_key="test", base_url=api.base_url)
+        seo = OPENAI_REQUESTS.labels("seo", generator.model, "ok")
+        improve = OPENAI_REQUESTS.labels("improve", generator.model, "ok")
+        tokens = OPENAI_TOKENS.labels("improve", generator.model, "completion")
+        before = seo.value, improve.value, tokens.value
+        
+        async def on_delta(text):
+            pass
+        
+        async def run():
+            await generator.optimize_for_seo("Titel", "<p>Indhold</p>")
+            # Second call is a cache hit and not counted as a request
+            await generator.optimize_for_seo("Titel", "<p>Indhold</p>")
+            await generator.improve_content("<p>Indhold</p>", ["grammar"], on_delta=on_delta)
+        
+        asyncio.run(run())
+        
+        assert seo.value - before[0] == 1
+        assert improve.value - before[1] == 1
+        # Streamed calls report usage in their final chunk
+        assert tokens.value > before[2]
+
+
+def test_tool_calls_and_metrics_route():
+    from fastmcp import Client
+    from starlette.testclient import TestClient
+    
+    import mcp_server
+    
+    async def call():
+        async with Client(mcp_server.mcp) as client:
+            await client.call_tool("get_cache_stats", {})
+            with pytest.raises(Exception):
+                await client.call_tool("get_job_status", {"job_id": "missing"})
+    
+    asyncio.run(call())
+    response = TestClient(mcp_server.mcp.http_app()).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'mcp_tool_calls_total{tool="get_cache_stats",outcome="ok"}' in response.text
+    assert 'mcp_tool_calls_total{tool="get_job_status",outcome="error"}' in response.text
+    assert 'cache_hit_ratio{cache="post"}' in response.text
+    assert "# TYPE cache_lookups_total counter" in response.text
+
+
+def test_cache_lookups_are_counted_as_they_happen():
+    from src.services.post_cache import PostCache
+    from src.utils.metrics import CACHE_LOOKUPS
+    
+    hits = CACHE_LOOKUPS.labels("post", "hits")
+    before = hits.value
+    cache = PostCache(max_entries=1, ttl=60)
+    cache.record("hits")
+    cache.record("hits")
+    # Dropping a cache (e.g. an evicted site) never lowers the counter
+    del cache
+    assert hits.value == before + 2
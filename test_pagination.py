@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent paginated iteration in WordPressClient.
+"""
+
+import pytest
+
+from benchmarks.fake_wordpress import FakeWordPress
+
+
+@pytest.fixture
+def site():
+    with FakeWordPress(posts=1050, categories=250, tags=0) as fake:
+        yield fake
+
+
+@pytest.fixture
+def client(site, wordpress_client):
+    client = wordpress_client(site)
+    return client
+
+
+def test_iter_posts_yields_every_page(site, client):
+    ids = [post["id"] for post in client.iter_posts(per_page=100)]
+    assert sorted(ids) == list(range(1, 1051))
+    assert site.request_count == 11
+
+
+def test_taxonomies_not_cut_off_at_100(client):
+    assert len(client.get_categories()) == 250
+    assert client.get_tags() == []
+
+
+def test_fields_projection(client):
+    posts = list(client.iter_posts(fields=["id", "modified"], per_page=50))
+    assert len(posts) == 1050
+    assert set(posts[0]) == {"id", "modified"}
+
+
+def test_early_stop_fetches_little(site, client):
+    for _ in client.iter_posts(per_page=10):
+        break
+    # First page plus at most one batch of in-flight pages
+    assert site.request_count <= 1 + 4
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-post cache and its revalidation in PostService.
+"""
+
+from src.services.post_cache import PostCache
+from src.services.post_service import PostService
+
+
+def make_post(post_id, modified="2024-01-01T00:00:00"):
+    return {
+        "id": post_id,
+        "title": {"rendered": f"Post {post_id}"},
+        "content": {"rendered": "<p>Body</p>"},
+        "excerpt": {"rendered": ""},
+        "status": "publish",
+        "date": "2024-01-01T00:00:00",
+        "modified": modified,
+        "modified_gmt": modified,
+        "slug": f"post-{post_id}",
+        "link": f"https://example.com/post-{post_id}",
+        "author": 1,
+        "categories": [],
+        "tags": [],
+    }
+
+
+class FakeClient:
+    """WordPressClient stand-in recording which requests were made."""
+    
+    def __init__(self, etag=None):
+        self.posts = {1: make_post(1)}
+        self.etag = etag
+        self.calls = []
+    
+    def get_post_conditional(self, post_id, etag=None, last_modified=None, fields=None):
+        self.calls.append(("conditional", etag))
+        if etag and etag == self.etag:
+            return None, {"ETag": etag}
+        return self.posts[post_id], ({"ETag": self.etag} if self.etag else {})
+    
+    def get_post(self, post_id, fields=None, embed=None, context=None):
+        self.calls.append(("get", context))
+        return self.posts[post_id]
+    
+    def get_post_modified(self, post_id):
+        self.calls.append(("probe", None))
+        return self.posts[post_id]["modified_gmt"]
+    
+    def update_post(self, post_id, data, fields=None):
+        self.calls.append(("update", None))
+        self.posts[post_id] = make_post(post_id, modified="2024-02-01T00:00:00")
+        return self.posts[post_id]
+
+
+def make_service(client, ttl=60.0):
+    service = PostService(wp_client=client)
+    service.post_cache = PostCache(max_entries=10, ttl=ttl)
+    return service
+
+
+def test_lru_bound():
+    cache = PostCache(max_entries=2, ttl=60)
+    for post_id in (1, 2, 3):
+        cache.put(post_id, make_post(post_id))
+    assert cache.get(1) is None
+    assert cache.get(3) is not None
+
+
+def test_fresh_entry_served_without_request():
+    client = FakeClient()
+    service = make_service(client)
+    service.get_post(1)
+    service.get_post(1)
+    assert client.calls == [("conditional", None)]
+    assert service.post_cache.stats()["hits"] == 1
+
+
+def test_stale_entry_revalidated_with_probe():
+    client = FakeClient()
+    service = make_service(client, ttl=0)
+    service.get_post(1)
+    service.get_post(1)
+    assert client.calls == [("conditional", None), ("probe", None)]
+    assert service.post_cache.stats()["revalidated"] == 1
+    
+    client.posts[1] = make_post(1, modified="2024-03-01T00:00:00")
+    assert service.get_post(1).modified.month == 3
+
+
+def test_stale_entry_revalidated_with_etag():
+    client = FakeClient(etag='"v1"')
+    service = make_service(client, ttl=0)
+    service.get_post(1)
+    service.get_post(1)
+    assert client.calls == [("conditional", None), ("conditional", '"v1"')]
+    assert service.post_cache.stats()["revalidated"] == 1
+
+
+def test_update_invalidates():
+    from src.models.post import PostUpdate
+    
+    client = FakeClient()
+    service = make_service(client)
+    service.get_post(1)
+    service.update_post(1, PostUpdate(title="New"))
+    assert service.get_post(1).modified.month == 2
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for diff-aware post updates.
+"""
+
+import asyncio
+
+from benchmarks.fake_wordpress import FakeWordPress
+from src.models.post import Post, PostUpdate
+from src.services.async_post_service import AsyncPostService
+from src.services.post_cache import PostCache
+from src.services.post_diff import diff_update
+from src.services.post_service import PostService
+
+CONTENT = '<!-- wp:paragraph -->\n<p class="lead">Hej &#8211; verden</p>\n<!-- /wp:paragraph -->\n'
+
+
+def make_post(post_id, content=CONTENT):
+    return {
+        "id": post_id,
+        "title": {"rendered": "Guide &#8211; SEO"},
+        "content": {"rendered": content},
+        "excerpt": {"rendered": "<p>Kort uddrag</p>\n"},
+        "status": "publish",
+        "date": "2024-01-01T00:00:00",
+        "modified": "2024-01-01T00:00:00",
+        "modified_gmt": "2024-01-01T00:00:00",
+        "slug": f"post-{post_id}",
+        "link": f"https://example.com/post-{post_id}",
+        "author": 1,
+        "categories": [1, 2],
+        "tags": [],
+        "acf": {"hero": "A", "cta": "B"},
+    }
+
+
+class FakeClient:
+    """WordPressClient stand-in recording update bodies."""
+    
+    def __init__(self):
+        self.posts = {1: make_post(1)}
+        self.updates = []
+        self.contexts = []
+    
+    def get_post_conditional(self, post_id, etag=None, last_modified=None, fields=None):
+        return self.posts[post_id], {}
+    
+    def get_post(self, post_id, fields=None, embed=None, context=None):
+        self.contexts.append(context)
+        return self.posts[post_id]
+    
+    def get_post_modified(self, post_id):
+        return self.posts[post_id]["modified_gmt"]
+    
+    def update_post(self, post_id, data, fields=None):
+        self.updates.append(data)
+        return self.posts[post_id]
+
+
+class EchoGenerator:
+    """AsyncContentGenerator stand-in that finds nothing to change."""
+    
+    def __init__(self):
+        self.seen = []
+    
+    async def improve_content(self, content, improvements, language="da", on_delta=None, use_cache=None, title=None):
+        self.seen.append(content)
+        return content
+    
+    async def optimize_for_seo(self, title, content, target_keywords=None, language="da", use_cache=None):
+        return {"title": title, "meta_description": "Beskrivelse", "content_suggestions": []}
+
+
+def make_service(client):
+    service = PostService(wp_client=client)
+    service.post_cache = PostCache(max_entries=10, ttl=60)
+    return service
+
+
+def test_diff_ignores_formatting_only_changes():
+    post = Post.from_api_response(make_post(1))
+    changes, summary = diff_update(post, {
+        "content": "<!-- wp:paragraph --><p class='lead'>Hej – verden</p>  <!-- /wp:paragraph -->",
+        "title": "Guide – SEO",
+        "excerpt": "Kort uddrag",
+        "categories": [2, 1],
+        "acf": {"hero": "A"}
+    })
+    assert changes == {}
+    assert sorted(summary["unchanged"]) == ["acf", "categories", "content", "excerpt", "title"]
+
+
+def test_diff_reports_changed_fields():
+    post = Post.from_api_response(make_post(1))
+    changes, summary = diff_update(post, {
+        "content": "<p>Ny tekst</p>",
+        "status": "publish",
+        "categories": [2, 3],
+        "acf": {"hero": "A", "cta": "C"}
+    })
+    assert changes == {"content": "<p>Ny tekst</p>", "categories": [2, 3], "acf": {"cta": "C"}}
+    assert summary["unchanged"] == ["status"]
+    assert summary["changed"]["categories"] == {"added": [3], "removed": [1]}
+    assert summary["changed"]["acf"] == {"keys": ["cta"]}
+    content = summary["changed"]["content"]
+    assert content["before_hash"] != content["after_hash"] and content["after_chars"] == len("<p>Ny tekst</p>")
+
+
+def test_update_sends_only_changed_fields():
+    client = FakeClient()
+    service = make_service(client)
+    
+    post, changes = service.save_post_changes(1, PostUpdate(title="Guide – SEO", content=CONTENT + "\n"))
+    assert client.updates == [] and not changes["written"]
+    assert post.id == 1
+    
+    post, changes = service.save_post_changes(1, PostUpdate(title="Ny titel", content=CONTENT))
+    assert client.updates == [{"title": "Ny titel"}]
+    assert changes["written"] and list(changes["changed"]) == ["title"]
+
+
+def test_unchanged_improvement_is_not_written():
+    client = FakeClient()
+    service = make_service(client)
+    post = service.get_post(1)
+    
+    result = service.apply_improvement(post, "  " + CONTENT.replace("\n", "\n\n"), save_changes=True)
+    assert result["saved"] and not result["changes"]["written"]
+    assert client.updates == []
+
+
+def test_update_compares_with_stored_not_rendered_text():
+    client = FakeClient()
+    client.posts[1]["title"] = {"raw": "Guide - SEO", "rendered": "Guide &#8211; SEO"}
+    client.posts[1]["content"] = {"raw": "Hej verden\n\n[cta]", "rendered": "<p>Hej verden</p>\n<a class=\"cta\">Køb</a>\n"}
+    service = make_service(client)
+    
+    post, changes = service.save_post_changes(1, PostUpdate(title="Guide - SEO", content="Hej verden\n\n[cta]"))
+    assert client.updates == [] and not changes["written"]
+    assert client.contexts == ["edit"]
+    assert post.content.startswith("<p>Hej verden</p>")
+    
+    service.save_post_changes(1, PostUpdate(content="Hej verden\n\n[cta2]"))
+    assert client.updates == [{"content": "Hej verden\n\n[cta2]"}]
+
+
+def test_unchanged_ai_rewrite_of_block_content_is_not_written(wordpress_client):
+    with FakeWordPress(posts=3) as site:
+        site.posts[2]["title"] = {"raw": "Guide - SEO", "rendered": "Guide &#8211; SEO"}
+        modified = site.posts[2]["modified"]
+        generator = EchoGenerator()
+        service = AsyncPostService(PostService(wp_client=wordpress_client(site)), content_generator=generator)
+        
+        async def run():
+            improved = await service.improve_post(2, ["grammar"], save_changes=True)
+            bulk = await service.bulk_improve_posts([1, 2], ["grammar"], save_changes=True)
+            seo = await service.bulk_optimize_seo([2], save_changes=True)
+            return [improved] + bulk + seo
+        
+        results = asyncio.run(run())
+    
+    content = site.posts[2]["content"]
+    assert content["raw"].startswith("<!-- wp:heading -->") and content["rendered"].startswith("<h2>")
+    assert generator.seen[0] == content["raw"]
+    assert [result["changes"]["written"] for result in results] == [False] * 4
+    assert site.posts[2]["modified"] == modified
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the lightweight post summary used by listings.
+"""
+
+from datetime import datetime
+
+from benchmarks.fake_wordpress import make_post
+from src.models.post import Post, PostSummary
+from src.services.post_service import LIST_FIELDS, SEARCH_FIELDS
+from src.services.site_mirror import SiteMirror
+
+
+def test_summary_matches_api_and_flat_shapes():
+    data = make_post(3)
+    summary = PostSummary.from_api_response(data)
+    assert summary.to_dict(LIST_FIELDS) == {
+        "id": 3,
+        "title": "Indlæg 3",
+        "status": "publish",
+        "date": data["date"],
+        "link": data["link"],
+        "excerpt": "<p>Uddrag for indlæg 3</p>",
+    }
+    flat = PostSummary.from_api_response({"id": 3, "title": "Indlæg 3", "excerpt": None, "link": data["link"]})
+    assert flat.to_dict(SEARCH_FIELDS) == {"id": 3, "title": "Indlæg 3", "excerpt": "", "link": data["link"]}
+    assert not hasattr(summary, "__dict__")
+
+
+def test_summary_date_parsed_lazily():
+    summary = PostSummary.from_api_response({"id": 1, "date": "2024-05-01T10:00:00Z"})
+    assert summary._date_parsed is None
+    assert summary.date_parsed == datetime.fromisoformat("2024-05-01T10:00:00+00:00")
+    assert PostSummary(2).date_parsed is None
+
+
+def test_post_to_dict():
+    data = make_post(5)
+    result = Post.from_api_response(data).to_dict()
+    assert result["date"] == data["date"]
+    assert result["content"] == data["content"]["rendered"]
+    assert set(result) == {
+        "id", "title", "content", "excerpt", "status", "slug", "date", "modified",
+        "author", "categories", "tags", "featured_media", "link", "acf",
+    }
+
+
+def test_mirror_lists_summary_fields_only():
+    mirror = SiteMirror(None, path=":memory:")
+    mirror._store_posts([make_post(post_id) for post_id in range(1, 6)])
+    listed = mirror.list_posts(per_page=2)
+    assert [post["id"] for post in listed] == [5, 4]
+    assert set(listed[0]) == set(LIST_FIELDS)
+    assert listed[0]["title"] == "Indlæg 5"
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for cached post outlines and section-level reads and writes.
+"""
+
+import pytest
+
+from benchmarks.fake_wordpress import FakeWordPress, render_blocks
+from src.services import outline_index
+from src.services.outline_index import OutlineIndex, PostOutline
+from src.services.post_service import PostService
+from src.utils.html_sections import word_count
+
+
+@pytest.fixture
+def service(monkeypatch, wordpress_client):
+    monkeypatch.setattr(outline_index, "_index", OutlineIndex(max_entries=10))
+    with FakeWordPress(posts=5) as site:
+        client = wordpress_client(site)
+        yield PostService(wp_client=client, mirror=None), site
+
+
+def test_section_ids_follow_section_content():
+    outline = PostOutline("<h2>A</h2><p>Et to tre</p>\n<h2>B</h2><p>Fire</p>\n<h2>A</h2><p>Et to tre</p>")
+    assert outline.ids[2] == f"{outline.ids[0]}-2"
+    assert outline.words == [4, 2, 4]
+    
+    edited = PostOutline("<h2>A</h2><p>Et to tre</p>\n<h2>B</h2><p>Fem</p>\n<h2>A</h2><p>Et to tre</p>")
+    assert edited.ids[0] == outline.ids[0] and edited.ids[1] != outline.ids[1]
+    with pytest.raises(ValueError, match="get the outline again"):
+        edited.find(outline.ids[1])
+    assert word_count("<p>Hej&nbsp;verden <!-- x y --> igen</p>") == 3
+
+
+def test_outline_and_section(service):
+    service, _ = service
+    outline = service.get_outline(1)
+    assert [s["heading"] for s in outline["sections"]] == [f"Afsnit {n}" for n in range(1, 6)]
+    assert outline["words"] == sum(s["words"] for s in outline["sections"])
+    assert "html" not in outline["sections"][0]
+    
+    section = service.get_section(1, outline["sections"][2]["id"])
+    assert section["html"].startswith("<!-- wp:heading -->\n<h2>Afsnit 3</h2>")
+    assert section["content_hash"] == outline["content_hash"]
+    assert service.outlines.stats()["hits"] == 1
+
+
+def test_replace_section_keeps_other_sections(service):
+    service, site = service
+    before = service.get_outline(2)["sections"]
+    result = service.replace_section(2, before[1]["id"], "<h2>Nyt afsnit</h2><p>Ny tekst her.</p>")
+    
+    assert result["changes"]["written"] is True
+    after = result["sections"]
+    assert after[1]["heading"] == "Nyt afsnit"
+    assert [s["id"] for s in after[:1] + after[2:]] == [s["id"] for s in before[:1] + before[2:]]
+    assert "<h2>Afsnit 1</h2>" in site.posts[2]["content"]["rendered"]
+    
+    with pytest.raises(ValueError):
+        service.replace_section(2, before[1]["id"], "<h2>For sent</h2>")
+
+
+def test_replace_section_leaves_other_markup_byte_for_byte(service):
+    service, site = service
+    content = (
+        "<!-- wp:paragraph -->\n<p>Intro\r\nmed linjeskift</p>\n<!-- /wp:paragraph -->\n\n"
+        '<!-- wp:heading {"level":2} -->\n<h2>Første</h2>\n<!-- /wp:heading -->\n\n'
+        "<!-- wp:paragraph -->\n<p>Gammel\rtekst</p>\n<!-- /wp:paragraph -->\n\n"
+        '<!-- wp:heading {"level":2} -->\n<h2>Anden</h2>\n<!-- /wp:heading -->\n<p>Slut her</p>\n'
+    )
+    site.posts[3]["content"] = {"raw": content, "rendered": render_blocks(content)}
+    sections = service.get_outline(3)["sections"]
+    old = service.get_section(3, sections[1]["id"])["html"]
+    new = '<!-- wp:heading {"level":2} -->\n<h2>Første</h2>\n<!-- /wp:heading -->\n<p>Ny tekst</p>'
+    
+    service.replace_section(3, sections[1]["id"], new)
+    saved = site.posts[3]["content"]["raw"]
+    start = content.index(old)
+    assert saved == content[:start] + new + content[start + len(old):]
+    assert old.startswith("<!-- wp:heading") and old.endswith("<!-- /wp:paragraph -->")
+    assert saved.count("<!-- wp:") == 3 and "<!-- wp:" not in site.posts[3]["content"]["rendered"]
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Tests for _fields projection and _embed control.
+"""
+
+from benchmarks.fake_wordpress import FakeWordPress
+from src.api.wordpress_client import projection_params
+from src.services.post_service import LIST_FIELDS, PostService
+
+
+def test_projection_params():
+    assert projection_params() == {}
+    assert projection_params(["id", "title"]) == {"_fields": "id,title"}
+    assert projection_params(["id"], embed=["author"]) == {
+        "_embed": "author",
+        "_fields": "id,_links,_embedded",
+    }
+    assert projection_params(embed=True) == {"_embed": "1"}
+
+
+def test_list_posts_requests_only_listed_fields(wordpress_client):
+    with FakeWordPress(posts=20) as site:
+        client = wordpress_client(site)
+        seen = []
+        client.session.hooks["response"].append(lambda r, *args, **kwargs: seen.append(r.json()))
+        service = PostService(wp_client=client)
+        
+        posts = service.list_posts(per_page=5)
+        assert len(posts) == 5
+        assert set(seen[-1][0]) == set(LIST_FIELDS)
+        
+        embedded = service.list_posts(per_page=2, embed=["author"])
+        assert embedded[0]["_embedded"]["author"][0]["name"] == "Admin"
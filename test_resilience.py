@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the WordPress client resilience layer (retries, circuit breaker, AIMD).
+"""
+
+import time
+
+import pytest
+import requests
+
+from src.api import resilience
+from src.api.resilience import AIMDLimiter, CircuitBreaker, backoff_delay, parse_retry_after
+from src.api.wordpress_client import CircuitOpenError, WordPressAPIError, WordPressClient
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+    
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload if payload is not None else {}
+        self.headers = headers or {}
+    
+    def json(self):
+        return self._payload
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+
+class FakeSession:
+    """Session returning a scripted sequence of responses."""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+    
+    def request(self, method, url, **kwargs):
+        self.calls.append(method)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(resilience, "_breakers", {})
+    monkeypatch.setattr(resilience, "_limiters", {})
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    return WordPressClient()
+
+
+def test_backoff_delay_is_bounded():
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= 4
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    http_date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+    assert 50 < parse_retry_after(http_date) <= 60
+
+
+def test_circuit_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    
+    time.sleep(0.06)
+    assert breaker.allow_request()        # half-open probe
+    assert not breaker.allow_request()    # only one probe at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_aimd_limiter_decreases_on_failure_and_recovers():
+    limiter = AIMDLimiter(min_limit=1, max_limit=8, latency_target=1.0, cooldown=0)
+    with limiter.slot() as slot:
+        slot.failed = True
+    assert limiter.limit == 4
+    with limiter.slot():
+        pass
+    assert limiter.limit == 4  # additive increase is fractional per request
+    for _ in range(50):
+        with limiter.slot():
+            pass
+    assert limiter.limit == 8
+
+
+def test_get_retries_transient_errors(client):
+    client.session = FakeSession([
+        FakeResponse(503),
+        FakeResponse(429, headers={"Retry-After": "1"}),
+        FakeResponse(200, {"id": 1}),
+    ])
+    assert client.get_post(1) == {"id": 1}
+    assert client.session.calls == ["GET", "GET", "GET"]
+
+
+def test_post_is_not_retried(client):
+    client.session = FakeSession([FakeResponse(502), FakeResponse(200, {"id": 1})])
+    with pytest.raises(WordPressAPIError) as excinfo:
+        client.update_post(1, {"title": "x"})
+    assert excinfo.value.status_code == 502
+    assert client.session.calls == ["POST"]
+
+
+def test_delete_is_not_retried(client):
+    client.session = FakeSession([requests.exceptions.ReadTimeout(), FakeResponse(410)])
+    with pytest.raises(WordPressAPIError):
+        client.delete_post(1)
+    assert client.session.calls == ["DELETE"]
+
+
+def test_circuit_opens_after_repeated_failures(client):
+    client.session = FakeSession([requests.exceptions.ConnectTimeout()] * 20)
+    with pytest.raises(WordPressAPIError):
+        client.get_post(1)
+    with pytest.raises(CircuitOpenError):
+        client.get_post(1)
+
+
+def test_slot_timeout_is_not_a_host_failure(client):
+    client.session = FakeSession([FakeResponse(200, {"id": 1})])
+    client.timeout = 0.01
+    client.limiter._limit = 0
+    for _ in range(10):
+        with pytest.raises(WordPressAPIError, match="request slot"):
+            client.get_post(1)
+    assert client.session.calls == []
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+    
+    client.limiter._limit = 1
+    assert client.get_post(1) == {"id": 1}
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the local site mirror against the fake WordPress server.
+"""
+
+import threading
+
+import pytest
+
+from benchmarks.fake_wordpress import FakeWordPress
+from src.services.site_mirror import SiteMirror
+
+
+@pytest.fixture
+def site():
+    with FakeWordPress(posts=250) as fake:
+        yield fake
+
+
+@pytest.fixture
+def mirror(site, wordpress_client):
+    client = wordpress_client(site)
+    return SiteMirror(client, path=":memory:", tombstone_interval=3600)
+
+
+def test_bulk_load_then_delta(site, mirror):
+    stats = mirror.sync()
+    assert stats["mode"] == "full"
+    assert stats["posts"] == 250
+    assert len(mirror.get_terms("categories")) == 5
+    
+    site.handle("POST", "/wp-json/wp/v2/posts/7", {}, {"title": "Ny titel"})
+    stats = mirror.sync()
+    assert stats["mode"] == "delta"
+    # The edited post, plus the newest post re-read at the watermark boundary
+    assert stats["fetched"] == 2
+    assert mirror.get_post(7)["title"]["rendered"] == "Ny titel"
+
+
+def test_tombstones_removed(site, mirror):
+    mirror.sync()
+    site.handle("DELETE", "/wp-json/wp/v2/posts/3", {"force": "true"}, {})
+    site.handle("DELETE", "/wp-json/wp/v2/posts/4", {}, {})
+    mirror.tombstone_interval = 0
+    stats = mirror.sync()
+    assert stats["deleted"] == 2
+    assert mirror.get_post(3) is None and mirror.get_post(4) is None
+
+
+def test_list_matches_api(site, mirror):
+    mirror.sync()
+    expected = mirror.wp_client.get_posts(per_page=10, page=2, categories=[2], fields=["id"])
+    listed = mirror.list_posts(per_page=10, page=2, categories=[2])
+    assert [post["id"] for post in listed] == [post["id"] for post in expected]
+
+
+def test_search_ranked_and_incremental(site, mirror):
+    mirror.sync()
+    site.handle("POST", "/wp-json/wp/v2/posts/9", {}, {"title": "Guide til linkbuilding"})
+    site.handle("POST", "/wp-json/wp/v2/posts/10", {}, {"content": "<p>Lidt om <b>linkbuilding</b> her.</p>"})
+    mirror.sync()
+    
+    hits = mirror.search("linkbuild")
+    assert [hit["id"] for hit in hits] == [9, 10]
+    assert "<mark>linkbuilding</mark>" in mirror.search("linkbuilding", columns=["content"])[0]["snippet"]
+    assert [hit["id"] for hit in mirror.search("linkbuilding", columns=["title"])] == [9]
+    
+    mirror.delete_post(9)
+    assert [hit["id"] for hit in mirror.search("linkbuilding")] == [10]
+
+
+def test_search_pagination(mirror):
+    mirror.sync()
+    first = mirror.search("marketing", per_page=5, page=1)
+    second = mirror.search("marketing", per_page=5, page=2)
+    assert len(first) == len(second) == 5
+    assert not {hit["id"] for hit in first} & {hit["id"] for hit in second}
+
+
+def test_close_releases_connection(mirror):
+    mirror.close()
+    with pytest.raises(Exception):
+        mirror.count()
+
+
+def test_close_waits_for_background_load(mirror, monkeypatch, caplog):
+    loading = threading.Event()
+    release = threading.Event()
+    bulk_load = mirror._bulk_load
+    
+    def slow_bulk_load():
+        loading.set()
+        release.wait(5)
+        return bulk_load()
+    
+    monkeypatch.setattr(mirror, "_bulk_load", slow_bulk_load)
+    mirror.start_background_load()
+    assert loading.wait(5)
+    loader = mirror._loader
+    mirror.close()
+    release.set()
+    loader.join(5)
+    
+    assert "bulk load failed" not in caplog.text
+    with pytest.raises(Exception):
+        mirror.count()
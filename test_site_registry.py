@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the multi-site registry.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fake_wordpress import FakeWordPress
+from src.config.settings import settings
+from src.config.sites import SiteConfig, load_sites
+from src.services import site_registry
+from src.services.site_registry import SiteRegistry
+
+
+def make_sites(*urls):
+    return {
+        f"site{n}": SiteConfig(f"site{n}", url, "user", "password")
+        for n, url in enumerate(urls, start=1)
+    }
+
+
+def test_load_sites_from_file(tmp_path, monkeypatch):
+    path = tmp_path / "sites.json"
+    path.write_text(json.dumps({
+        "kunde-a": {"url": "https://a.example", "username": "api", "app_password_env": "KUNDE_A_PASSWORD"},
+        "kunde-b": {"url": "https://b.example/", "username": "api", "app_password": "secret"},
+    }))
+    monkeypatch.setenv("KUNDE_A_PASSWORD", "from-env")
+    monkeypatch.setattr(settings, "SITES_FILE", str(path))
+    monkeypatch.setattr(settings, "WORDPRESS_URL", "https://default.example")
+    monkeypatch.setattr(settings, "WORDPRESS_USERNAME", "api")
+    monkeypatch.setattr(settings, "WORDPRESS_APP_PASSWORD", "password")
+    
+    sites = load_sites()
+    assert sorted(sites) == ["default", "kunde-a", "kunde-b"]
+    assert sites["kunde-a"].app_password == "from-env"
+    assert sites["kunde-b"].api_url == "https://b.example/wp-json/wp/v2"
+    
+    monkeypatch.delenv("KUNDE_A_PASSWORD")
+    with pytest.raises(ValueError, match="KUNDE_A_PASSWORD"):
+        load_sites()
+
+
+def test_resolve_and_lru_eviction(monkeypatch):
+    closed = []
+    monkeypatch.setattr(site_registry.WordPressClient, "close", lambda self: closed.append(self.base_url))
+    registry = SiteRegistry(make_sites("http://a", "http://b", "http://c"), default_site="site2", max_active=2)
+    assert registry.resolve().name == "site2"
+    with pytest.raises(ValueError, match="Unknown site"):
+        registry.resolve("missing")
+    
+    first = registry.post_service("site1")
+    assert registry.post_service("site1") is first
+    assert first.wp_client.base_url == "http://a/wp-json/wp/v2"
+    second = registry.post_service("site2")
+    registry.post_service("site1")
+    registry.post_service("site3")
+    
+    stats = registry.stats()
+    assert stats["active"] == ["site1", "site3"]
+    assert (stats["created"], stats["evicted"]) == (3, 1)
+    # The dropped site is closed once its last user lets go of it
+    assert closed == []
+    del second
+    assert closed == ["http://b/wp-json/wp/v2"]
+    
+    no_default = SiteRegistry(make_sites("http://a", "http://b"))
+    with pytest.raises(ValueError, match="Specify site"):
+        no_default.resolve()
+    assert SiteRegistry(make_sites("http://a")).resolve().name == "site1"
+
+
+def test_tools_take_a_site(monkeypatch):
+    from fastmcp import Client
+    
+    import mcp_server
+    
+    with FakeWordPress(posts=3) as small, FakeWordPress(posts=8) as large:
+        registry = SiteRegistry(make_sites(small.url, large.url), default_site="site1")
+        monkeypatch.setattr(site_registry, "_registry", registry)
+        
+        async def calls():
+            async with Client(mcp_server.mcp) as client:
+                listed = (await client.call_tool("list_sites", {})).data
+                post = (await client.call_tool("get_post", {"post_id": 8, "site": "site2"})).data
+                with pytest.raises(Exception):
+                    await client.call_tool("get_post", {"post_id": 8})
+                with pytest.raises(Exception, match="Unknown site"):
+                    await client.call_tool("get_post", {"post_id": 1, "site": "nope"})
+                return listed, post
+        
+        listed, post = asyncio.run(calls())
+        assert listed["sites"] == ["site1", "site2"] and listed["default_site"] == "site1"
+        assert post["id"] == 8
+        assert large.request_count >= 1
+
+
+def test_bulk_tools_resolve_terms_on_their_site(monkeypatch):
+    from fastmcp import Client
+    
+    import mcp_server
+    
+    with FakeWordPress(posts=3, categories=2) as first, FakeWordPress(posts=3, categories=5) as second:
+        registry = SiteRegistry(make_sites(first.url, second.url), default_site="site1")
+        monkeypatch.setattr(site_registry, "_registry", registry)
+        
+        async def calls():
+            async with Client(mcp_server.mcp) as client:
+                created = await client.call_tool("bulk_create_posts", {
+                    "posts": json.dumps([{"title": "Ny", "content": "<p>x</p>", "categories": ["Category 4", "Nyhed"]}]),
+                    "site": "site2"
+                })
+                updated = await client.call_tool("bulk_update_posts", {
+                    "updates": json.dumps([{"id": 1, "tags": ["Nyt tag"]}]),
+                    "site": "site2"
+                })
+                return created.data, updated.data
+        
+        created, updated = asyncio.run(calls())
+        assert created["succeeded"] == 1 and updated["succeeded"] == 1
+        post = second.posts[created["results"][0]["id"]]
+        assert post["categories"] == [4, 6]
+        assert second.terms["categories"][6]["name"] == "Nyhed"
+        assert second.posts[1]["tags"] == [11]
+        assert len(first.terms["categories"]) == 2 and len(first.terms["tags"]) == 10
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy client construction at startup.
+"""
+
+import socket
+
+from src.api.wordpress_client import get_wordpress_client
+from src.services.content_generator import AsyncContentGenerator
+from src.services.post_service import PostService
+
+
+def test_services_share_one_wordpress_client():
+    client = get_wordpress_client()
+    assert get_wordpress_client() is client
+    assert PostService().wp_client is client
+
+
+def test_openai_client_created_on_first_use():
+    generator = AsyncContentGenerator()
+    assert generator._client is None
+    client = generator.client
+    assert generator.client is client
+    generator.client = "replacement"
+    assert generator.client == "replacement"
+
+
+def test_wait_for_port():
+    import mcp_server
+    
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        assert mcp_server.wait_for_port(port, timeout=1)
+    assert not mcp_server.wait_for_port(port, timeout=0.2)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the taxonomy index and batch term creation.
+"""
+
+import pytest
+
+from benchmarks.fake_wordpress import FakeWordPress
+from src.services.taxonomy_index import TaxonomyIndex
+
+
+@pytest.mark.parametrize("batch_enabled", [True, False])
+def test_resolve_ids_slugs_names_and_create_missing(wordpress_client, batch_enabled):
+    with FakeWordPress(posts=1, categories=3, batch_enabled=batch_enabled) as site:
+        index = TaxonomyIndex(wordpress_client(site), refresh_interval=300)
+        site.terms["categories"][2]["name"] = "SEO &amp; Marketing"
+        
+        assert index.resolve("categories", ["1", "category-3"]) == [1, 3]
+        requests_before = site.request_count
+        assert index.resolve("categories", ["seo & marketing", 1]) == [2, 1]
+        assert site.request_count == requests_before
+        
+        ids = index.resolve("categories", ["Nyheder", "Guides", "nyheder", "Category 1"])
+        assert ids[0] > 3 and ids[1] > 3 and ids[2] == 1
+        # One batch call, or a 404 from the batch endpoint plus one call per term
+        assert site.request_count == requests_before + (1 if batch_enabled else 3)
+        assert index.get("categories", "guides")["id"] == ids[1]
+
+
+def test_existing_term_created_elsewhere(wordpress_client):
+    with FakeWordPress(posts=1, categories=1) as site:
+        index = TaxonomyIndex(wordpress_client(site), refresh_interval=300)
+        index.terms("categories")
+        site.handle("POST", "/wp-json/wp/v2/categories", {}, {"name": "Kampagner"})
+        term_id = index.resolve("categories", ["Kampagner"])[0]
+        assert term_id == 2
+
+
+def test_unknown_without_create(wordpress_client):
+    with FakeWordPress(posts=1, categories=1) as site:
+        index = TaxonomyIndex(wordpress_client(site), refresh_interval=300)
+        with pytest.raises(ValueError):
+            index.resolve("categories", ["Findes ikke"], create_missing=False)
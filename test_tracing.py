@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for request tracing, trace export and the slow-call log.
+"""
+
+import asyncio
+import json
+import logging
+
+from openai import AsyncOpenAI
+
+from benchmarks.fake_openai import FakeOpenAI
+from benchmarks.fake_wordpress import FakeWordPress
+from src.config.settings import settings
+from src.services import llm_cache
+from src.services.async_post_service import AsyncPostService
+from src.services.content_generator import AsyncContentGenerator
+from src.services.post_service import PostService
+from src.utils import tracing
+
+
+def export_to(tmp_path, monkeypatch):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(settings, "TRACE_EXPORTER", "json")
+    monkeypatch.setattr(settings, "TRACE_FILE", str(path))
+    monkeypatch.setattr(tracing, "_exporter", None)
+    return path
+
+
+def read_spans(path):
+    tracing._get_exporter().flush()
+    traces = [json.loads(line) for line in path.read_text().splitlines()]
+    return [
+        [span for scope in trace["resourceSpans"][0]["scopeSpans"] for span in scope["spans"]]
+        for trace in traces
+    ]
+
+
+def test_improve_post_span_tree(tmp_path, monkeypatch, wordpress_client):
+    path = export_to(tmp_path, monkeypatch)
+    monkeypatch.setattr(llm_cache, "_cache", llm_cache.LLMCache(max_entries=100, ttl=60))
+    
+    with FakeWordPress(posts=3) as site, FakeOpenAI(first_token_latency=0.01, token_latency=0.0) as api:
+        client = wordpress_client(site)
+        generator = AsyncContentGenerator()
+        generator.client = AsyncOpenAI(api_key="test", base_url=api.base_url)
+        service = AsyncPostService(PostService(wp_client=client), generator)
+        
+        async def run():
+            with tracing.start_span("tool improve_post_content", tracing.KIND_SERVER):
+                await service.improve_post(2, ["grammar"], save_changes=True)
+        
+        asyncio.run(run())
+    
+    [spans] = read_spans(path)
+    by_id = {span["spanId"]: span for span in spans}
+    
+    def parent_name(name):
+        span = next(span for span in spans if span["name"] == name)
+        return by_id[span["parentSpanId"]]["name"]
+    
+    assert len({span["traceId"] for span in spans}) == 1
+    assert parent_name("AsyncPostService.improve_post") == "tool improve_post_content"
+    assert parent_name("PostService.get_post_for_edit") == "AsyncPostService.improve_post"
+    assert parent_name("WordPress GET /wp/v2/posts/{id}") == "PostService.get_post_for_edit"
+    assert parent_name("AsyncContentGenerator.improve_content") == "AsyncPostService.improve_post"
+    assert parent_name("OpenAI improve") == "AsyncContentGenerator.improve_content"
+    # The fake editor echoes the post, so the diff-aware save sends nothing
+    assert parent_name("PostService.save_post_changes") == "PostService.apply_improvement"
+    
+    openai_span = next(span for span in spans if span["name"] == "OpenAI improve")
+    attributes = {item["key"]: item["value"] for item in openai_span["attributes"]}
+    assert attributes["task"] == {"stringValue": "improve"}
+    assert int(attributes["tokens.completion"]["intValue"]) > 0
+
+
+def test_errors_and_remote_parent(tmp_path, monkeypatch):
+    path = export_to(tmp_path, monkeypatch)
+    traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    
+    try:
+        with tracing.start_span("tool failing", traceparent=traceparent):
+            with tracing.start_span("inner"):
+                assert tracing.trace_headers()["traceparent"].startswith("00-0af7651916cd43dd8448eb211c80319c-")
+                raise ValueError("boom")
+    except ValueError:
+        pass
+    
+    [spans] = read_spans(path)
+    root, inner = spans
+    assert root["traceId"] == "0af7651916cd43dd8448eb211c80319c"
+    assert root["parentSpanId"] == "b7ad6b7169203331"
+    assert inner["parentSpanId"] == root["spanId"]
+    assert inner["status"] == {"code": 2, "message": "ValueError: boom"}
+    assert tracing.parse_traceparent("00-" + "0" * 32 + "-b7ad6b7169203331-01") is None
+
+
+def test_slow_call_log(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "TRACE_EXPORTER", "none")
+    monkeypatch.setattr(settings, "TRACE_SLOW_THRESHOLD", 0.01)
+    
+    with caplog.at_level(logging.WARNING, logger="src.utils.tracing"):
+        with tracing.start_span("tool fast"):
+            pass
+        with tracing.start_span("tool slow", tool="slow"):
+            with tracing.start_span("WordPress GET /wp/v2/posts/{id}"):
+                asyncio.run(asyncio.sleep(0.02))
+    
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 1
+    lines = messages[0].splitlines()
+    assert lines[0].startswith("Slow call tool slow took")
+    assert lines[1].startswith("tool slow ") and lines[1].endswith("tool=slow")
+    assert lines[2].startswith("  WordPress GET /wp/v2/posts/{id} ")
+
+
+def test_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "TRACE_EXPORTER", "none")
+    monkeypatch.setattr(settings, "TRACE_SLOW_THRESHOLD", 0)
+    with tracing.start_span("tool off") as span:
+        assert span is None
+        assert tracing.trace_headers() == {}